@@ -2,7 +2,7 @@ use std::collections::HashMap;
 use std::time::Instant;
 
 use openentropy_core::TelemetryWindowReport;
-use openentropy_core::conditioning::{quick_min_entropy, quick_quality, quick_shannon};
+use openentropy_core::conditioning::{quick_entropy, quick_quality};
 use openentropy_core::platform::detect_available_sources;
 use serde::Serialize;
 
@@ -325,10 +325,11 @@ pub fn run(cfg: BenchCommandConfig<'_>) {
         let bytes = 65_536usize;
         let output = pool_instance.get_bytes(bytes, mode);
         let health = pool_instance.health_report();
+        let (shannon_entropy, min_entropy) = quick_entropy(&output);
         let report = PoolQualityReport {
             bytes: output.len(),
-            shannon_entropy: quick_shannon(&output),
-            min_entropy: quick_min_entropy(&output),
+            shannon_entropy,
+            min_entropy,
             healthy_sources: health.healthy,
             total_sources: health.total,
         };
@@ -518,8 +519,7 @@ fn run_single_source(
     }
 
     let data = openentropy_core::conditioning::condition(&raw_data, raw_data.len(), mode);
-    let shannon = quick_shannon(&data);
-    let min_h = quick_min_entropy(&data);
+    let (shannon, min_h) = quick_entropy(&data);
     let grade = openentropy_core::grade_min_entropy(min_h.max(0.0));
     let quality = quick_quality(&data);
 
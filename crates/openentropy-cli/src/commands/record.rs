@@ -118,6 +118,7 @@ pub fn run(
 
     // Recording loop
     let start = Instant::now();
+    let mut next_tick = start;
     let mut had_write_error = false;
 
     'outer: while running.load(Ordering::SeqCst) {
@@ -160,11 +161,19 @@ pub fn run(
         );
         let _ = std::io::Write::flush(&mut std::io::stdout());
 
-        // Wait for interval if configured
+        // Wait for the next tick of a fixed interval grid, so collection time
+        // does not stretch the sampling period. A round that overruns its
+        // slot restarts the grid rather than firing back-to-back.
         if let Some(iv) = interval_dur {
-            let deadline = Instant::now() + iv;
-            while Instant::now() < deadline && running.load(Ordering::SeqCst) {
-                std::thread::sleep(Duration::from_millis(10));
+            next_tick = (next_tick + iv).max(Instant::now());
+            while running.load(Ordering::SeqCst) {
+                let Some(remaining) = next_tick.checked_duration_since(Instant::now()) else {
+                    break;
+                };
+                if remaining.is_zero() {
+                    break;
+                }
+                std::thread::sleep(remaining.min(Duration::from_millis(10)));
             }
         }
     }
@@ -224,8 +224,10 @@ fn analyze_session(
         }
     };
 
-    // Parse index and group raw bytes by source
-    let mut source_bytes: HashMap<String, Vec<u8>> = HashMap::new();
+    // Parse the index first and total each source's length, so every
+    // per-source buffer is allocated once at its final size before copying.
+    let mut entries: Vec<(&str, usize, usize)> = Vec::new();
+    let mut totals: HashMap<&str, usize> = HashMap::new();
 
     for line in index_csv.lines().skip(1) {
         // Format: offset,length,timestamp_ns,source
@@ -241,13 +243,22 @@ fn analyze_session(
             Ok(v) => v,
             Err(_) => continue,
         };
-        let source = parts[3].to_string();
+        let source = parts[3];
 
         if offset + length <= raw_data.len() {
-            source_bytes
-                .entry(source)
-                .or_default()
-                .extend_from_slice(&raw_data[offset..offset + length]);
+            entries.push((source, offset, length));
+            *totals.entry(source).or_default() += length;
+        }
+    }
+
+    // Group raw bytes by source
+    let mut source_bytes: HashMap<String, Vec<u8>> = totals
+        .iter()
+        .map(|(&source, &total)| (source.to_string(), Vec::with_capacity(total)))
+        .collect();
+    for (source, offset, length) in entries {
+        if let Some(buf) = source_bytes.get_mut(source) {
+            buf.extend_from_slice(&raw_data[offset..offset + length]);
         }
     }
 
@@ -26,6 +26,9 @@ fn run_stdout(
     let mode = super::parse_conditioning(conditioning);
     let chunk_size = if rate > 0 { rate.min(4096) } else { 4096 };
     let mut total = 0usize;
+    // Rate limiting follows a fixed schedule from the start of the stream,
+    // so time spent collecting and writing is not added on top of each pause.
+    let start = std::time::Instant::now();
 
     let stdout = std::io::stdout();
     let mut out = stdout.lock();
@@ -63,8 +66,10 @@ fn run_stdout(
         total += data.len();
 
         if rate > 0 {
-            let sleep_dur = std::time::Duration::from_secs_f64(data.len() as f64 / rate as f64);
-            std::thread::sleep(sleep_dur);
+            let deadline = start + std::time::Duration::from_secs_f64(total as f64 / rate as f64);
+            if let Some(wait) = deadline.checked_duration_since(std::time::Instant::now()) {
+                std::thread::sleep(wait);
+            }
         }
     }
 }
@@ -185,6 +185,9 @@ pub const SAMPLE_SIZES: [usize; 4] = [16, 32, 64, 128];
 /// Maximum samples retained per source.
 const MAX_HISTORY: usize = 120;
 
+/// Maximum random-walk points retained per source.
+const MAX_WALK: usize = 8192;
+
 // ---------------------------------------------------------------------------
 // Utility functions
 // ---------------------------------------------------------------------------
@@ -304,7 +307,9 @@ struct SharedState {
     byte_freq: [u64; 256],
     /// Accumulated random walk: cumulative sum of (byte - 128) across all collections.
     /// Keyed by source name so switching sources shows different walks.
-    walk: HashMap<String, Vec<f64>>,
+    /// Each walk is a ring sized to `MAX_WALK` up front, so trimming old
+    /// points never shifts the rest.
+    walk: HashMap<String, VecDeque<f64>>,
     /// Session writer for TUI recording. Created when 'r' is pressed, dropped on stop.
     session_writer: Option<SessionWriter>,
 }
@@ -599,17 +604,20 @@ impl App {
 
                 // Extend the random walk for the active source
                 {
-                    let walk = s.walk.entry(active_name.clone()).or_default();
-                    let mut sum = walk.last().copied().unwrap_or(0.0);
+                    let walk = s
+                        .walk
+                        .entry(active_name.clone())
+                        .or_insert_with(|| VecDeque::with_capacity(MAX_WALK));
+                    let mut sum = walk.back().copied().unwrap_or(0.0);
+                    // Cap at MAX_WALK points — trim from front to keep the latest
+                    let excess = (walk.len() + cond_bytes.len()).saturating_sub(MAX_WALK);
+                    walk.drain(..excess.min(walk.len()));
                     for &b in &cond_bytes {
                         sum += b as f64 - 128.0;
-                        walk.push(sum);
-                    }
-                    // Cap at 8192 points — trim from front to keep the latest
-                    const MAX_WALK: usize = 8192;
-                    if walk.len() > MAX_WALK {
-                        let excess = walk.len() - MAX_WALK;
-                        walk.drain(..excess);
+                        if walk.len() == MAX_WALK {
+                            walk.pop_front();
+                        }
+                        walk.push_back(sum);
                     }
                 }
                 for &b in &cond_bytes {
@@ -626,7 +634,10 @@ impl App {
                     s.source_stats.insert(src.name.clone(), src.clone());
                     if src.name == active_name {
                         s.last_ms = (src.time * 1000.0) as u64;
-                        let hist = s.source_history.entry(src.name.clone()).or_default();
+                        let hist = s
+                            .source_history
+                            .entry(src.name.clone())
+                            .or_insert_with(|| VecDeque::with_capacity(MAX_HISTORY + 1));
                         hist.push_back(Sample {
                             shannon: src.entropy,
                             min_entropy: src.min_entropy,
@@ -795,7 +806,7 @@ impl App {
             walk: self
                 .active_name()
                 .and_then(|n| s.walk.get(n))
-                .cloned()
+                .map(|w| w.iter().copied().collect())
                 .unwrap_or_default(),
         }
     }
@@ -200,9 +200,15 @@ pub fn autocorrelation_profile(data: &[u8], max_lag: usize) -> AutocorrResult {
             violations: 0,
         };
     }
-    let arr: Vec<f64> = data.iter().map(|&b| b as f64).collect();
-    let mean: f64 = arr.iter().sum::<f64>() / n as f64;
-    let var: f64 = arr.iter().map(|x| (x - mean).powi(2)).sum::<f64>() / n as f64;
+    // Mean and variance from a single exact integer pass, then center the
+    // data once so each lag below is a plain dot product.
+    let (sum, sum_sq) = data.iter().fold((0u64, 0u64), |(s, sq), &b| {
+        let b = b as u64;
+        (s + b, sq + b * b)
+    });
+    let mean = sum as f64 / n as f64;
+    let var = (sum_sq as f64 / n as f64 - mean * mean).max(0.0);
+    let centered: Vec<f64> = data.iter().map(|&b| b as f64 - mean).collect();
 
     let threshold = 2.0 / (n as f64).sqrt();
     let mut lags = Vec::with_capacity(max_lag);
@@ -214,11 +220,12 @@ pub fn autocorrelation_profile(data: &[u8], max_lag: usize) -> AutocorrResult {
         let corr = if var < 1e-10 {
             0.0
         } else {
-            let mut sum = 0.0;
             let count = n - lag;
-            for i in 0..count {
-                sum += (arr[i] - mean) * (arr[i + lag] - mean);
-            }
+            let sum: f64 = centered[..count]
+                .iter()
+                .zip(&centered[lag..])
+                .map(|(a, b)| a * b)
+                .sum();
             sum / (count as f64 * var)
         };
 
@@ -289,15 +296,25 @@ pub fn spectral_analysis(data: &[u8]) -> SpectralResult {
         0.0
     };
 
-    // Find peaks.
-    let mut indexed: Vec<(usize, f64)> = power_spectrum.iter().copied().enumerate().collect();
-    indexed.sort_by(|a, b| b.1.partial_cmp(&a.1).unwrap_or(std::cmp::Ordering::Equal));
-    let peaks: Vec<SpectralBin> = indexed
+    // Find peaks: partition bin indices around the 10th-strongest (linear
+    // time), then sort only those. Ties keep the lower frequency first.
+    let by_power = |a: &usize, b: &usize| {
+        power_spectrum[*b]
+            .total_cmp(&power_spectrum[*a])
+            .then(a.cmp(b))
+    };
+    let mut order: Vec<usize> = (0..n_freq).collect();
+    let top = n_freq.min(10);
+    if top < n_freq {
+        order.select_nth_unstable_by(top, by_power);
+        order.truncate(top);
+    }
+    order.sort_unstable_by(by_power);
+    let peaks: Vec<SpectralBin> = order
         .iter()
-        .take(10)
-        .map(|&(i, p)| SpectralBin {
+        .map(|&i| SpectralBin {
             frequency: (i + 1) as f64 / n as f64,
-            power: p,
+            power: power_spectrum[i],
         })
         .collect();
 
@@ -384,49 +401,58 @@ pub fn distribution_stats(data: &[u8]) -> DistributionResult {
         };
     }
 
-    let n = data.len() as f64;
-    let arr: Vec<f64> = data.iter().map(|&b| b as f64).collect();
+    // Single pass over the data: every statistic below is derived from the
+    // 256-bin histogram, so there is no f64 copy and no sort.
+    let mut histogram = vec![0u64; 256];
+    for &b in data {
+        histogram[b as usize] += 1;
+    }
 
-    let mean = arr.iter().sum::<f64>() / n;
-    let variance = arr.iter().map(|&x| (x - mean).powi(2)).sum::<f64>() / n;
+    let n = data.len() as f64;
+    let sum: u64 = histogram
+        .iter()
+        .enumerate()
+        .map(|(v, &c)| v as u64 * c)
+        .sum();
+    let mean = sum as f64 / n;
+    let variance = histogram
+        .iter()
+        .enumerate()
+        .map(|(v, &c)| c as f64 * (v as f64 - mean).powi(2))
+        .sum::<f64>()
+        / n;
     let std_dev = variance.sqrt();
 
-    let skewness = if std_dev > 1e-10 {
-        arr.iter()
-            .map(|&x| ((x - mean) / std_dev).powi(3))
-            .sum::<f64>()
-            / n
-    } else {
-        0.0
-    };
-
-    let kurtosis = if std_dev > 1e-10 {
-        arr.iter()
-            .map(|&x| ((x - mean) / std_dev).powi(4))
-            .sum::<f64>()
-            / n
-            - 3.0 // excess kurtosis
+    let (skewness, kurtosis) = if std_dev > 1e-10 {
+        let (m3, m4) = histogram
+            .iter()
+            .enumerate()
+            .fold((0.0, 0.0), |(m3, m4), (v, &c)| {
+                let z = (v as f64 - mean) / std_dev;
+                let z3 = z * z * z;
+                (m3 + c as f64 * z3, m4 + c as f64 * z3 * z)
+            });
+        (m3 / n, m4 / n - 3.0) // excess kurtosis
     } else {
-        0.0
+        (0.0, 0.0)
     };
 
-    // Histogram
-    let mut histogram = vec![0u64; 256];
-    for &b in data {
-        histogram[b as usize] += 1;
-    }
-
-    // KS test vs uniform [0, 255]
-    let mut sorted: Vec<f64> = arr.clone();
-    sorted.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
+    // KS test vs uniform [0, 255]. In sorted order, value v occupies ranks
+    // (cum, cum + count], so the largest deviation for v is at either end of
+    // that run.
     let mut ks_stat = 0.0f64;
-    for (i, &x) in sorted.iter().enumerate() {
-        let empirical = (i + 1) as f64 / n;
-        let theoretical = (x + 0.5) / 256.0; // uniform over [0, 255]
-        let diff = (empirical - theoretical).abs();
-        if diff > ks_stat {
-            ks_stat = diff;
+    let mut cum = 0u64;
+    for (v, &count) in histogram.iter().enumerate() {
+        if count == 0 {
+            continue;
         }
+        let theoretical = (v as f64 + 0.5) / 256.0; // uniform over [0, 255]
+        let first = (cum + 1) as f64 / n;
+        cum += count;
+        let last = cum as f64 / n;
+        ks_stat = ks_stat
+            .max((first - theoretical).abs())
+            .max((last - theoretical).abs());
     }
     // Approximate p-value (Kolmogorov-Smirnov)
     let sqrt_n = n.sqrt();
@@ -466,9 +492,14 @@ pub fn stationarity_test(data: &[u8]) -> StationarityResult {
         let start = w * window_size;
         let end = start + window_size;
         let window = &data[start..end];
-        let arr: Vec<f64> = window.iter().map(|&b| b as f64).collect();
-        let mean = arr.iter().sum::<f64>() / arr.len() as f64;
-        let var = arr.iter().map(|&x| (x - mean).powi(2)).sum::<f64>() / arr.len() as f64;
+        // One pass accumulating exact integer sum and sum of squares.
+        let (sum, sum_sq) = window.iter().fold((0u64, 0u64), |(s, s2), &b| {
+            let x = b as u64;
+            (s + x, s2 + x * x)
+        });
+        let len = window.len() as f64;
+        let mean = sum as f64 / len;
+        let var = (sum_sq as f64 / len - mean * mean).max(0.0);
         window_means.push(mean);
         window_std_devs.push(var.sqrt());
     }
@@ -548,6 +579,14 @@ pub fn cross_correlation_matrix(sources_data: &[(String, Vec<u8>)]) -> CrossCorr
     let mut pairs = Vec::new();
     let mut flagged_count = 0;
 
+    // Each source's sums are computed once rather than once per pair; a pair
+    // then only needs its cross term, plus fresh sums for a source that is
+    // truncated to the shorter of the two.
+    let moments: Vec<(u64, u64)> = sources_data
+        .iter()
+        .map(|(_, data)| byte_moments(data))
+        .collect();
+
     for i in 0..sources_data.len() {
         for j in (i + 1)..sources_data.len() {
             let (ref name_a, ref data_a) = sources_data[i];
@@ -556,7 +595,24 @@ pub fn cross_correlation_matrix(sources_data: &[(String, Vec<u8>)]) -> CrossCorr
             if min_len < 100 {
                 continue;
             }
-            let corr = pearson_correlation(&data_a[..min_len], &data_b[..min_len]);
+            let prefix_moments = |k: usize, data: &[u8]| {
+                if data.len() == min_len {
+                    moments[k]
+                } else {
+                    byte_moments(&data[..min_len])
+                }
+            };
+            let sab = data_a
+                .iter()
+                .zip(data_b)
+                .map(|(&x, &y)| x as u64 * y as u64)
+                .sum();
+            let corr = correlation_from_sums(
+                min_len,
+                prefix_moments(i, data_a),
+                prefix_moments(j, data_b),
+                sab,
+            );
             let flagged = corr.abs() > 0.3;
             if flagged {
                 flagged_count += 1;
@@ -577,44 +633,51 @@ pub fn cross_correlation_matrix(sources_data: &[(String, Vec<u8>)]) -> CrossCorr
 }
 
 /// Run all per-source analysis on raw byte data.
+///
+/// The analyses are independent, so the two heavy ones (autocorrelation and
+/// the DFT) run on their own threads while the cheap ones run here; wall time
+/// is roughly that of the slowest analysis rather than the sum.
 pub fn full_analysis(source_name: &str, data: &[u8]) -> SourceAnalysis {
-    use crate::conditioning::{quick_min_entropy, quick_shannon};
-    SourceAnalysis {
-        source_name: source_name.to_string(),
-        sample_size: data.len(),
-        shannon_entropy: quick_shannon(data),
-        min_entropy: quick_min_entropy(data),
-        autocorrelation: autocorrelation_profile(data, 100),
-        spectral: spectral_analysis(data),
-        bit_bias: bit_bias(data),
-        distribution: distribution_stats(data),
-        stationarity: stationarity_test(data),
-        runs: runs_analysis(data),
-    }
+    std::thread::scope(|s| {
+        let autocorrelation = s.spawn(|| autocorrelation_profile(data, 100));
+        let spectral = s.spawn(|| spectral_analysis(data));
+        let (shannon_entropy, min_entropy) = crate::conditioning::quick_entropy(data);
+        SourceAnalysis {
+            source_name: source_name.to_string(),
+            sample_size: data.len(),
+            shannon_entropy,
+            min_entropy,
+            bit_bias: bit_bias(data),
+            distribution: distribution_stats(data),
+            stationarity: stationarity_test(data),
+            runs: runs_analysis(data),
+            autocorrelation: autocorrelation.join().unwrap(),
+            spectral: spectral.join().unwrap(),
+        }
+    })
 }
 
 // ---------------------------------------------------------------------------
 // Helpers
 // ---------------------------------------------------------------------------
 
-/// Pearson correlation coefficient between two byte slices.
-fn pearson_correlation(a: &[u8], b: &[u8]) -> f64 {
-    let n = a.len() as f64;
-    let a_f: Vec<f64> = a.iter().map(|&x| x as f64).collect();
-    let b_f: Vec<f64> = b.iter().map(|&x| x as f64).collect();
-    let mean_a = a_f.iter().sum::<f64>() / n;
-    let mean_b = b_f.iter().sum::<f64>() / n;
-
-    let mut cov = 0.0;
-    let mut var_a = 0.0;
-    let mut var_b = 0.0;
-    for i in 0..a.len() {
-        let da = a_f[i] - mean_a;
-        let db = b_f[i] - mean_b;
-        cov += da * db;
-        var_a += da * da;
-        var_b += db * db;
-    }
+/// `(Σx, Σx²)` over a byte slice.
+fn byte_moments(data: &[u8]) -> (u64, u64) {
+    data.iter().fold((0, 0), |(s, ss), &x| {
+        let x = x as u64;
+        (s + x, ss + x * x)
+    })
+}
+
+/// Pearson correlation from `n` and the running sums `(Σa, Σa²)`,
+/// `(Σb, Σb²)` and `Σab`.
+fn correlation_from_sums(n: usize, (sa, saa): (u64, u64), (sb, sbb): (u64, u64), sab: u64) -> f64 {
+    // n·Σxy − Σx·Σy etc. are exact in i128; only the final ratio is f64.
+    let n = n as i128;
+    let (sa, sb) = (sa as i128, sb as i128);
+    let cov = (n * sab as i128 - sa * sb) as f64;
+    let var_a = (n * saa as i128 - sa * sa) as f64;
+    let var_b = (n * sbb as i128 - sb * sb) as f64;
 
     let denom = (var_a * var_b).sqrt();
     if denom < 1e-10 { 0.0 } else { cov / denom }
@@ -718,6 +781,32 @@ mod tests {
         assert!(result.max_abs_correlation > 0.5);
     }
 
+    #[test]
+    fn test_autocorrelation_matches_two_pass_reference() {
+        let data = random_data(2000);
+        let n = data.len() as f64;
+        let arr: Vec<f64> = data.iter().map(|&b| b as f64).collect();
+        let mean = arr.iter().sum::<f64>() / n;
+        let var = arr.iter().map(|x| (x - mean).powi(2)).sum::<f64>() / n;
+
+        let result = autocorrelation_profile(&data, 20);
+        for lc in &result.lags {
+            let count = data.len() - lc.lag;
+            let cov: f64 = (0..count)
+                .map(|i| (arr[i] - mean) * (arr[i + lc.lag] - mean))
+                .sum();
+            let expected = cov / (count as f64 * var);
+            assert!((lc.correlation - expected).abs() < 1e-9);
+        }
+    }
+
+    #[test]
+    fn test_autocorrelation_constant() {
+        let result = autocorrelation_profile(&[42u8; 500], 10);
+        assert!(result.lags.iter().all(|lc| lc.correlation == 0.0));
+        assert_eq!(result.violations, 0);
+    }
+
     #[test]
     fn test_spectral_analysis() {
         let data = random_data(1024);
@@ -726,6 +815,16 @@ mod tests {
         assert!(!result.peaks.is_empty());
     }
 
+    #[test]
+    fn test_spectral_peaks_sorted_by_power() {
+        // Period-8 square wave: the strongest bin is the fundamental.
+        let data: Vec<u8> = (0..512).map(|i| if i % 8 < 4 { 255 } else { 0 }).collect();
+        let result = spectral_analysis(&data);
+        assert_eq!(result.peaks.len(), 10);
+        assert!(result.peaks.windows(2).all(|w| w[0].power >= w[1].power));
+        assert!((result.dominant_frequency - 1.0 / 8.0).abs() < 1e-9);
+    }
+
     #[test]
     fn test_bit_bias_random() {
         let data = random_data(10000);
@@ -779,6 +878,55 @@ mod tests {
         assert!(result.pairs[0].correlation.abs() < 0.3);
     }
 
+    #[test]
+    fn test_cross_correlation_matches_pairwise() {
+        let a = random_data_seeded(1000, 1);
+        let b: Vec<u8> = a[..700].iter().map(|&x| x ^ 0x0f).collect();
+        let c = random_data_seeded(1200, 2);
+        let sources = [
+            ("a".to_string(), a),
+            ("b".to_string(), b),
+            ("c".to_string(), c),
+        ];
+        let result = cross_correlation_matrix(&sources);
+        assert_eq!(result.pairs.len(), 3);
+        for pair in &result.pairs {
+            let data = |name: &str| &sources.iter().find(|(n, _)| n == name).unwrap().1;
+            let (x, y) = (data(&pair.source_a), data(&pair.source_b));
+            let n = x.len().min(y.len());
+            assert!((pair.correlation - pearson_correlation(&x[..n], &y[..n])).abs() < 1e-12);
+        }
+    }
+
+    /// Two-pass f64 Pearson correlation over the common prefix, as a reference.
+    fn pearson_correlation(a: &[u8], b: &[u8]) -> f64 {
+        let n = a.len().min(b.len());
+        let mean = |d: &[u8]| d[..n].iter().map(|&x| x as f64).sum::<f64>() / n as f64;
+        let (ma, mb) = (mean(a), mean(b));
+        let (mut cov, mut va, mut vb) = (0.0, 0.0, 0.0);
+        for (&x, &y) in a.iter().zip(b) {
+            let (dx, dy) = (x as f64 - ma, y as f64 - mb);
+            cov += dx * dy;
+            va += dx * dx;
+            vb += dy * dy;
+        }
+        let denom = (va * vb).sqrt();
+        if denom < 1e-10 { 0.0 } else { cov / denom }
+    }
+
+    #[test]
+    fn test_pearson_correlation_extremes() {
+        let a: Vec<u8> = (0..=255).collect();
+        let inverted: Vec<u8> = a.iter().map(|&x| 255 - x).collect();
+        let corr = |b: &[u8]| {
+            let sab = a.iter().zip(b).map(|(&x, &y)| x as u64 * y as u64).sum();
+            correlation_from_sums(a.len(), byte_moments(&a), byte_moments(b), sab)
+        };
+        assert!((corr(&a) - 1.0).abs() < 1e-12);
+        assert!((corr(&inverted) + 1.0).abs() < 1e-12);
+        assert_eq!(corr(&[7u8; 256]), 0.0);
+    }
+
     #[test]
     fn test_full_analysis() {
         let data = random_data(1000);
@@ -25,6 +25,9 @@
 
 use sha2::{Digest, Sha256};
 use std::collections::HashMap;
+use std::sync::OnceLock;
+
+use crate::sources::helpers::mach_time;
 
 /// Conditioning mode for entropy output.
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Default)]
@@ -63,11 +66,7 @@ impl std::fmt::Display for ConditioningMode {
 /// - `Sha256`: chained SHA-256 hashing to produce exactly `n_output` bytes
 pub fn condition(raw: &[u8], n_output: usize, mode: ConditioningMode) -> Vec<u8> {
     match mode {
-        ConditioningMode::Raw => {
-            let mut out = raw.to_vec();
-            out.truncate(n_output);
-            out
-        }
+        ConditioningMode::Raw => raw[..n_output.min(raw.len())].to_vec(),
         ConditioningMode::VonNeumann => {
             let debiased = von_neumann_debias(raw);
             let mut out = debiased;
@@ -91,29 +90,49 @@ pub fn sha256_condition_bytes(raw: &[u8], n_output: usize) -> Vec<u8> {
     if raw.is_empty() {
         return Vec::new();
     }
-    let mut output = Vec::with_capacity(n_output);
+    // Digests are written straight into an exact-size output, so a length
+    // that is not a multiple of 32 never overshoots (and reallocates) the
+    // buffer only to be truncated.
+    let mut output = vec![0u8; n_output];
     let mut state = [0u8; 32];
     let mut offset = 0;
-    let mut counter: u64 = 0;
-    while output.len() < n_output {
+    // One hasher for every block; `finalize_reset` leaves it ready for reuse.
+    let mut h = Sha256::new();
+    for (counter, block) in (0u64..).zip(output.chunks_mut(32)) {
         let end = (offset + 64).min(raw.len());
         let chunk = &raw[offset..end];
-        let mut h = Sha256::new();
         h.update(state);
         h.update(chunk);
         h.update(counter.to_le_bytes());
-        state = h.finalize().into();
-        output.extend_from_slice(&state);
+        state = h.finalize_reset().into();
+        block.copy_from_slice(&state[..block.len()]);
         offset += 64;
-        counter += 1;
         if offset >= raw.len() {
             offset = 0;
         }
     }
-    output.truncate(n_output);
     output
 }
 
+/// Mix the current time into `h`.
+///
+/// The raw monotonic counter is cheap and its low bits carry the jitter. On
+/// macOS it counts from boot; elsewhere [`mach_time`] counts from a
+/// process-local epoch and starts near zero on every run, so the wall clock's
+/// 128-bit nanosecond count is mixed in as well to keep the input distinct
+/// across restarts.
+pub(crate) fn update_with_clock(h: &mut Sha256) {
+    h.update(mach_time().to_le_bytes());
+
+    #[cfg(not(target_os = "macos"))]
+    {
+        let ts = std::time::SystemTime::now()
+            .duration_since(std::time::UNIX_EPOCH)
+            .unwrap_or_default();
+        h.update(ts.as_nanos().to_le_bytes());
+    }
+}
+
 /// SHA-256 condition with explicit state, sample, counter, and extra data.
 /// Returns (new_state, 32-byte digest).
 pub fn sha256_condition(
@@ -127,10 +146,7 @@ pub fn sha256_condition(
     h.update(sample);
     h.update(counter.to_le_bytes());
 
-    let ts = std::time::SystemTime::now()
-        .duration_since(std::time::UNIX_EPOCH)
-        .unwrap_or_default();
-    h.update(ts.as_nanos().to_le_bytes());
+    update_with_clock(&mut h);
 
     h.update(extra);
 
@@ -147,27 +163,49 @@ pub fn sha256_condition(
 /// Takes pairs of bits: (0,1) → 0, (1,0) → 1, same → discard.
 /// Expected yield: ~25% of input bits (for unbiased input).
 pub fn von_neumann_debias(data: &[u8]) -> Vec<u8> {
-    let mut bits = Vec::new();
-    for byte in data {
-        for i in (0..8).step_by(2) {
+    // At most 4 output bits per input byte.
+    let mut result = Vec::with_capacity(data.len() / 2);
+    // Pending output bits, right-aligned; never holds more than 11 bits.
+    let mut acc: u16 = 0;
+    let mut acc_bits: u32 = 0;
+
+    for &byte in data {
+        let (bits, count) = VON_NEUMANN_TABLE[byte as usize];
+        acc = (acc << count) | bits as u16;
+        acc_bits += count as u32;
+        if acc_bits >= 8 {
+            acc_bits -= 8;
+            result.push((acc >> acc_bits) as u8);
+            acc &= (1 << acc_bits) - 1;
+        }
+    }
+    result
+}
+
+/// Von Neumann output for every possible input byte: `(bits, count)` where the
+/// `count` (0..=4) emitted bits are right-aligned in `bits`, MSB-first.
+const VON_NEUMANN_TABLE: [(u8, u8); 256] = build_von_neumann_table();
+
+const fn build_von_neumann_table() -> [(u8, u8); 256] {
+    let mut table = [(0u8, 0u8); 256];
+    let mut byte = 0;
+    while byte < 256 {
+        let mut bits = 0u8;
+        let mut count = 0u8;
+        let mut i = 0;
+        while i < 8 {
             let b1 = (byte >> (7 - i)) & 1;
             let b2 = (byte >> (6 - i)) & 1;
             if b1 != b2 {
-                bits.push(b1);
+                bits = (bits << 1) | b1 as u8;
+                count += 1;
             }
+            i += 2;
         }
+        table[byte] = (bits, count);
+        byte += 1;
     }
-
-    // Pack bits back into bytes
-    let mut result = Vec::with_capacity(bits.len() / 8);
-    for chunk in bits.chunks_exact(8) {
-        let mut byte = 0u8;
-        for (i, &bit) in chunk.iter().enumerate() {
-            byte |= bit << (7 - i);
-        }
-        result.push(byte);
-    }
-    result
+    table
 }
 
 // ---------------------------------------------------------------------------
@@ -187,6 +225,68 @@ pub fn xor_fold(data: &[u8]) -> Vec<u8> {
 // Quick analysis utilities
 // ---------------------------------------------------------------------------
 
+/// Count occurrences of each byte value in a single pass.
+///
+/// Bytes are spread across four interleaved tables so that runs of equal
+/// bytes do not serialize on the same counter, then summed into one table.
+fn byte_histogram(data: &[u8]) -> [u64; 256] {
+    let mut tables = [[0u64; 256]; 4];
+    let mut chunks = data.chunks_exact(4);
+    for c in &mut chunks {
+        tables[0][c[0] as usize] += 1;
+        tables[1][c[1] as usize] += 1;
+        tables[2][c[2] as usize] += 1;
+        tables[3][c[3] as usize] += 1;
+    }
+    for &b in chunks.remainder() {
+        tables[0][b as usize] += 1;
+    }
+    let mut counts = tables[0];
+    for table in &tables[1..] {
+        for (total, &c) in counts.iter_mut().zip(table) {
+            *total += c;
+        }
+    }
+    counts
+}
+
+/// Counts below this bound read `c·log2(c)` from a precomputed table.
+const COUNT_LOG2_TABLE_LEN: usize = 4096;
+
+/// `c·log2(c)` for a bin count `c` (0 for an empty bin).
+fn count_log2(c: u64) -> f64 {
+    static TABLE: OnceLock<Box<[f64]>> = OnceLock::new();
+    let table = TABLE.get_or_init(|| {
+        (0..COUNT_LOG2_TABLE_LEN)
+            .map(|c| {
+                if c == 0 {
+                    0.0
+                } else {
+                    c as f64 * (c as f64).log2()
+                }
+            })
+            .collect()
+    });
+    match table.get(c as usize) {
+        Some(&v) => v,
+        None => c as f64 * (c as f64).log2(),
+    }
+}
+
+/// Shannon entropy in bits/byte from a byte histogram over `n` samples.
+///
+/// Uses `H = log2(n) - (1/n)·Σ c·log2(c)`, which needs no per-bin division
+/// or logarithm of a probability: every term comes from [`count_log2`].
+/// Both `n·log2(n)` and the bin terms go through the same function, so a
+/// single-valued histogram cancels to exactly zero.
+fn shannon_from_counts(counts: &[u64; 256], n: usize) -> f64 {
+    if n == 0 {
+        return 0.0;
+    }
+    let sum: f64 = counts.iter().map(|&c| count_log2(c)).sum();
+    ((count_log2(n as u64) - sum) / n as f64).max(0.0)
+}
+
 // ---------------------------------------------------------------------------
 // Min-entropy estimators
 //
@@ -205,10 +305,7 @@ pub fn min_entropy(data: &[u8]) -> f64 {
     if data.is_empty() {
         return 0.0;
     }
-    let mut counts = [0u64; 256];
-    for &b in data {
-        counts[b as usize] += 1;
-    }
+    let counts = byte_histogram(data);
     let n = data.len() as f64;
     let p_max = counts.iter().map(|&c| c as f64 / n).fold(0.0f64, f64::max);
     if p_max <= 0.0 {
@@ -224,11 +321,12 @@ pub fn mcv_estimate(data: &[u8]) -> (f64, f64) {
     if data.is_empty() {
         return (0.0, 1.0);
     }
-    let mut counts = [0u64; 256];
-    for &b in data {
-        counts[b as usize] += 1;
-    }
-    let n = data.len() as f64;
+    mcv_from_counts(&byte_histogram(data), data.len())
+}
+
+/// MCV estimate from a byte histogram over `n > 0` samples.
+fn mcv_from_counts(counts: &[u64; 256], n: usize) -> (f64, f64) {
+    let n = n as f64;
     let max_count = *counts.iter().max().unwrap() as f64;
     let p_hat = max_count / n;
 
@@ -624,19 +722,22 @@ pub fn quick_shannon(data: &[u8]) -> f64 {
     if data.is_empty() {
         return 0.0;
     }
-    let mut counts = [0u64; 256];
-    for &b in data {
-        counts[b as usize] += 1;
-    }
-    let n = data.len() as f64;
-    let mut h = 0.0;
-    for &c in &counts {
-        if c > 0 {
-            let p = c as f64 / n;
-            h -= p * p.log2();
-        }
+    shannon_from_counts(&byte_histogram(data), data.len())
+}
+
+/// Quick Shannon and MCV min-entropy estimates, as `(shannon, min_entropy)`.
+///
+/// Equivalent to calling [`quick_shannon`] and [`quick_min_entropy`], but
+/// both are derived from a single histogram pass over `data`.
+pub fn quick_entropy(data: &[u8]) -> (f64, f64) {
+    if data.is_empty() {
+        return (0.0, 0.0);
     }
-    h
+    let counts = byte_histogram(data);
+    (
+        shannon_from_counts(&counts, data.len()),
+        mcv_from_counts(&counts, data.len()).0,
+    )
 }
 
 /// Grade a source based on its min-entropy (H∞) value.
@@ -679,7 +780,9 @@ pub fn quick_quality(data: &[u8]) -> QualityReport {
         };
     }
 
-    let shannon = quick_shannon(data);
+    // One histogram feeds both the Shannon estimate and the unique count.
+    let counts = byte_histogram(data);
+    let shannon = shannon_from_counts(&counts, data.len());
 
     // Compression ratio
     use flate2::Compression;
@@ -691,11 +794,7 @@ pub fn quick_quality(data: &[u8]) -> QualityReport {
     let comp_ratio = compressed.len() as f64 / data.len() as f64;
 
     // Unique values
-    let mut seen = [false; 256];
-    for &b in data {
-        seen[b as usize] = true;
-    }
-    let unique = seen.iter().filter(|&&s| s).count();
+    let unique = counts.iter().filter(|&&c| c > 0).count();
 
     let eff = shannon / 8.0;
     let score = eff * 60.0 + comp_ratio.min(1.0) * 20.0 + (unique as f64 / 256.0).min(1.0) * 20.0;
@@ -790,6 +889,23 @@ mod tests {
         assert_ne!(out1, out2);
     }
 
+    #[test]
+    fn test_sha256_partial_block_is_prefix() {
+        let data: Vec<u8> = (0..100).collect();
+        let full = sha256_condition_bytes(&data, 64);
+        let partial = sha256_condition_bytes(&data, 40);
+        assert_eq!(partial.len(), 40);
+        assert_eq!(partial, full[..40]);
+
+        // First block: SHA-256(zero state || first 64-byte chunk || counter 0).
+        let mut h = Sha256::new();
+        h.update([0u8; 32]);
+        h.update(&data[..64]);
+        h.update(0u64.to_le_bytes());
+        let first: [u8; 32] = h.finalize().into();
+        assert_eq!(full[..32], first);
+    }
+
     #[test]
     fn test_sha256_empty_input() {
         let out = sha256_condition_bytes(&[], 32);
@@ -826,6 +942,32 @@ mod tests {
         assert_eq!(output[0], 0b00000000);
     }
 
+    #[test]
+    fn test_von_neumann_matches_bitwise_reference() {
+        fn reference(data: &[u8]) -> Vec<u8> {
+            let mut bits = Vec::new();
+            for byte in data {
+                for i in (0..8).step_by(2) {
+                    let b1 = (byte >> (7 - i)) & 1;
+                    let b2 = (byte >> (6 - i)) & 1;
+                    if b1 != b2 {
+                        bits.push(b1);
+                    }
+                }
+            }
+            bits.chunks_exact(8)
+                .map(|c| c.iter().fold(0u8, |acc, &b| (acc << 1) | b))
+                .collect()
+        }
+
+        let data: Vec<u8> = (0..4096u32)
+            .map(|i| (i.wrapping_mul(2654435761) >> 13) as u8)
+            .collect();
+        for len in [0, 1, 2, 3, 7, 64, 1000, data.len()] {
+            assert_eq!(von_neumann_debias(&data[..len]), reference(&data[..len]));
+        }
+    }
+
     #[test]
     fn test_von_neumann_all_same_discards() {
         // Input: all 0xFF = pairs (1,1)(1,1)... -> all discarded
@@ -936,6 +1078,25 @@ mod tests {
         assert!((h - 8.0).abs() < 0.01, "Expected ~8.0, got {h}");
     }
 
+    #[test]
+    fn test_shannon_from_counts_matches_probability_form() {
+        // Spans both table lookups and the direct path for large counts.
+        let mut data: Vec<u8> = (0..20_000u32).map(|i| (i * i % 251) as u8).collect();
+        data.extend(std::iter::repeat_n(7u8, 6000));
+        let counts = byte_histogram(&data);
+        let n = data.len() as f64;
+        let expected: f64 = counts
+            .iter()
+            .filter(|&&c| c > 0)
+            .map(|&c| {
+                let p = c as f64 / n;
+                -p * p.log2()
+            })
+            .sum();
+        let h = shannon_from_counts(&counts, data.len());
+        assert!((h - expected).abs() < 1e-9, "{h} vs {expected}");
+    }
+
     #[test]
     fn test_shannon_uniform_large() {
         // Large uniform sample — each value appears ~40 times
@@ -949,6 +1110,17 @@ mod tests {
         assert!((h - 8.0).abs() < 0.01, "Expected ~8.0, got {h}");
     }
 
+    #[test]
+    fn test_byte_histogram_counts_remainder() {
+        // Length not a multiple of four exercises the remainder path.
+        let data: Vec<u8> = (0..1027u32).map(|i| (i * 7 % 13) as u8).collect();
+        let mut expected = [0u64; 256];
+        for &b in &data {
+            expected[b as usize] += 1;
+        }
+        assert_eq!(byte_histogram(&data), expected);
+    }
+
     // -----------------------------------------------------------------------
     // Min-entropy estimator tests
     // -----------------------------------------------------------------------
@@ -1269,6 +1441,16 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_quick_entropy_matches_separate_estimates() {
+        let data: Vec<u8> = (0..1000u32).map(|i| (i * i % 97) as u8).collect();
+        assert_eq!(
+            quick_entropy(&data),
+            (quick_shannon(&data), quick_min_entropy(&data))
+        );
+        assert_eq!(quick_entropy(&[]), (0.0, 0.0));
+    }
+
     // -----------------------------------------------------------------------
     // Quality report tests
     // -----------------------------------------------------------------------
@@ -52,7 +52,7 @@ pub mod telemetry;
 
 pub use conditioning::{
     ConditioningMode, MinEntropyReport, QualityReport, condition, grade_min_entropy,
-    min_entropy_estimate, quick_min_entropy, quick_quality, quick_shannon,
+    min_entropy_estimate, quick_entropy, quick_min_entropy, quick_quality, quick_shannon,
 };
 pub use platform::{detect_available_sources, platform_info};
 pub use pool::{EntropyPool, HealthReport, SourceHealth, SourceInfoSnapshot};
@@ -1,13 +1,41 @@
 //! Platform detection and source discovery.
 
+use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
+
 use crate::source::EntropySource;
 use crate::sources::all_sources;
 
+/// Upper bound on threads used to probe source availability.
+const MAX_PROBE_THREADS: usize = 16;
+
 /// Discover all entropy sources available on this machine.
+///
+/// Availability probes are independent and many of them wait on helper
+/// processes or hardware, so they run on a small thread pool. The returned
+/// sources keep the order of [`all_sources`].
 pub fn detect_available_sources() -> Vec<Box<dyn EntropySource>> {
-    all_sources()
+    let sources = all_sources();
+    let available: Vec<AtomicBool> = sources.iter().map(|_| AtomicBool::new(false)).collect();
+    let next = AtomicUsize::new(0);
+
+    std::thread::scope(|s| {
+        for _ in 0..sources.len().min(MAX_PROBE_THREADS) {
+            s.spawn(|| {
+                loop {
+                    let i = next.fetch_add(1, Ordering::Relaxed);
+                    let Some(source) = sources.get(i) else {
+                        break;
+                    };
+                    available[i].store(source.is_available(), Ordering::Relaxed);
+                }
+            });
+        }
+    });
+
+    sources
         .into_iter()
-        .filter(|s| s.is_available())
+        .zip(available)
+        .filter_map(|(source, ok)| ok.into_inner().then_some(source))
         .collect()
 }
 
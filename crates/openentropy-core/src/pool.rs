@@ -9,22 +9,29 @@
 //! 6. Graceful degradation when sources fail
 //! 7. Thread-safe for concurrent access
 
-use std::collections::{HashMap, HashSet};
+use std::collections::{HashMap, HashSet, VecDeque};
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::{Arc, Mutex};
 use std::time::{Duration, Instant};
 
 use sha2::{Digest, Sha256};
 
-use crate::conditioning::{quick_min_entropy, quick_shannon};
+use crate::conditioning::{quick_entropy, update_with_clock};
 use crate::source::{EntropySource, SourceState};
 
+/// Upper bound, in collections, on how stale a healthy source's entropy
+/// estimate may get before it is recomputed.
+const REESTIMATE_PERIOD: u64 = 16;
+
 /// Thread-safe multi-source entropy pool.
 pub struct EntropyPool {
     sources: Vec<Arc<Mutex<SourceState>>>,
-    buffer: Mutex<Vec<u8>>,
+    /// Collected bytes awaiting output. A ring buffer, so consuming from the
+    /// front never shifts the bytes behind it.
+    buffer: Mutex<VecDeque<u8>>,
     state: Mutex<[u8; 32]>,
-    counter: Mutex<u64>,
-    total_output: Mutex<u64>,
+    counter: AtomicU64,
+    total_output: AtomicU64,
     // Per-source collection coordination for timeout-safe parallel collection.
     in_flight: Arc<Mutex<HashSet<usize>>>,
     backoff_until: Arc<Mutex<HashMap<usize, Instant>>>,
@@ -49,10 +56,10 @@ impl EntropyPool {
 
         Self {
             sources: Vec::new(),
-            buffer: Mutex::new(Vec::new()),
+            buffer: Mutex::new(VecDeque::new()),
             state: Mutex::new(initial_state),
-            counter: Mutex::new(0),
-            total_output: Mutex::new(0),
+            counter: AtomicU64::new(0),
+            total_output: AtomicU64::new(0),
             in_flight: Arc::new(Mutex::new(HashSet::new())),
             backoff_until: Arc::new(Mutex::new(HashMap::new())),
         }
@@ -156,7 +163,7 @@ impl EntropyPool {
 
         let deadline = Instant::now() + timeout;
         let mut received = HashSet::new();
-        let mut results = Vec::new();
+        let mut chunks: Vec<Vec<u8>> = Vec::with_capacity(scheduled.len());
 
         while received.len() < scheduled.len() {
             let remaining = deadline.saturating_duration_since(Instant::now());
@@ -167,7 +174,7 @@ impl EntropyPool {
                 Ok((idx, data)) => {
                     received.insert(idx);
                     if !data.is_empty() {
-                        results.extend_from_slice(&data);
+                        chunks.push(data);
                     }
                 }
                 Err(std::sync::mpsc::RecvTimeoutError::Timeout) => break,
@@ -194,9 +201,7 @@ impl EntropyPool {
             }
         }
 
-        let n = results.len();
-        self.buffer.lock().unwrap().extend_from_slice(&results);
-        n
+        self.append_to_buffer(chunks.concat())
     }
 
     /// Collect entropy only from sources whose names are in the given list.
@@ -208,10 +213,9 @@ impl EntropyPool {
     /// Collect `n_samples` of entropy from sources whose names are in the list.
     /// Smaller `n_samples` values are faster — use this for interactive/TUI contexts.
     pub fn collect_enabled_n(&self, enabled_names: &[String], n_samples: usize) -> usize {
-        use std::sync::Arc;
-        let results: Arc<Mutex<Vec<u8>>> = Arc::new(Mutex::new(Vec::new()));
-
-        std::thread::scope(|s| {
+        // Each worker hands back its own chunk; they are joined once at the
+        // exact combined size instead of growing a shared, locked Vec.
+        let chunks: Vec<Vec<u8>> = std::thread::scope(|s| {
             let handles: Vec<_> = self
                 .sources
                 .iter()
@@ -219,25 +223,30 @@ impl EntropyPool {
                     let ss = ss_mutex.lock().unwrap();
                     enabled_names.iter().any(|n| n == ss.source.info().name)
                 })
-                .map(|ss_mutex| {
-                    let results = Arc::clone(&results);
-                    s.spawn(move || {
-                        let data = Self::collect_one_n(ss_mutex, n_samples);
-                        if !data.is_empty() {
-                            results.lock().unwrap().extend_from_slice(&data);
-                        }
-                    })
-                })
+                .map(|ss_mutex| s.spawn(move || Self::collect_one_n(ss_mutex, n_samples)))
                 .collect();
 
-            for handle in handles {
-                let _ = handle.join();
-            }
+            handles
+                .into_iter()
+                .filter_map(|handle| handle.join().ok())
+                .collect()
         });
 
-        let results = Arc::try_unwrap(results).unwrap().into_inner().unwrap();
+        self.append_to_buffer(chunks.concat())
+    }
+
+    /// Move freshly collected bytes into the shared buffer.
+    ///
+    /// When the buffer has been fully drained, the collected Vec simply takes
+    /// its place instead of being copied. Returns the number of bytes added.
+    fn append_to_buffer(&self, results: Vec<u8>) -> usize {
         let n = results.len();
-        self.buffer.lock().unwrap().extend_from_slice(&results);
+        let mut buf = self.buffer.lock().unwrap();
+        if buf.is_empty() {
+            *buf = VecDeque::from(results);
+        } else {
+            buf.extend(results);
+        }
         n
     }
 
@@ -250,9 +259,19 @@ impl EntropyPool {
             Ok(data) if !data.is_empty() => {
                 ss.last_collect_time = t0.elapsed();
                 ss.total_bytes += data.len() as u64;
-                ss.last_entropy = quick_shannon(&data);
-                ss.last_min_entropy = quick_min_entropy(&data);
-                ss.healthy = ss.last_entropy > 1.0;
+                ss.collections += 1;
+                // Re-estimate on the 1st, 2nd, 4th, 8th, ... collection while a
+                // source settles, then at least every REESTIMATE_PERIOD
+                // collections so a degrading source is caught within a bounded
+                // window; always while it is unhealthy so a recovery is
+                // noticed on the next good batch.
+                if !ss.healthy
+                    || ss.collections.is_power_of_two()
+                    || ss.collections.is_multiple_of(REESTIMATE_PERIOD)
+                {
+                    (ss.last_entropy, ss.last_min_entropy) = quick_entropy(&data);
+                    ss.healthy = ss.last_entropy > 1.0;
+                }
                 data
             }
             Ok(_) => {
@@ -301,62 +320,74 @@ impl EntropyPool {
         }
         let output: Vec<u8> = buf.drain(..take).collect();
         drop(buf);
-        *self.total_output.lock().unwrap() += take as u64;
+        self.total_output.fetch_add(take as u64, Ordering::Relaxed);
         output
     }
 
     /// Return `n_bytes` of conditioned random output.
     pub fn get_random_bytes(&self, n_bytes: usize) -> Vec<u8> {
-        // Auto-collect if buffer is low
-        {
-            let buf = self.buffer.lock().unwrap();
-            if buf.len() < n_bytes * 2 {
-                drop(buf);
-                self.collect_all();
-            }
-        }
-
-        let mut output = Vec::with_capacity(n_bytes);
-        while output.len() < n_bytes {
-            let mut counter = self.counter.lock().unwrap();
-            *counter += 1;
-            let cnt = *counter;
-            drop(counter);
-
-            // Take up to 256 bytes from buffer
-            let sample = {
-                let mut buf = self.buffer.lock().unwrap();
-                let take = buf.len().min(256);
-                let sample: Vec<u8> = buf.drain(..take).collect();
-                sample
-            };
+        let mut output = vec![0u8; n_bytes];
+        self.fill_random_bytes(&mut output);
+        output
+    }
 
+    /// Fill `out` with conditioned random output.
+    ///
+    /// Same output as [`get_random_bytes`](Self::get_random_bytes), but the
+    /// digests are written straight into the caller's buffer, so no
+    /// intermediate Vec is built and a length that is not a multiple of 32
+    /// is never overshot.
+    pub fn fill_random_bytes(&self, out: &mut [u8]) {
+        let n_bytes = out.len();
+        // Hold one buffer lock for the whole call: each 32-byte block mixes
+        // in its own 256-byte slice of the pool, hashed straight out of the
+        // ring buffer's two halves, and the consumed prefix is dropped at the
+        // end without being copied out. The low-buffer check shares that
+        // lock, so a well-stocked pool is only locked once.
+        let mut buf = self.buffer.lock().unwrap();
+        if buf.len() < n_bytes * 2 {
+            // Auto-collect if buffer is low
+            drop(buf);
+            self.collect_all();
+            buf = self.buffer.lock().unwrap();
+        }
+        let take = buf.len().min(n_bytes.div_ceil(32) * 256);
+        let (front, back) = buf.as_slices();
+
+        // Mix in OS entropy as safety net. One read per call is enough: each
+        // block's digest chains into the next through `state`.
+        let mut os_random = [0u8; 16];
+        getrandom(&mut os_random);
+
+        // One hasher for every block; `finalize_reset` leaves it ready for reuse.
+        let mut h = Sha256::new();
+        // Reserve this call's block counters up front and hold the chaining
+        // state for the whole call, so each block costs no lock traffic and
+        // concurrent callers cannot interleave within one chain.
+        let n_blocks = n_bytes.div_ceil(32) as u64;
+        let first = self.counter.fetch_add(n_blocks, Ordering::Relaxed) + 1;
+        let mut state = self.state.lock().unwrap();
+        for (i, (cnt, block)) in (first..).zip(out.chunks_mut(32)).enumerate() {
             // SHA-256 conditioning
-            let mut h = Sha256::new();
-            let state = self.state.lock().unwrap();
             h.update(*state);
-            drop(state);
-            h.update(&sample);
+            let start = (i * 256).min(take);
+            let end = (start + 256).min(take);
+            update_from_ring(&mut h, front, back, start..end);
             h.update(cnt.to_le_bytes());
 
-            let ts = std::time::SystemTime::now()
-                .duration_since(std::time::UNIX_EPOCH)
-                .unwrap_or_default();
-            h.update(ts.as_nanos().to_le_bytes());
+            update_with_clock(&mut h);
 
-            // Mix in OS entropy as safety net
-            let mut os_random = [0u8; 8];
-            getrandom(&mut os_random);
             h.update(os_random);
 
-            let digest: [u8; 32] = h.finalize().into();
-            *self.state.lock().unwrap() = digest;
-            output.extend_from_slice(&digest);
+            *state = h.finalize_reset().into();
+            block.copy_from_slice(&state[..block.len()]);
         }
+        drop(state);
+        buf.drain(..take);
+        drop(buf);
 
-        *self.total_output.lock().unwrap() += n_bytes as u64;
-        output.truncate(n_bytes);
-        output
+        self.total_output
+            .fetch_add(n_bytes as u64, Ordering::Relaxed);
     }
 
     /// Return `n_bytes` of entropy with the specified conditioning mode.
@@ -383,32 +414,30 @@ impl EntropyPool {
 
     /// Health report as structured data.
     pub fn health_report(&self) -> HealthReport {
-        let mut sources = Vec::new();
-        let mut healthy_count = 0;
-        let mut total_raw = 0u64;
-
-        for ss_mutex in &self.sources {
-            let ss = ss_mutex.lock().unwrap();
-            if ss.healthy {
-                healthy_count += 1;
-            }
-            total_raw += ss.total_bytes;
-            sources.push(SourceHealth {
-                name: ss.source.name().to_string(),
-                healthy: ss.healthy,
-                bytes: ss.total_bytes,
-                entropy: ss.last_entropy,
-                min_entropy: ss.last_min_entropy,
-                time: ss.last_collect_time.as_secs_f64(),
-                failures: ss.failures,
-            });
-        }
+        // Snapshot each source under its own lock, then aggregate over the
+        // snapshot so no source lock is held while totals are computed.
+        let sources: Vec<SourceHealth> = self
+            .sources
+            .iter()
+            .map(|ss_mutex| {
+                let ss = ss_mutex.lock().unwrap();
+                SourceHealth {
+                    name: ss.source.name().to_string(),
+                    healthy: ss.healthy,
+                    bytes: ss.total_bytes,
+                    entropy: ss.last_entropy,
+                    min_entropy: ss.last_min_entropy,
+                    time: ss.last_collect_time.as_secs_f64(),
+                    failures: ss.failures,
+                }
+            })
+            .collect();
 
         HealthReport {
-            healthy: healthy_count,
-            total: self.sources.len(),
-            raw_bytes: total_raw,
-            output_bytes: *self.total_output.lock().unwrap(),
+            healthy: sources.iter().filter(|s| s.healthy).count(),
+            total: sources.len(),
+            raw_bytes: sources.iter().map(|s| s.bytes).sum(),
+            output_bytes: self.total_output.load(Ordering::Relaxed),
             buffer_size: self.buffer.lock().unwrap().len(),
             sources,
         }
@@ -518,6 +547,18 @@ impl EntropyPool {
     }
 }
 
+/// Feed `range` of a ring buffer, given as its two `as_slices` halves, into
+/// `h` without copying it into one contiguous slice first.
+fn update_from_ring(h: &mut Sha256, front: &[u8], back: &[u8], range: std::ops::Range<usize>) {
+    let split = front.len();
+    if range.start < split {
+        h.update(&front[range.start..range.end.min(split)]);
+    }
+    if range.end > split {
+        h.update(&back[range.start.max(split) - split..range.end - split]);
+    }
+}
+
 /// Fill buffer with OS random bytes via the `getrandom` crate.
 /// Works cross-platform (Unix, Windows, WASM, etc.) without manual file I/O.
 ///
@@ -553,9 +594,9 @@ pub struct SourceHealth {
     pub healthy: bool,
     /// Total bytes collected from this source.
     pub bytes: u64,
-    /// Shannon entropy of the last collection (bits per byte, max 8.0).
+    /// Shannon entropy of the most recent estimate (bits per byte, max 8.0).
     pub entropy: f64,
-    /// Min-entropy of the last collection (bits per byte, max 8.0). More conservative than Shannon.
+    /// Min-entropy of the most recent estimate (bits per byte, max 8.0). More conservative than Shannon.
     pub min_entropy: f64,
     /// Time taken for the last collection in seconds.
     pub time: f64,
@@ -760,6 +801,36 @@ mod tests {
         assert_eq!(bytes.len(), 64);
     }
 
+    #[test]
+    fn test_update_from_ring_matches_contiguous() {
+        // Consume from the front, then refill past the end of the allocation
+        // so the contents wrap around into two slices.
+        let mut ring: VecDeque<u8> = VecDeque::with_capacity(256);
+        ring.extend(0..200u8);
+        ring.drain(..150);
+        ring.extend(0..150u8);
+        let (front, back) = ring.as_slices();
+        assert!(!back.is_empty());
+        let flat: Vec<u8> = ring.iter().copied().collect();
+        for range in [0..10, 0..ring.len(), front.len() - 3..front.len() + 7, 5..5] {
+            let mut a = Sha256::new();
+            update_from_ring(&mut a, front, back, range.clone());
+            let mut b = Sha256::new();
+            b.update(&flat[range]);
+            assert_eq!(a.finalize(), b.finalize());
+        }
+    }
+
+    #[test]
+    fn test_fill_random_bytes_partial_block() {
+        let mut pool = EntropyPool::new(Some(b"test"));
+        pool.add_source(Box::new(MockSource::new("mock", (0..=255).collect())), 1.0);
+        let mut out = [0u8; 45];
+        pool.fill_random_bytes(&mut out);
+        assert!(out.iter().any(|&b| b != 0));
+        assert_eq!(pool.health_report().output_bytes, 45);
+    }
+
     #[test]
     fn test_get_random_bytes_various_sizes() {
         let mut pool = EntropyPool::new(Some(b"test"));
@@ -861,6 +932,39 @@ mod tests {
         assert!(report.output_bytes >= 64);
     }
 
+    #[test]
+    fn test_entropy_reestimated_on_power_of_two_collections() {
+        let mut pool = EntropyPool::new(Some(b"test"));
+        pool.add_source(Box::new(MockSource::new("mock", (0..=255).collect())), 1.0);
+        pool.collect_all();
+        pool.collect_all();
+
+        // Plant a sentinel: the 3rd collection keeps it, the 4th re-estimates.
+        pool.sources[0].lock().unwrap().last_entropy = 42.0;
+        pool.collect_all();
+        assert_eq!(pool.sources[0].lock().unwrap().last_entropy, 42.0);
+        pool.collect_all();
+        let ss = pool.sources[0].lock().unwrap();
+        assert_eq!(ss.collections, 4);
+        assert!(ss.last_entropy <= 8.0);
+        assert!(ss.healthy);
+    }
+
+    #[test]
+    fn test_entropy_reestimated_at_least_every_period() {
+        let mut pool = EntropyPool::new(Some(b"test"));
+        pool.add_source(Box::new(MockSource::new("mock", (0..=255).collect())), 1.0);
+        // Past the last power of two below 3 * REESTIMATE_PERIOD (32).
+        for _ in 0..33 {
+            pool.collect_all();
+        }
+        pool.sources[0].lock().unwrap().last_entropy = 42.0;
+        for _ in 33..3 * REESTIMATE_PERIOD {
+            pool.collect_all();
+        }
+        assert!(pool.sources[0].lock().unwrap().last_entropy <= 8.0);
+    }
+
     // -----------------------------------------------------------------------
     // Source info snapshot tests
     // -----------------------------------------------------------------------
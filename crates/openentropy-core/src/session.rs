@@ -18,13 +18,14 @@ use std::collections::{HashMap, VecDeque};
 use std::fs::{self, File};
 use std::io::{BufWriter, Write};
 use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
 use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
 
 use serde::{Deserialize, Serialize};
 use uuid::Uuid;
 
 use crate::analysis;
-use crate::conditioning::{ConditioningMode, quick_min_entropy, quick_shannon};
+use crate::conditioning::{ConditioningMode, quick_entropy};
 #[cfg(test)]
 use crate::telemetry::{TelemetryMetric, TelemetryMetricDelta};
 use crate::telemetry::{
@@ -45,24 +46,32 @@ pub struct MachineInfo {
 }
 
 /// Detect machine information (best-effort).
+///
+/// The OS version and chip name are fixed for the life of the process, so
+/// they are probed once (spawning `sw_vers`/`sysctl` on macOS) and cached.
 pub fn detect_machine_info() -> MachineInfo {
-    let os = format!(
-        "{} {}",
-        std::env::consts::OS,
-        os_version().unwrap_or_default()
-    );
-    let arch = std::env::consts::ARCH.to_string();
-    let chip = detect_chip().unwrap_or_else(|| "unknown".to_string());
-    let cores = std::thread::available_parallelism()
-        .map(std::num::NonZero::get)
-        .unwrap_or(1);
-
-    MachineInfo {
-        os,
-        arch,
-        chip,
-        cores,
-    }
+    static MACHINE_INFO: OnceLock<MachineInfo> = OnceLock::new();
+    MACHINE_INFO
+        .get_or_init(|| {
+            let os = format!(
+                "{} {}",
+                std::env::consts::OS,
+                os_version().unwrap_or_default()
+            );
+            let arch = std::env::consts::ARCH.to_string();
+            let chip = detect_chip().unwrap_or_else(|| "unknown".to_string());
+            let cores = std::thread::available_parallelism()
+                .map(std::num::NonZero::get)
+                .unwrap_or(1);
+
+            MachineInfo {
+                os,
+                arch,
+                chip,
+                cores,
+            }
+        })
+        .clone()
 }
 
 /// Get OS version string (best-effort).
@@ -429,11 +438,11 @@ impl SessionWriter {
             .unwrap_or_default()
             .as_nanos() as u64;
 
-        let raw_shannon = quick_shannon(raw_bytes);
+        let (raw_shannon, raw_min_entropy) = quick_entropy(raw_bytes);
+        let (conditioned_shannon, conditioned_min_entropy) = quick_entropy(conditioned_bytes);
         // Clamp to 0.0 to avoid displaying "-0.00" in CSV
-        let raw_min_entropy = quick_min_entropy(raw_bytes).max(0.0);
-        let conditioned_shannon = quick_shannon(conditioned_bytes);
-        let conditioned_min_entropy = quick_min_entropy(conditioned_bytes).max(0.0);
+        let raw_min_entropy = raw_min_entropy.max(0.0);
+        let conditioned_min_entropy = conditioned_min_entropy.max(0.0);
         let raw_hex = hex_encode(raw_bytes);
         let conditioned_hex = hex_encode(conditioned_bytes);
 
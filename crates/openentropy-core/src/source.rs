@@ -168,6 +168,8 @@ pub struct SourceState {
     pub weight: f64,
     pub total_bytes: u64,
     pub failures: u64,
+    /// Successful (non-empty) collections, used to pace entropy re-estimation.
+    pub collections: u64,
     pub last_entropy: f64,
     pub last_min_entropy: f64,
     pub last_collect_time: Duration,
@@ -181,6 +183,7 @@ impl SourceState {
             weight,
             total_bytes: 0,
             failures: 0,
+            collections: 0,
             last_entropy: 0.0,
             last_min_entropy: 0.0,
             last_collect_time: Duration::ZERO,
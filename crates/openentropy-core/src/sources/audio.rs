@@ -1,8 +1,8 @@
 //! AudioNoiseSource — Microphone ADC noise via ffmpeg.
 //!
-//! Captures a short burst of audio from the default input device using ffmpeg's
-//! avfoundation backend, then extracts the lower 4 bits of each int16 sample.
-//! These LSBs are dominated by Johnson-Nyquist thermal noise.
+//! Streams a short burst of audio from the default input device using ffmpeg's
+//! avfoundation backend, extracting the lower 4 bits of each int16 sample as
+//! it arrives. These LSBs are dominated by Johnson-Nyquist thermal noise.
 
 use crate::source::{EntropySource, Platform, Requirement, SourceCategory, SourceInfo};
 
@@ -63,9 +63,12 @@ impl EntropySource for AudioNoiseSource {
     }
 
     fn collect(&self, n_samples: usize) -> Vec<u8> {
-        // Capture raw signed 16-bit PCM audio from the default input device.
+        use std::io::{BufReader, Read};
+        use std::process::{Command, Stdio};
+
+        // Stream raw signed 16-bit PCM audio from the default input device.
         // ffmpeg -f avfoundation -i ":0" -t 0.1 -f s16le -ar 44100 -ac 1 pipe:1
-        let result = std::process::Command::new("ffmpeg")
+        let child = Command::new("ffmpeg")
             .args([
                 "-hide_banner",
                 "-loglevel",
@@ -85,24 +88,41 @@ impl EntropySource for AudioNoiseSource {
                 "1",
                 "pipe:1",
             ])
-            .stdin(std::process::Stdio::null())
-            .stdout(std::process::Stdio::piped())
-            .stderr(std::process::Stdio::null())
-            .output();
-
-        let raw_audio = match result {
-            Ok(output) if output.status.success() => output.stdout,
-            _ => return Vec::new(),
+            .stdin(Stdio::null())
+            .stdout(Stdio::piped())
+            .stderr(Stdio::null())
+            .spawn();
+
+        let mut child = match child {
+            Ok(child) => child,
+            Err(_) => return Vec::new(),
+        };
+        let Some(stdout) = child.stdout.take() else {
+            let _ = child.kill();
+            let _ = child.wait();
+            return Vec::new();
         };
 
+        // Extract the lower 4 bits of each sample as it arrives, so nibble
+        // packing overlaps with capture instead of waiting for ffmpeg to exit.
         // Each sample is 2 bytes (signed 16-bit little-endian).
-        // Extract the lower 4 bits of each sample as entropy.
-        let nibbles = raw_audio.chunks_exact(2).map(|chunk| {
-            let sample = i16::from_le_bytes([chunk[0], chunk[1]]);
-            (sample & 0x0F) as u8
+        let mut reader = BufReader::new(stdout);
+        let nibbles = std::iter::from_fn(|| {
+            let mut sample = [0u8; 2];
+            reader.read_exact(&mut sample).ok()?;
+            Some((i16::from_le_bytes(sample) & 0x0F) as u8)
         });
-
-        pack_nibbles(nibbles, n_samples)
+        let output = pack_nibbles(nibbles, n_samples);
+
+        // Stop the capture as soon as we have enough samples. A SIGKILL'd
+        // ffmpeg has no exit code, so an exit code here means ffmpeg had
+        // already exited on its own; if that was a failure (device busy,
+        // permission denied, ...) the bytes it wrote are not trusted.
+        let _ = child.kill();
+        match child.wait() {
+            Ok(status) if status.code().is_some_and(|code| code != 0) => Vec::new(),
+            _ => output,
+        }
     }
 }
 
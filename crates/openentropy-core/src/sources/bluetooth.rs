@@ -39,8 +39,12 @@ fn parse_rssi_values(output: &str) -> Vec<i32> {
     let mut rssi_values = Vec::new();
     for line in output.lines() {
         let trimmed = line.trim();
-        let lower = trimmed.to_lowercase();
-        if lower.contains("rssi") {
+        // Case-insensitive match without allocating a lowercased copy per line.
+        if trimmed
+            .as_bytes()
+            .windows(4)
+            .any(|w| w.eq_ignore_ascii_case(b"rssi"))
+        {
             for token in trimmed.split(&[':', '=', ' '][..]) {
                 let clean = token.trim();
                 if let Ok(v) = clean.parse::<i32>() {
@@ -75,10 +79,14 @@ fn get_bluetooth_info_timed() -> (Option<String>, u64) {
                 if !status.success() {
                     return (None, elapsed);
                 }
-                let stdout = child
-                    .wait_with_output()
-                    .ok()
-                    .map(|o| String::from_utf8_lossy(&o.stdout).to_string());
+                let stdout =
+                    child
+                        .wait_with_output()
+                        .ok()
+                        .map(|o| match String::from_utf8(o.stdout) {
+                            Ok(s) => s,
+                            Err(e) => String::from_utf8_lossy(e.as_bytes()).into_owned(),
+                        });
                 return (stdout, elapsed);
             }
             Ok(None) => {
@@ -118,18 +126,12 @@ impl EntropySource for BluetoothNoiseSource {
             let (bt_info, elapsed_ns) = get_bluetooth_info_timed();
 
             // Extract timing bytes (raw nanosecond LSBs)
-            for shift in (0..64).step_by(8) {
-                raw.push((elapsed_ns >> shift) as u8);
-            }
+            raw.extend_from_slice(&elapsed_ns.to_le_bytes());
 
-            // Parse RSSI values — raw LSBs
+            // Parse RSSI values — raw LSBs, taken by truncating cast
             if let Some(info) = bt_info {
-                let rssi_values = parse_rssi_values(&info);
-                for rssi in &rssi_values {
-                    raw.push((*rssi & 0xFF) as u8);
-                }
-                raw.push(info.len() as u8);
-                raw.push((info.len() >> 8) as u8);
+                raw.extend(parse_rssi_values(&info).into_iter().map(|rssi| rssi as u8));
+                raw.extend_from_slice(&(info.len() as u16).to_le_bytes());
             }
         }
 
@@ -162,6 +164,13 @@ mod tests {
         assert_eq!(values, vec![-45, -72]);
     }
 
+    #[test]
+    fn parse_rssi_case_insensitive() {
+        let sample = "device_rssi = -60\nRssi: -33\nrSsI -12\nNo match: -1";
+        let values = parse_rssi_values(sample);
+        assert_eq!(values, vec![-60, -33, -12]);
+    }
+
     #[test]
     fn parse_rssi_empty() {
         let sample = "No bluetooth data here";
@@ -62,10 +62,13 @@ impl EntropySource for CompressionTimingSource {
         // Seed from high-resolution timer for per-call variation.
         let mut lcg: u64 = mach_time() | 1;
 
+        // Workload buffer sized for the largest input; each round fills a prefix.
+        let mut buf = [0u8; 512];
+
         for i in 0..raw_count {
             // Vary data size (128-512 bytes) to create more timing diversity.
             let data_len = 128 + (lcg as usize % 385);
-            let mut data = vec![0u8; data_len];
+            let data = &mut buf[..data_len];
 
             // First third: pseudo-random
             let third = data_len / 3;
@@ -87,7 +90,7 @@ impl EntropySource for CompressionTimingSource {
 
             let t0 = Instant::now();
             let mut encoder = ZlibEncoder::new(Vec::new(), Compression::default());
-            let _ = encoder.write_all(&data);
+            let _ = encoder.write_all(data);
             let _ = encoder.finish();
             let elapsed_ns = t0.elapsed().as_nanos() as u64;
             timings.push(elapsed_ns);
@@ -137,13 +140,16 @@ impl EntropySource for HashTimingSource {
         // Seed from high-resolution timer for per-call variation.
         let mut lcg: u64 = mach_time() | 1;
 
+        // Workload buffer sized for the largest input; each round fills a prefix.
+        let mut buf = [0u8; 2048];
+
         for i in 0..raw_count {
             // Wider range of sizes (32-2048 bytes) to create more timing diversity.
             let size = 32 + (lcg as usize % 2017);
-            let mut data = Vec::with_capacity(size);
-            for _ in 0..size {
+            let data = &mut buf[..size];
+            for byte in data.iter_mut() {
                 lcg = lcg.wrapping_mul(6364136223846793005).wrapping_add(1);
-                data.push((lcg >> 32) as u8);
+                *byte = (lcg >> 32) as u8;
             }
 
             // SHA-256 is the WORKLOAD being timed — not conditioning.
@@ -152,7 +158,7 @@ impl EntropySource for HashTimingSource {
             let t0 = Instant::now();
             for _ in 0..rounds {
                 let mut hasher = Sha256::new();
-                hasher.update(&data);
+                hasher.update(&*data);
                 let digest = hasher.finalize();
                 std::hint::black_box(&digest);
                 // Feed digest back as additional data to prevent loop elision
@@ -1,18 +1,19 @@
 //! DiskIOSource — NVMe/SSD read latency jitter.
 //!
-//! Creates a temporary 64KB file, performs random seeks and 4KB reads,
-//! and extracts LSBs of nanosecond timing deltas as entropy.
+//! Creates a temporary 64KB file, performs random positioned 4KB reads
+//! (`pread`), and extracts LSBs of high-resolution timing deltas as entropy.
 //!
 //! **Raw output characteristics:** LSBs of inter-read timing deltas.
 //! Use SHA-256 conditioning for uniform output.
 
-use std::io::{Read, Seek, SeekFrom, Write};
-use std::time::Instant;
+use std::os::unix::fs::FileExt;
 
 use tempfile::NamedTempFile;
 
 use crate::source::{EntropySource, Platform, SourceCategory, SourceInfo};
 
+use super::helpers::{mach_time, write_lcg_fill};
+
 /// Size of the temporary file used for random reads.
 const TEMP_FILE_SIZE: usize = 64 * 1024; // 64 KB
 
@@ -52,23 +53,11 @@ impl EntropySource for DiskIOSource {
             Err(_) => return Vec::new(),
         };
 
-        let mut fill_data = vec![0u8; TEMP_FILE_SIZE];
-        let mut lcg: u64 = 0xCAFE_BABE_DEAD_BEEF;
-        for chunk in fill_data.chunks_mut(8) {
-            lcg = lcg.wrapping_mul(6364136223846793005).wrapping_add(1);
-            let bytes = lcg.to_le_bytes();
-            for (i, b) in chunk.iter_mut().enumerate() {
-                *b = bytes[i % 8];
-            }
-        }
-        if tmpfile.write_all(&fill_data).is_err() {
-            return Vec::new();
-        }
-        if tmpfile.flush().is_err() {
+        if write_lcg_fill(&mut tmpfile, TEMP_FILE_SIZE, 0xCAFE_BABE_DEAD_BEEF).is_err() {
             return Vec::new();
         }
 
-        let mut raw = Vec::with_capacity(n_samples);
+        let file = tmpfile.as_file();
         let mut read_buf = vec![0u8; READ_BLOCK_SIZE];
         let max_offset = TEMP_FILE_SIZE.saturating_sub(READ_BLOCK_SIZE);
 
@@ -78,37 +67,32 @@ impl EntropySource for DiskIOSource {
             .as_nanos() as u64;
         let mut lcg_state = seed | 1;
 
-        let mut prev_ns: u64 = 0;
-
-        // Oversample to ensure enough raw data.
-        let num_reads = n_samples * 2 + 64;
-
-        for i in 0..num_reads {
-            lcg_state = lcg_state
-                .wrapping_mul(6364136223846793005)
-                .wrapping_add(1442695040888963407);
-            let offset = (lcg_state as usize) % (max_offset + 1);
-
-            let t0 = Instant::now();
-            let _ = tmpfile.seek(SeekFrom::Start(offset as u64));
-            let _ = tmpfile.read(&mut read_buf);
-            let elapsed_ns = t0.elapsed().as_nanos() as u64;
-
-            if i > 0 {
-                let delta = elapsed_ns.wrapping_sub(prev_ns);
-                // Extract lowest byte of delta — raw, unconditioned
-                raw.push(delta as u8);
-            }
-
-            prev_ns = elapsed_ns;
-
-            if raw.len() >= n_samples {
-                break;
-            }
+        // Every read after the first yields one delta byte. Draw all offsets
+        // up front so nothing but the read sits between timed reads.
+        let num_reads = n_samples + 1;
+        let offsets: Vec<u64> = (0..num_reads)
+            .map(|_| {
+                lcg_state = lcg_state
+                    .wrapping_mul(6364136223846793005)
+                    .wrapping_add(1442695040888963407);
+                ((lcg_state as usize) % (max_offset + 1)) as u64
+            })
+            .collect();
+
+        let mut timings = Vec::with_capacity(num_reads);
+        for &offset in &offsets {
+            // A positioned read is a single syscall, so the timed window holds
+            // only the read itself rather than an lseek + read pair.
+            let t0 = mach_time();
+            let _ = file.read_at(&mut read_buf, offset);
+            timings.push(mach_time().wrapping_sub(t0));
         }
 
-        raw.truncate(n_samples);
-        raw
+        // Extract lowest byte of each delta — raw, unconditioned
+        timings
+            .windows(2)
+            .map(|w| w[1].wrapping_sub(w[0]) as u8)
+            .collect()
     }
 }
 
@@ -5,7 +5,7 @@
 //!
 
 use crate::source::{EntropySource, Platform, SourceCategory, SourceInfo};
-use crate::sources::helpers::{mach_time, xor_fold_u64};
+use crate::sources::helpers::{extract_timing_entropy, mach_time};
 
 use std::sync::Arc;
 use std::sync::atomic::{AtomicU64, Ordering};
@@ -167,24 +167,13 @@ impl EntropySource for CASContentionSource {
             return Vec::new();
         }
 
-        let mut combined: Vec<u64> = Vec::with_capacity(min_len);
-        for i in 0..min_len {
-            let mut val = 0u64;
-            for result in &results {
-                val ^= result.timings[i];
-            }
-            combined.push(val);
-        }
-
-        // Extract entropy: deltas → XOR adjacent → xor-fold.
-        let deltas: Vec<u64> = combined
-            .windows(2)
-            .map(|w| w[1].wrapping_sub(w[0]))
+        let combined: Vec<u64> = (0..min_len)
+            .map(|i| results.iter().fold(0, |val, r| val ^ r.timings[i]))
             .collect();
-        let xored: Vec<u64> = deltas.windows(2).map(|w| w[0] ^ w[1]).collect();
-        let mut raw: Vec<u8> = xored.iter().map(|&x| xor_fold_u64(x)).collect();
-        raw.truncate(n_samples);
-        raw
+
+        // Extract entropy: deltas → XOR adjacent → xor-fold, fused in one
+        // pass without intermediate delta buffers.
+        extract_timing_entropy(&combined, n_samples)
     }
 }
 
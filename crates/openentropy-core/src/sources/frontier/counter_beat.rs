@@ -40,9 +40,9 @@
 
 use crate::source::{EntropySource, Platform, Requirement, SourceCategory, SourceInfo};
 #[cfg(target_os = "macos")]
-use crate::sources::helpers::read_cntvct;
+use crate::sources::helpers::extract_timing_entropy;
 #[cfg(target_os = "macos")]
-use crate::sources::helpers::xor_fold_u64;
+use crate::sources::helpers::read_cntvct;
 
 static COUNTER_BEAT_INFO: SourceInfo = SourceInfo {
     name: "counter_beat",
@@ -233,14 +233,9 @@ impl EntropySource for CounterBeatSource {
             }
 
             // Extract entropy: consecutive beat differences capture the phase
-            // drift rate, then XOR adjacent deltas and fold to bytes.
-            let deltas: Vec<u64> = beats.windows(2).map(|w| w[1].wrapping_sub(w[0])).collect();
-
-            let xored: Vec<u64> = deltas.windows(2).map(|w| w[0] ^ w[1]).collect();
-
-            let mut output: Vec<u8> = xored.iter().map(|&x| xor_fold_u64(x)).collect();
-            output.truncate(n_samples);
-            output
+            // drift rate, then XOR adjacent deltas and fold to bytes — the
+            // shared single-pass timing extractor.
+            extract_timing_entropy(&beats, n_samples)
         }
     }
 }
@@ -122,11 +122,13 @@ impl EntropySource for DVFSRaceSource {
             diffs.push(diff);
         }
 
-        // Extract entropy: XOR adjacent diffs, then xor-fold to bytes.
-        let xored: Vec<u64> = diffs.windows(2).map(|w| w[0] ^ w[1]).collect();
-        let mut raw: Vec<u8> = xored.iter().map(|&x| xor_fold_u64(x)).collect();
-        raw.truncate(n_samples);
-        raw
+        // Extract entropy: XOR adjacent diffs, then xor-fold to bytes, in one
+        // pass straight into the output.
+        diffs
+            .windows(2)
+            .take(n_samples)
+            .map(|w| xor_fold_u64(w[0] ^ w[1]))
+            .collect()
     }
 }
 
@@ -17,7 +17,7 @@
 use std::io::Write;
 
 use crate::source::{EntropySource, Platform, SourceCategory, SourceInfo};
-use crate::sources::helpers::extract_timing_entropy;
+use crate::sources::helpers::{extract_timing_entropy, mach_time};
 
 static FSYNC_JOURNAL_INFO: SourceInfo = SourceInfo {
     name: "fsync_journal",
@@ -63,24 +63,24 @@ impl EntropySource for FsyncJournalSource {
 
             // Vary the first bytes to prevent APFS deduplication.
             let mut buf = write_data;
-            buf[0] = (i & 0xFF) as u8;
-            buf[1] = ((i >> 8) & 0xFF) as u8;
+            buf[..2].copy_from_slice(&(i as u16).to_le_bytes());
 
-            let t0 = std::time::Instant::now();
+            // The write only dirties the page cache; keep it (and the file
+            // creation above) outside the timed window so the measurement is
+            // the journal commit itself, not syscall entry overhead.
             if tmpfile.write_all(&buf).is_err() {
                 continue;
             }
-            if tmpfile.flush().is_err() {
-                continue;
-            }
+
             // fsync forces the full journal commit.
             let file = tmpfile.as_file();
+            let t0 = mach_time();
             if file.sync_all().is_err() {
                 continue;
             }
-            let elapsed = t0.elapsed();
+            let t1 = mach_time();
 
-            timings.push(elapsed.as_nanos() as u64);
+            timings.push(t1.wrapping_sub(t0));
             // tmpfile is automatically deleted on drop.
         }
 
@@ -89,6 +89,36 @@ kernel void divergence(
 }
 "#;
 
+    /// Selectors used on every dispatch, registered once in [`MetalState::new`]
+    /// so the hot loop skips the `CString` allocation and runtime lookup.
+    struct Selectors {
+        command_buffer: Sel,
+        compute_command_encoder: Sel,
+        set_compute_pipeline_state: Sel,
+        set_buffer: Sel,
+        dispatch_threads: Sel,
+        end_encoding: Sel,
+        commit: Sel,
+        wait_until_completed: Sel,
+    }
+
+    impl Selectors {
+        unsafe fn register() -> Self {
+            unsafe {
+                Selectors {
+                    command_buffer: sel("commandBuffer"),
+                    compute_command_encoder: sel("computeCommandEncoder"),
+                    set_compute_pipeline_state: sel("setComputePipelineState:"),
+                    set_buffer: sel("setBuffer:offset:atIndex:"),
+                    dispatch_threads: sel("dispatchThreads:threadsPerThreadgroup:"),
+                    end_encoding: sel("endEncoding"),
+                    commit: sel("commit"),
+                    wait_until_completed: sel("waitUntilCompleted"),
+                }
+            }
+        }
+    }
+
     /// Opaque handle to a reusable Metal pipeline + buffers.
     pub struct MetalState {
         _device: Id,
@@ -96,6 +126,11 @@ kernel void divergence(
         pipeline: Id,
         counter_buf: Id,
         output_buf: Id,
+        /// CPU-visible contents of `counter_buf` (stable for shared buffers).
+        counter_ptr: *mut u32,
+        /// CPU-visible contents of `output_buf` (stable for shared buffers).
+        output_ptr: *const u32,
+        sels: Selectors,
     }
 
     // SAFETY: Metal objects are reference-counted and thread-safe.
@@ -136,65 +171,78 @@ kernel void divergence(
                     return None;
                 }
 
+                // SAFETY: both buffers use MTLResourceStorageModeShared, whose
+                // `contents` pointer is valid and fixed for the buffer's lifetime.
+                let counter_ptr = msg_send(counter_buf, "contents") as *mut u32;
+                let output_ptr = msg_send(output_buf, "contents") as *const u32;
+                if counter_ptr.is_null() || output_ptr.is_null() {
+                    return None;
+                }
+
                 Some(MetalState {
                     _device: device,
                     queue,
                     pipeline,
                     counter_buf,
                     output_buf,
+                    counter_ptr,
+                    output_ptr,
+                    sels: Selectors::register(),
                 })
             }
         }
 
         /// Dispatch one compute pass and return the output buffer contents.
         pub fn dispatch(&self) -> Option<Vec<u32>> {
+            let sels = &self.sels;
             unsafe {
                 // Zero the counter.
-                // SAFETY: counter_buf is a shared MTLBuffer we created. `contents` returns
-                // a valid pointer to the buffer's CPU-accessible memory.
-                let counter_ptr = msg_send(self.counter_buf, "contents") as *mut u32;
-                if counter_ptr.is_null() {
-                    return None;
-                }
-                *counter_ptr = 0;
+                // SAFETY: counter_ptr is the shared buffer's CPU-visible memory,
+                // resolved and null-checked in `new`.
+                *self.counter_ptr = 0;
 
-                let cmd_buf = msg_send(self.queue, "commandBuffer");
+                let cmd_buf = msg_send_fn!(unsafe extern "C" fn(Id, Sel) -> Id)(
+                    self.queue,
+                    sels.command_buffer,
+                );
                 if cmd_buf.is_null() {
                     return None;
                 }
 
-                let encoder = msg_send(cmd_buf, "computeCommandEncoder");
+                let encoder = msg_send_fn!(unsafe extern "C" fn(Id, Sel) -> Id)(
+                    cmd_buf,
+                    sels.compute_command_encoder,
+                );
                 if encoder.is_null() {
                     return None;
                 }
 
                 // encoder.setComputePipelineState_(pipeline)
-                let sel_set_pipeline = sel("setComputePipelineState:");
                 msg_send_fn!(unsafe extern "C" fn(Id, Sel, Id))(
                     encoder,
-                    sel_set_pipeline,
+                    sels.set_compute_pipeline_state,
                     self.pipeline,
                 );
 
                 // encoder.setBuffer_offset_atIndex_(counter_buf, 0, 0)
-                set_buffer(encoder, self.counter_buf, 0, 0);
+                set_buffer(encoder, sels.set_buffer, self.counter_buf, 0, 0);
                 // encoder.setBuffer_offset_atIndex_(output_buf, 0, 1)
-                set_buffer(encoder, self.output_buf, 0, 1);
+                set_buffer(encoder, sels.set_buffer, self.output_buf, 0, 1);
 
-                dispatch_threads_1d(encoder, THREADS, THREADS.min(256));
+                dispatch_threads_1d(encoder, sels.dispatch_threads, THREADS, THREADS.min(256));
 
                 // End encoding, commit, wait.
-                msg_send_fn!(unsafe extern "C" fn(Id, Sel))(encoder, sel("endEncoding"));
-                msg_send_fn!(unsafe extern "C" fn(Id, Sel))(cmd_buf, sel("commit"));
-                msg_send_fn!(unsafe extern "C" fn(Id, Sel))(cmd_buf, sel("waitUntilCompleted"));
+                msg_send_fn!(unsafe extern "C" fn(Id, Sel))(encoder, sels.end_encoding);
+                msg_send_fn!(unsafe extern "C" fn(Id, Sel))(cmd_buf, sels.commit);
+                msg_send_fn!(unsafe extern "C" fn(Id, Sel))(cmd_buf, sels.wait_until_completed);
 
                 // Read output.
-                let output_ptr = msg_send(self.output_buf, "contents") as *const u32;
-                if output_ptr.is_null() {
-                    return None;
-                }
                 let mut result = vec![0u32; THREADS as usize];
-                std::ptr::copy_nonoverlapping(output_ptr, result.as_mut_ptr(), THREADS as usize);
+                std::ptr::copy_nonoverlapping(
+                    self.output_ptr,
+                    result.as_mut_ptr(),
+                    THREADS as usize,
+                );
                 Some(result)
             }
         }
@@ -293,9 +341,8 @@ kernel void divergence(
     }
 
     /// Set a buffer on a compute command encoder.
-    unsafe fn set_buffer(encoder: Id, buffer: Id, offset: u64, index: u64) {
+    unsafe fn set_buffer(encoder: Id, s: Sel, buffer: Id, offset: u64, index: u64) {
         unsafe {
-            let s = sel("setBuffer:offset:atIndex:");
             msg_send_fn!(unsafe extern "C" fn(Id, Sel, Id, u64, u64))(
                 encoder, s, buffer, offset, index,
             );
@@ -303,7 +350,7 @@ kernel void divergence(
     }
 
     /// Dispatch 1D threads on a compute command encoder.
-    unsafe fn dispatch_threads_1d(encoder: Id, total: u32, per_group: u32) {
+    unsafe fn dispatch_threads_1d(encoder: Id, s: Sel, total: u32, per_group: u32) {
         // MTLSize is a struct of 3 x NSUInteger (u64 on 64-bit).
         #[repr(C)]
         struct MTLSize {
@@ -324,7 +371,6 @@ kernel void divergence(
         };
 
         unsafe {
-            let s = sel("dispatchThreads:threadsPerThreadgroup:");
             msg_send_fn!(unsafe extern "C" fn(Id, Sel, MTLSize, MTLSize))(encoder, s, grid, group);
         }
     }
@@ -338,7 +384,10 @@ impl EntropySource for GPUDivergenceSource {
     fn is_available(&self) -> bool {
         #[cfg(target_os = "macos")]
         {
-            metal::MetalState::new().is_some()
+            // Building a MetalState compiles the shader library, so probe
+            // once per process and reuse the answer for later scans.
+            static METAL_AVAILABLE: std::sync::OnceLock<bool> = std::sync::OnceLock::new();
+            *METAL_AVAILABLE.get_or_init(|| metal::MetalState::new().is_some())
         }
         #[cfg(not(target_os = "macos"))]
         {
@@ -214,8 +214,12 @@ mod iosurface {
     }
 
     /// Check if IOSurface is available by trying to create one.
+    ///
+    /// The probe runs a full crossing cycle, so the result is cached for the
+    /// lifetime of the process.
     pub fn is_available() -> bool {
-        crossing_cycle(0).is_some()
+        static AVAILABLE: std::sync::OnceLock<bool> = std::sync::OnceLock::new();
+        *AVAILABLE.get_or_init(|| crossing_cycle(0).is_some())
     }
 }
 
@@ -98,32 +98,26 @@ pub(crate) fn extract_timing_entropy_debiased(timings: &[u64], n_samples: usize)
         return Vec::new();
     }
 
-    let deltas: Vec<u64> = timings
-        .windows(2)
-        .map(|w| w[1].wrapping_sub(w[0]))
-        .collect();
-
     // Von Neumann debias: take pairs, discard equal, emit comparison bit.
-    let mut debiased_bits: Vec<u8> = Vec::with_capacity(deltas.len() / 2);
-    for pair in deltas.chunks_exact(2) {
-        if pair[0] != pair[1] {
-            debiased_bits.push(if pair[0] < pair[1] { 1 } else { 0 });
-        }
-    }
-
-    // Pack bits into bytes (only full bytes).
+    // Each pair of consecutive deltas spans three timings, so the deltas
+    // are formed in place instead of being collected first. Bits are packed
+    // straight into bytes (only full bytes are emitted).
     let mut bytes = Vec::with_capacity(n_samples);
-    for chunk in debiased_bits.chunks(8) {
-        if chunk.len() < 8 {
-            break;
-        }
-        let mut byte = 0u8;
-        for (i, &bit) in chunk.iter().enumerate() {
-            byte |= bit << (7 - i);
+    let mut acc = 0u8;
+    let mut acc_bits = 0;
+    for w in timings.windows(3).step_by(2) {
+        let (d0, d1) = (w[1].wrapping_sub(w[0]), w[2].wrapping_sub(w[1]));
+        if d0 == d1 {
+            continue;
         }
-        bytes.push(byte);
-        if bytes.len() >= n_samples {
-            break;
+        acc = (acc << 1) | (d0 < d1) as u8;
+        acc_bits += 1;
+        if acc_bits == 8 {
+            bytes.push(acc);
+            acc_bits = 0;
+            if bytes.len() >= n_samples {
+                break;
+            }
         }
     }
     bytes.truncate(n_samples);
@@ -142,18 +136,19 @@ pub(crate) fn extract_timing_entropy_variance(timings: &[u64], n_samples: usize)
         return Vec::new();
     }
 
-    let deltas: Vec<u64> = timings
-        .windows(2)
-        .map(|w| w[1].wrapping_sub(w[0]))
-        .collect();
-
-    let variance: Vec<u64> = deltas.windows(2).map(|w| w[1].wrapping_sub(w[0])).collect();
-
-    let xored: Vec<u64> = variance.windows(2).map(|w| w[0] ^ w[1]).collect();
-
-    let mut raw: Vec<u8> = xored.iter().map(|&x| xor_fold_u64(x)).collect();
-    raw.truncate(n_samples);
-    raw
+    // Fused single pass: each window of four timings yields two consecutive
+    // second-order deltas, which are XORed and folded without materializing
+    // the intermediate delta/variance vectors.
+    timings
+        .windows(4)
+        .take(n_samples)
+        .map(|w| {
+            let d0 = w[1].wrapping_sub(w[0]);
+            let d1 = w[2].wrapping_sub(w[1]);
+            let d2 = w[3].wrapping_sub(w[2]);
+            xor_fold_u64(d1.wrapping_sub(d0) ^ d2.wrapping_sub(d1))
+        })
+        .collect()
 }
 
 // ---------------------------------------------------------------------------
@@ -197,6 +192,22 @@ mod tests {
         assert!(result.len() <= 10);
     }
 
+    #[test]
+    fn variance_extraction_matches_staged_reference() {
+        let timings: Vec<u64> = (0..64u64).map(|i| i * i * 37 + (i ^ 0x5A) * 11).collect();
+        let deltas: Vec<u64> = timings
+            .windows(2)
+            .map(|w| w[1].wrapping_sub(w[0]))
+            .collect();
+        let variance: Vec<u64> = deltas.windows(2).map(|w| w[1].wrapping_sub(w[0])).collect();
+        let expected: Vec<u8> = variance
+            .windows(2)
+            .map(|w| xor_fold_u64(w[0] ^ w[1]))
+            .take(40)
+            .collect();
+        assert_eq!(extract_timing_entropy_variance(&timings, 40), expected);
+    }
+
     #[test]
     fn variance_extraction_too_few() {
         assert!(extract_timing_entropy_variance(&[1, 2, 3], 10).is_empty());
@@ -1,6 +1,7 @@
 //! NVMe I/O stack timing — storage controller scheduling entropy.
 //!
-//! Each read with F_NOCACHE (bypassing OS buffer cache) traverses:
+//! Each read with the OS buffer cache bypassed (F_NOCACHE on macOS, O_DIRECT
+//! on Linux) traverses:
 //! - Filesystem metadata lookup and block mapping
 //! - NVMe command submission and completion queue arbitration
 //! - SSD controller DRAM cache lookup and scheduling
@@ -11,11 +12,10 @@
 //! stack scheduling nondeterminism, not NAND cell physics.
 //!
 
-use std::io::{Read, Seek, SeekFrom, Write};
-use std::time::Instant;
+use std::os::unix::fs::FileExt;
 
 use crate::source::{EntropySource, Platform, SourceCategory, SourceInfo};
-use crate::sources::helpers::extract_timing_entropy;
+use crate::sources::helpers::{extract_timing_entropy, mach_time, write_lcg_fill};
 
 /// Number of distinct offsets to cycle through (hitting different NAND pages).
 const N_OFFSETS: usize = 8;
@@ -26,7 +26,8 @@ const BLOCK_SIZE: usize = 4096;
 static NVME_LATENCY_INFO: SourceInfo = SourceInfo {
     name: "nvme_latency",
     description: "NVMe I/O stack timing jitter from storage controller scheduling",
-    physics: "Reads a file at multiple offsets with OS buffer cache bypassed (F_NOCACHE). \
+    physics: "Reads a file at multiple offsets with OS buffer cache bypassed (F_NOCACHE on \
+              macOS, O_DIRECT on Linux). \
               Each read traverses: filesystem metadata lookup \u{2192} NVMe command queue \
               submission \u{2192} SSD controller DRAM cache \u{2192} completion interrupt. \
               Timing jitter arises from NVMe command queue arbitration, SSD controller \
@@ -60,19 +61,7 @@ impl EntropySource for NVMeLatencySource {
         };
 
         let total_size = BLOCK_SIZE * N_OFFSETS;
-        let mut fill = vec![0u8; total_size];
-        let mut lcg: u64 = 0xDEAD_BEEF_CAFE_1234;
-        for chunk in fill.chunks_mut(8) {
-            lcg = lcg.wrapping_mul(6364136223846793005).wrapping_add(1);
-            let bytes = lcg.to_le_bytes();
-            for (i, b) in chunk.iter_mut().enumerate() {
-                *b = bytes[i % 8];
-            }
-        }
-        if tmpfile.write_all(&fill).is_err() {
-            return Vec::new();
-        }
-        if tmpfile.flush().is_err() {
+        if write_lcg_fill(&mut tmpfile, total_size, 0xDEAD_BEEF_CAFE_1234).is_err() {
             return Vec::new();
         }
 
@@ -87,19 +76,38 @@ impl EntropySource for NVMeLatencySource {
             }
         }
 
+        // On Linux, reopen the file with O_DIRECT so reads go to the device
+        // instead of the page cache. Filesystems without O_DIRECT support
+        // (e.g. tmpfs) reject the open, and we fall back to buffered reads.
+        #[cfg(target_os = "linux")]
+        let direct = {
+            use std::os::unix::fs::OpenOptionsExt;
+            std::fs::OpenOptions::new()
+                .read(true)
+                .custom_flags(libc::O_DIRECT)
+                .open(tmpfile.path())
+                .ok()
+        };
+        #[cfg(not(target_os = "linux"))]
+        let direct: Option<std::fs::File> = None;
+        let file = direct.as_ref().unwrap_or_else(|| tmpfile.as_file());
+
+        // O_DIRECT requires a block-aligned buffer; over-allocate and take an
+        // aligned window (harmless for buffered reads).
+        let mut backing = vec![0u8; BLOCK_SIZE * 2];
+        let align = backing.as_ptr().align_offset(BLOCK_SIZE);
+        let read_buf = &mut backing[align..align + BLOCK_SIZE];
+
         let raw_count = n_samples * 4 + 64;
         let mut timings: Vec<u64> = Vec::with_capacity(raw_count);
-        let mut read_buf = vec![0u8; BLOCK_SIZE];
 
         for i in 0..raw_count {
             let offset = (i % N_OFFSETS) as u64 * BLOCK_SIZE as u64;
-            if tmpfile.seek(SeekFrom::Start(offset)).is_err() {
-                continue;
-            }
-            let t0 = Instant::now();
-            let _ = tmpfile.read(&mut read_buf);
-            let elapsed = t0.elapsed();
-            timings.push(elapsed.as_nanos() as u64);
+            // Positioned read: one syscall per sample instead of lseek + read.
+            let t0 = mach_time();
+            let _ = file.read_at(read_buf, offset);
+            let t1 = mach_time();
+            timings.push(t1.wrapping_sub(t0));
         }
 
         extract_timing_entropy(&timings, n_samples)
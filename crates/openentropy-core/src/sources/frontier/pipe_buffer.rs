@@ -67,9 +67,11 @@ impl Default for PipeBufferConfig {
 /// kernel buffer space.
 ///
 /// # What it measures
-/// Nanosecond timing of `write()` + `read()` cycles on a pool of pipes,
-/// with variable write sizes and periodic pipe creation/destruction for
-/// zone allocator churn.
+/// Nanosecond timing of vectored `writev()` + `read()` cycles on a pool of
+/// pipes, with variable write sizes and segment counts, and periodic pipe
+/// creation/destruction for zone allocator churn. Each sample moves its whole
+/// payload with one `writev()` and one `read()`, so the cost is two syscalls
+/// per timing sample regardless of write size.
 ///
 /// # Why it's entropic
 /// Multiple simultaneous pipes competing for kernel zone allocator resources
@@ -103,12 +105,13 @@ pub struct PipeBufferSource {
 static PIPE_BUFFER_INFO: SourceInfo = SourceInfo {
     name: "pipe_buffer",
     description: "Multi-pipe kernel zone allocator competition and buffer timing jitter",
-    physics: "Creates multiple pipes simultaneously, writes variable-size data, reads it back, \
-              and closes — measuring contention in the kernel zone allocator. Multiple pipes \
-              compete for pipe zone and mbuf allocations, creating cross-CPU magazine transfer \
-              contention. Variable write sizes exercise different mbuf paths. Non-blocking mode \
-              captures EAGAIN timing on different kernel failure paths. Zone allocator timing \
-              depends on zone fragmentation, magazine layer state, and cross-CPU transfers.",
+    physics: "Creates multiple pipes simultaneously, writes variable-size data with vectored \
+              writev() calls, reads it back, and closes — measuring contention in the kernel \
+              zone allocator. Multiple pipes compete for pipe zone and mbuf allocations, \
+              creating cross-CPU magazine transfer contention. Variable write sizes exercise \
+              different mbuf paths. Non-blocking mode captures EAGAIN timing on different \
+              kernel failure paths. Zone allocator timing depends on zone fragmentation, \
+              magazine layer state, and cross-CPU transfers.",
     category: SourceCategory::IPC,
     platform: Platform::Any,
     requirements: &[],
@@ -155,6 +158,11 @@ impl EntropySource for PipeBufferSource {
             return self.collect_single_pipe(n_samples);
         }
 
+        // Allocate the I/O buffers once at the largest write size and slice
+        // per iteration, so the timed loop never touches the heap allocator.
+        let write_data = vec![0xBEu8; max_size];
+        let mut read_buf = vec![0u8; max_size];
+
         for i in 0..raw_count {
             // Vary write size to exercise different mbuf allocation paths.
             lcg = lcg.wrapping_mul(6364136223846793005).wrapping_add(1);
@@ -163,17 +171,23 @@ impl EntropySource for PipeBufferSource {
             } else {
                 min_size + (lcg >> 48) as usize % (max_size - min_size + 1)
             };
-            let write_data = vec![0xBEu8; write_size];
-            let mut read_buf = vec![0u8; write_size];
 
             let pipe_idx = i % pipe_pool.len();
             let fds = pipe_pool[pipe_idx];
 
-            let t0 = mach_time();
+            // Scatter the payload across 1..=MAX_IOV segments so the kernel's
+            // vectored copy-in path (uio iteration) varies per sample too.
+            let segments = 1 + (lcg >> 40) as usize % MAX_IOV;
+            let mut iov = [EMPTY_IOVEC; MAX_IOV];
+            let iov_count = fill_iovecs(&write_data[..write_size], segments, &mut iov);
 
-            // SAFETY: fds are valid file descriptors from pipe().
+            // Start timing only once the iovecs are built, so the sample
+            // covers the syscalls and not the userspace setup.
+            let t0 = mach_time();
+            // SAFETY: fds are valid file descriptors from pipe(). iov[..iov_count]
+            // describes live slices of write_data.
             unsafe {
-                let written = libc::write(fds[1], write_data.as_ptr() as *const _, write_size);
+                let written = libc::writev(fds[1], iov.as_ptr(), iov_count as i32);
 
                 if written > 0 {
                     libc::read(fds[0], read_buf.as_mut_ptr() as *mut _, written as usize);
@@ -210,39 +224,80 @@ impl EntropySource for PipeBufferSource {
 }
 
 impl PipeBufferSource {
-    /// Fallback single-pipe collection (matches original behavior).
+    /// Fallback single-pipe collection, used when the pipe pool cannot be
+    /// created. The pipe pair is opened once and reused for every sample.
     pub(crate) fn collect_single_pipe(&self, n_samples: usize) -> Vec<u8> {
         let raw_count = n_samples * 4 + 64;
         let mut timings: Vec<u64> = Vec::with_capacity(raw_count);
         let mut lcg: u64 = mach_time() | 1;
 
+        let mut fds: [i32; 2] = [0; 2];
+        // SAFETY: fds is a 2-element array matching pipe()'s expected output.
+        if unsafe { libc::pipe(fds.as_mut_ptr()) } != 0 {
+            return Vec::new();
+        }
+
+        let write_data = [0xBEu8; 256];
+        let mut read_buf = [0u8; 256];
+
         for _ in 0..raw_count {
             lcg = lcg.wrapping_mul(6364136223846793005).wrapping_add(1);
             let write_size = 1 + (lcg >> 48) as usize % 256;
-            let write_data = vec![0xBEu8; write_size];
-            let mut read_buf = vec![0u8; write_size];
+            let segments = 1 + (lcg >> 40) as usize % MAX_IOV;
+            let mut iov = [EMPTY_IOVEC; MAX_IOV];
+            let iov_count = fill_iovecs(&write_data[..write_size], segments, &mut iov);
 
-            let mut fds: [i32; 2] = [0; 2];
             let t0 = mach_time();
-            let ret = unsafe { libc::pipe(fds.as_mut_ptr()) };
-            if ret != 0 {
-                continue;
-            }
+            // SAFETY: fds are valid file descriptors from pipe(). A 256-byte
+            // write always fits in an empty pipe buffer, so neither call blocks.
             unsafe {
-                libc::write(fds[1], write_data.as_ptr() as *const _, write_size);
-                libc::read(fds[0], read_buf.as_mut_ptr() as *mut _, write_size);
-                libc::close(fds[0]);
-                libc::close(fds[1]);
+                let written = libc::writev(fds[1], iov.as_ptr(), iov_count as i32);
+                if written > 0 {
+                    libc::read(fds[0], read_buf.as_mut_ptr() as *mut _, written as usize);
+                }
             }
             let t1 = mach_time();
             std::hint::black_box(&read_buf);
             timings.push(t1.wrapping_sub(t0));
         }
 
+        // SAFETY: fds are valid file descriptors from pipe().
+        unsafe {
+            libc::close(fds[0]);
+            libc::close(fds[1]);
+        }
+
         extract_timing_entropy(&timings, n_samples)
     }
 }
 
+/// Maximum number of segments per vectored write.
+const MAX_IOV: usize = 4;
+
+const EMPTY_IOVEC: libc::iovec = libc::iovec {
+    iov_base: std::ptr::null_mut(),
+    iov_len: 0,
+};
+
+/// Split `data` into up to `segments` contiguous iovecs (clamped to
+/// `1..=MAX_IOV` and to `data.len()`). Returns the number of entries used.
+fn fill_iovecs(data: &[u8], segments: usize, iov: &mut [libc::iovec; MAX_IOV]) -> usize {
+    let count = segments.clamp(1, MAX_IOV).min(data.len().max(1));
+    let chunk = data.len() / count;
+    let mut offset = 0;
+    for (i, slot) in iov.iter_mut().take(count).enumerate() {
+        let len = if i + 1 == count {
+            data.len() - offset
+        } else {
+            chunk
+        };
+        slot.iov_base = data[offset..].as_ptr() as *mut _;
+        slot.iov_len = len;
+        offset += len;
+    }
+    count
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -277,6 +332,21 @@ mod tests {
         assert_eq!(src.config.num_pipes, 8);
     }
 
+    #[test]
+    fn iovecs_cover_payload() {
+        let data = [0u8; 257];
+        for segments in 0..=MAX_IOV + 1 {
+            let mut iov = [EMPTY_IOVEC; MAX_IOV];
+            let count = fill_iovecs(&data, segments, &mut iov);
+            assert!((1..=MAX_IOV).contains(&count));
+            let total: usize = iov[..count].iter().map(|v| v.iov_len).sum();
+            assert_eq!(total, data.len());
+        }
+
+        let mut iov = [EMPTY_IOVEC; MAX_IOV];
+        assert_eq!(fill_iovecs(&data[..2], MAX_IOV, &mut iov), 2);
+    }
+
     #[test]
     #[ignore] // Uses pipe syscall
     fn collects_bytes() {
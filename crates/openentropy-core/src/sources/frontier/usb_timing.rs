@@ -129,12 +129,9 @@ mod iokit {
         devices
     }
 
-    /// Query a device property and return the elapsed time.
-    pub fn query_device_property(device: u32, key: &[u8]) -> std::time::Duration {
-        let cf_key = cfstr(key);
-        if cf_key.is_null() {
-            return std::time::Duration::ZERO;
-        }
+    /// Query a device property by a pre-built CFString key and return the
+    /// elapsed time.
+    pub fn query_device_property(device: u32, cf_key: *const c_void) -> std::time::Duration {
         let t0 = std::time::Instant::now();
         // SAFETY: IORegistryEntryCreateCFProperty reads a property from a valid
         // IOKit service handle using a valid CFString key. Returns null on failure.
@@ -144,8 +141,6 @@ mod iokit {
             // SAFETY: Releasing a non-null CF object we received from IOKit.
             unsafe { CFRelease(prop) };
         }
-        // SAFETY: Releasing the CFString we created in cfstr().
-        unsafe { CFRelease(cf_key) };
         elapsed
     }
 }
@@ -191,13 +186,26 @@ impl EntropySource for USBTimingSource {
             let raw_count = n_samples * 4 + 64;
             let mut timings: Vec<u64> = Vec::with_capacity(raw_count);
 
-            let property_keys: &[&[u8]] = &[b"sessionID\0", b"USB Address\0"];
+            // Build the property-key CFStrings once rather than allocating and
+            // releasing one per query inside the sampling loop.
+            let property_keys: Vec<_> = [&b"sessionID\0"[..], b"USB Address\0"]
+                .into_iter()
+                .map(iokit::cfstr)
+                .filter(|key| !key.is_null())
+                .collect();
+
+            if !property_keys.is_empty() {
+                for i in 0..raw_count {
+                    let device = devices[i % devices.len()];
+                    let key = property_keys[i % property_keys.len()];
+                    let elapsed = iokit::query_device_property(device, key);
+                    timings.push(elapsed.as_nanos() as u64);
+                }
+            }
 
-            for i in 0..raw_count {
-                let device = devices[i % devices.len()];
-                let key = property_keys[i % property_keys.len()];
-                let elapsed = iokit::query_device_property(device, key);
-                timings.push(elapsed.as_nanos() as u64);
+            for key in property_keys {
+                // SAFETY: Releasing the CFStrings we created with cfstr().
+                unsafe { iokit::CFRelease(key) };
             }
 
             // Release device handles before any further processing.
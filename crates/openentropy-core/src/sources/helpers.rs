@@ -35,50 +35,65 @@ pub fn mach_time() -> u64 {
 // LSB extraction
 // ---------------------------------------------------------------------------
 
-/// Pack a stream of individual bits (0 or 1) into bytes (MSB-first packing).
+/// Pack one bit taken from each value into bytes (MSB-first packing).
 ///
-/// For every 8 input bits, one output byte is produced.
-fn pack_bits_into_bytes(bits: &[u8]) -> Vec<u8> {
-    let mut bytes = Vec::with_capacity(bits.len() / 8 + 1);
-    for chunk in bits.chunks(8) {
-        let mut byte = 0u8;
-        for (i, &bit) in chunk.iter().enumerate() {
-            byte |= bit << (7 - i);
-        }
-        bytes.push(byte);
-    }
-    bytes
+/// Bits are shifted straight into the output byte, so no intermediate
+/// one-byte-per-bit buffer is built. A trailing partial group of fewer than
+/// 8 values fills the high bits of the last byte.
+fn pack_bits_with<T: Copy>(values: &[T], bit: impl Fn(T) -> u8) -> Vec<u8> {
+    values
+        .chunks(8)
+        .map(|chunk| {
+            chunk
+                .iter()
+                .enumerate()
+                .fold(0u8, |byte, (i, &v)| byte | (bit(v) << (7 - i)))
+        })
+        .collect()
 }
 
 /// Extract the least-significant bit of each `u64` delta and pack into bytes.
 ///
 /// For every 8 input values, one output byte is produced (MSB-first packing).
 pub fn extract_lsbs_u64(deltas: &[u64]) -> Vec<u8> {
-    let bits: Vec<u8> = deltas.iter().map(|d| (d & 1) as u8).collect();
-    pack_bits_into_bytes(&bits)
+    pack_bits_with(deltas, |d| (d & 1) as u8)
 }
 
 /// Extract the least-significant bit of each `i64` delta and pack into bytes.
 ///
 /// Identical to [`extract_lsbs_u64`] but for signed deltas.
 pub fn extract_lsbs_i64(deltas: &[i64]) -> Vec<u8> {
-    let bits: Vec<u8> = deltas.iter().map(|d| (d & 1) as u8).collect();
-    pack_bits_into_bytes(&bits)
+    pack_bits_with(deltas, |d| (d & 1) as u8)
 }
 
 // ---------------------------------------------------------------------------
 // Shared command utilities
 // ---------------------------------------------------------------------------
 
-/// Check if a command exists by running `which`.
+/// Locate an executable on `PATH`, like `which`, without spawning a process.
+///
+/// Names containing a `/` are checked as paths directly.
+pub fn find_in_path(name: &str) -> Option<std::path::PathBuf> {
+    use std::os::unix::fs::PermissionsExt;
+
+    let is_executable = |path: &std::path::Path| {
+        std::fs::metadata(path).is_ok_and(|m| m.is_file() && m.permissions().mode() & 0o111 != 0)
+    };
+
+    if name.contains('/') {
+        let path = std::path::PathBuf::from(name);
+        return is_executable(&path).then_some(path);
+    }
+
+    let paths = std::env::var_os("PATH")?;
+    std::env::split_paths(&paths)
+        .map(|dir| dir.join(name))
+        .find(|path| is_executable(path))
+}
+
+/// Check if a command exists on `PATH`.
 pub fn command_exists(name: &str) -> bool {
-    std::process::Command::new("which")
-        .arg(name)
-        .stdout(std::process::Stdio::null())
-        .stderr(std::process::Stdio::null())
-        .status()
-        .map(|s| s.success())
-        .unwrap_or(false)
+    find_in_path(name).is_some()
 }
 
 /// Execute a command and return its `Output` if it succeeds.
@@ -293,22 +308,19 @@ pub fn xor_fold_u64(v: u64) -> u8 {
 /// Requires at least 4 input timings to produce any output (2 deltas
 /// needed for the XOR mixing step).
 pub fn extract_timing_entropy(timings: &[u64], n_samples: usize) -> Vec<u8> {
-    if timings.len() < 2 {
-        return Vec::new();
-    }
-
-    let deltas: Vec<u64> = timings
-        .windows(2)
-        .map(|w| w[1].wrapping_sub(w[0]))
-        .collect();
-
-    // XOR consecutive deltas for mixing (not conditioning — just combines adjacent values)
-    let xored: Vec<u64> = deltas.windows(2).map(|w| w[0] ^ w[1]).collect();
-
-    // XOR-fold all 8 bytes of each value into one byte
-    let mut raw: Vec<u8> = xored.iter().map(|&x| xor_fold_u64(x)).collect();
-    raw.truncate(n_samples);
-    raw
+    // Single pass over sliding triples: each window yields two consecutive
+    // deltas, which are XORed for mixing (not conditioning — just combines
+    // adjacent values) and XOR-folded into one byte. No intermediate delta
+    // buffers are allocated.
+    timings
+        .windows(3)
+        .take(n_samples)
+        .map(|w| {
+            let d0 = w[1].wrapping_sub(w[0]);
+            let d1 = w[2].wrapping_sub(w[1]);
+            xor_fold_u64(d0 ^ d1)
+        })
+        .collect()
 }
 
 // ---------------------------------------------------------------------------
@@ -356,38 +368,45 @@ pub fn pack_nibbles(nibbles: impl Iterator<Item = u8>, max_bytes: usize) -> Vec<
 /// First emits raw LE bytes from all deltas, then XOR'd consecutive delta bytes
 /// if more output is needed. Returns at most `n_samples` bytes.
 pub fn extract_delta_bytes_i64(deltas: &[i64], n_samples: usize) -> Vec<u8> {
-    // XOR consecutive deltas for extra mixing
-    let xor_deltas: Vec<i64> = if deltas.len() >= 2 {
-        deltas.windows(2).map(|w| w[0] ^ w[1]).collect()
-    } else {
-        Vec::new()
-    };
-
-    let mut entropy = Vec::with_capacity(n_samples);
-
-    // First: raw LE bytes from all non-zero deltas
-    for d in deltas {
-        for &b in &d.to_le_bytes() {
-            entropy.push(b);
-        }
-        if entropy.len() >= n_samples {
-            entropy.truncate(n_samples);
-            return entropy;
-        }
-    }
+    // Both stages are streamed through one chain: the XOR'd deltas are only
+    // computed if the raw bytes run out, and no intermediate Vec is built.
+    let xor_deltas = deltas.windows(2).map(|w| w[0] ^ w[1]);
+    let available = (deltas.len() + deltas.len().saturating_sub(1)) * 8;
+
+    let mut entropy = Vec::with_capacity(n_samples.min(available));
+    entropy.extend(
+        deltas
+            .iter()
+            .copied()
+            .chain(xor_deltas)
+            .flat_map(i64::to_le_bytes)
+            .take(n_samples),
+    );
+    entropy
+}
 
-    // Then: XOR'd delta bytes for more mixing
-    for d in &xor_deltas {
-        for &b in &d.to_le_bytes() {
-            entropy.push(b);
-        }
-        if entropy.len() >= n_samples {
-            break;
-        }
-    }
+// ---------------------------------------------------------------------------
+// Scratch file fill (disk_io / nvme_latency pattern)
+// ---------------------------------------------------------------------------
 
-    entropy.truncate(n_samples);
-    entropy
+/// Write `len` bytes of LCG filler to `file` and flush it.
+///
+/// Read-latency sources need real, fully-written blocks to read back; the
+/// content itself is irrelevant, so a cheap LCG stands in for random data.
+/// Each LCG step fills a whole 8-byte word.
+pub fn write_lcg_fill(
+    file: &mut impl std::io::Write,
+    len: usize,
+    seed: u64,
+) -> std::io::Result<()> {
+    let mut fill = vec![0u8; len];
+    let mut lcg = seed;
+    for chunk in fill.chunks_mut(8) {
+        lcg = lcg.wrapping_mul(6364136223846793005).wrapping_add(1);
+        chunk.copy_from_slice(&lcg.to_le_bytes()[..chunk.len()]);
+    }
+    file.write_all(&fill)?;
+    file.flush()
 }
 
 #[cfg(test)]
@@ -462,23 +481,30 @@ mod tests {
     }
 
     // -----------------------------------------------------------------------
-    // pack_bits_into_bytes tests
+    // pack_bits_with tests
     // -----------------------------------------------------------------------
 
     #[test]
     fn pack_bits_empty() {
         let bits: Vec<u8> = vec![];
-        let bytes = pack_bits_into_bytes(&bits);
+        let bytes = pack_bits_with(&bits, |b| b);
         assert!(bytes.is_empty());
     }
 
     #[test]
     fn pack_bits_full_byte() {
         let bits = vec![1, 0, 1, 0, 1, 0, 1, 0];
-        let bytes = pack_bits_into_bytes(&bits);
+        let bytes = pack_bits_with(&bits, |b| b);
         assert_eq!(bytes, vec![0b10101010]);
     }
 
+    #[test]
+    fn pack_bits_partial_byte_fills_high_bits() {
+        let bits = vec![1, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1];
+        let bytes = pack_bits_with(&bits, |b| b);
+        assert_eq!(bytes, vec![0b11010000, 0b10100000]);
+    }
+
     // -----------------------------------------------------------------------
     // mach_time tests
     // -----------------------------------------------------------------------
@@ -637,6 +663,15 @@ mod tests {
         assert_eq!(result.len(), 5);
     }
 
+    #[test]
+    fn extract_timing_entropy_known_values() {
+        // deltas: 10, -5, 15 → XOR pairs: 10 ^ (-5), (-5) ^ 15, folded per byte
+        let timings = [100u64, 110, 105, 120];
+        let d = [10u64, 105u64.wrapping_sub(110), 15];
+        let expected = vec![xor_fold_u64(d[0] ^ d[1]), xor_fold_u64(d[1] ^ d[2])];
+        assert_eq!(extract_timing_entropy(&timings, 10), expected);
+    }
+
     #[test]
     fn extract_timing_entropy_constant_timings() {
         // Constant timings → all deltas are 0 → XOR of 0s = 0 → all zeros
@@ -699,4 +734,42 @@ mod tests {
     fn command_exists_false() {
         assert!(!command_exists("nonexistent_binary_xyz_12345"));
     }
+
+    // -----------------------------------------------------------------------
+    // Scratch file fill tests
+    // -----------------------------------------------------------------------
+
+    #[test]
+    fn write_lcg_fill_matches_lcg_stream() {
+        let mut out = Vec::new();
+        write_lcg_fill(&mut out, 20, 7).unwrap();
+        assert_eq!(out.len(), 20);
+
+        let mut lcg = 7u64;
+        let mut expected = Vec::new();
+        for _ in 0..3 {
+            lcg = lcg.wrapping_mul(6364136223846793005).wrapping_add(1);
+            expected.extend_from_slice(&lcg.to_le_bytes());
+        }
+        assert_eq!(out, expected[..20]);
+    }
+
+    // -----------------------------------------------------------------------
+    // Command lookup tests
+    // -----------------------------------------------------------------------
+
+    #[test]
+    fn find_in_path_locates_sh() {
+        let path = find_in_path("sh").expect("sh should be on PATH");
+        assert!(path.ends_with("sh"));
+        assert!(command_exists("sh"));
+        assert_eq!(find_in_path(path.to_str().unwrap()), Some(path));
+    }
+
+    #[test]
+    fn find_in_path_missing_command() {
+        assert!(find_in_path("openentropy-no-such-command").is_none());
+        assert!(!command_exists("openentropy-no-such-command"));
+        assert!(!command_exists("/nonexistent/openentropy"));
+    }
 }
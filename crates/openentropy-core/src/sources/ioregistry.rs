@@ -9,7 +9,7 @@ use std::time::Duration;
 
 use crate::source::{EntropySource, Platform, Requirement, SourceCategory, SourceInfo};
 
-use super::helpers::{extract_delta_bytes_i64, run_command};
+use super::helpers::{extract_delta_bytes_i64, run_command_raw};
 
 /// Path to the ioreg binary on macOS.
 const IOREG_PATH: &str = "/usr/sbin/ioreg";
@@ -38,32 +38,25 @@ static IOREGISTRY_INFO: SourceInfo = SourceInfo {
 /// Entropy source that mines the macOS IORegistry for hardware counter deltas.
 pub struct IORegistryEntropySource;
 
-/// Run `ioreg -l -w0` and parse lines matching `"key" = number` patterns into
-/// a HashMap of key -> value.
-fn snapshot_ioreg() -> Option<HashMap<String, i64>> {
-    let stdout = run_command(IOREG_PATH, &["-l", "-w0"])?;
-    let mut map = HashMap::new();
-
-    for line in stdout.lines() {
-        let trimmed = line.trim();
-        let trimmed = trimmed
-            .trim_start_matches('|')
-            .trim_start_matches('+')
-            .trim();
-
-        // Extract all "key"=number patterns from the line (covers both
-        // top-level `"key" = 123` and nested dict `"key"=123` formats).
-        extract_quoted_key_numbers(trimmed, &mut map);
-    }
+/// Run `ioreg -l -w0` and report every `"key" = number` pattern to `f`.
+///
+/// The dump is several megabytes, so it is scanned as raw bytes rather than
+/// decoded into a `String` first; only matched keys are checked as UTF-8.
+fn snapshot_ioreg(mut f: impl FnMut(&str, i64)) -> Option<()> {
+    let stdout = run_command_raw(IOREG_PATH, &["-l", "-w0"])?;
+
+    // Extract all "key"=number patterns (covers both top-level
+    // `"key" = 123` and nested dict `"key"=123` formats).
+    extract_quoted_key_numbers(&stdout, &mut f);
 
-    Some(map)
+    Some(())
 }
 
-/// Scan a string for all `"key"=number` or `"key" = number` patterns and
-/// insert them into the map. This handles both top-level ioreg properties
-/// and values nested inside `{...}` dictionaries on the same line.
-fn extract_quoted_key_numbers(s: &str, map: &mut HashMap<String, i64>) {
-    let bytes = s.as_bytes();
+/// Scan a buffer for all `"key"=number` or `"key" = number` patterns and
+/// pass each one to `f`. This handles both top-level ioreg properties and
+/// values nested inside `{...}` dictionaries on the same line. Keys never
+/// span a newline.
+fn extract_quoted_key_numbers(bytes: &[u8], f: &mut impl FnMut(&str, i64)) {
     let len = bytes.len();
     let mut i = 0;
 
@@ -77,14 +70,19 @@ fn extract_quoted_key_numbers(s: &str, map: &mut HashMap<String, i64>) {
         // Extract key between quotes
         let key_start = i + 1;
         let mut key_end = key_start;
-        while key_end < len && bytes[key_end] != b'"' {
+        while key_end < len && bytes[key_end] != b'"' && bytes[key_end] != b'\n' {
             key_end += 1;
         }
         if key_end >= len {
             break;
         }
+        if bytes[key_end] == b'\n' {
+            // Unterminated quote: resume on the next line.
+            i = key_end + 1;
+            continue;
+        }
 
-        let key = &s[key_start..key_end];
+        let key = &bytes[key_start..key_end];
         let mut j = key_end + 1;
 
         // Skip optional whitespace then expect '='
@@ -113,9 +111,12 @@ fn extract_quoted_key_numbers(s: &str, map: &mut HashMap<String, i64>) {
 
         if j > num_start
             && (j >= len || !bytes[j].is_ascii_alphanumeric())
-            && let Ok(v) = s[num_start..j].parse::<i64>()
+            && let Ok(key) = std::str::from_utf8(key)
+            && let Some(v) = std::str::from_utf8(&bytes[num_start..j])
+                .ok()
+                .and_then(|n| n.parse::<i64>().ok())
         {
-            map.insert(key.to_string(), v);
+            f(key, v);
         }
 
         i = j.max(key_end + 1);
@@ -132,43 +133,48 @@ impl EntropySource for IORegistryEntropySource {
     }
 
     fn collect(&self, n_samples: usize) -> Vec<u8> {
-        // Take NUM_SNAPSHOTS snapshots with delays between them.
-        let mut snapshots: Vec<HashMap<String, i64>> = Vec::with_capacity(NUM_SNAPSHOTS);
-
-        for i in 0..NUM_SNAPSHOTS {
-            if i > 0 {
+        // Take NUM_SNAPSHOTS snapshots with delays between them. Keys are
+        // interned from the first snapshot (a key missing from it can never
+        // be common to all); later snapshots only write values into a flat
+        // key-major table with NUM_SNAPSHOTS slots per key.
+        let mut index: HashMap<String, usize> = HashMap::new();
+        let mut samples: Vec<Option<i64>> = Vec::new();
+
+        for snap in 0..NUM_SNAPSHOTS {
+            if snap > 0 {
                 thread::sleep(SNAPSHOT_DELAY);
             }
-            match snapshot_ioreg() {
-                Some(snap) => snapshots.push(snap),
-                None => return Vec::new(),
+            let ok = snapshot_ioreg(|key, value| {
+                let k = match index.get(key) {
+                    Some(&k) => k,
+                    None if snap == 0 => {
+                        let k = index.len();
+                        index.insert(key.to_string(), k);
+                        samples.resize(samples.len() + NUM_SNAPSHOTS, None);
+                        k
+                    }
+                    None => return,
+                };
+                samples[k * NUM_SNAPSHOTS + snap] = Some(value);
+            });
+            if ok.is_none() {
+                return Vec::new();
             }
         }
 
-        if snapshots.len() < 2 {
-            return Vec::new();
-        }
-
-        // Find keys present in ALL snapshots.
-        let common_keys: Vec<String> = {
-            let first = &snapshots[0];
-            first
-                .keys()
-                .filter(|k| snapshots.iter().all(|snap| snap.contains_key(*k)))
-                .cloned()
-                .collect()
-        };
-
-        // For each common key, extract deltas across consecutive snapshots.
+        // For each key present in every snapshot, extract deltas across
+        // consecutive snapshots.
         let mut all_deltas: Vec<i64> = Vec::new();
-
-        for key in &common_keys {
-            for pair in snapshots.windows(2) {
-                let v1 = pair[0][key];
-                let v2 = pair[1][key];
-                let delta = v2.wrapping_sub(v1);
-                if delta != 0 {
-                    all_deltas.push(delta);
+        for values in samples.chunks_exact(NUM_SNAPSHOTS) {
+            if values.iter().any(Option::is_none) {
+                continue;
+            }
+            for pair in values.windows(2) {
+                if let [Some(v1), Some(v2)] = pair {
+                    let delta = v2.wrapping_sub(*v1);
+                    if delta != 0 {
+                        all_deltas.push(delta);
+                    }
                 }
             }
         }
@@ -199,6 +205,27 @@ mod tests {
         assert_eq!(bytes[0], 0xAA);
     }
 
+    #[test]
+    fn extract_quoted_key_numbers_formats() {
+        let mut found = Vec::new();
+        extract_quoted_key_numbers(
+            br#""IOPowerManagement" = {"CurrentPowerState"=2,"MaxPowerState"=-1}"#,
+            &mut |k: &str, v| found.push((k.to_string(), v)),
+        );
+        extract_quoted_key_numbers(
+            b"| \"Broken\n  \"Count\" = 42 \"Name\" = \"x\" \"Flags\" = 0x1f",
+            &mut |k, v| found.push((k.to_string(), v)),
+        );
+        assert_eq!(
+            found,
+            vec![
+                ("CurrentPowerState".to_string(), 2),
+                ("MaxPowerState".to_string(), -1),
+                ("Count".to_string(), 42),
+            ]
+        );
+    }
+
     #[test]
     #[cfg(target_os = "macos")]
     #[ignore] // Run with: cargo test -- --ignored
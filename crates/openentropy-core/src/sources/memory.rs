@@ -1,15 +1,18 @@
 //! MemoryTimingSource — DRAM allocation and access timing.
 //!
-//! Repeatedly allocates page-sized anonymous mmap regions, touches them,
-//! measures the timing, and extracts LSBs as entropy.
+//! Maps a fixed window of anonymous pages, times the first touch of each page
+//! (a fresh page fault per sample), releases the window between passes, and
+//! extracts LSBs as entropy.
 
 use std::ptr;
-use std::time::Instant;
 
 use crate::source::{EntropySource, Platform, SourceCategory, SourceInfo};
 
-/// Page size for mmap allocations (4 KB on most platforms).
-const PAGE_SIZE: usize = 4096;
+use super::helpers::mach_time;
+
+/// Pages in the reusable fault window. Memory use stays at `WINDOW_PAGES`
+/// times the system page size regardless of how many samples are requested.
+const WINDOW_PAGES: usize = 256;
 
 static MEMORY_TIMING_INFO: SourceInfo = SourceInfo {
     name: "memory_timing",
@@ -39,72 +42,116 @@ impl EntropySource for MemoryTimingSource {
     }
 
     fn collect(&self, n_samples: usize) -> Vec<u8> {
-        let mut output = Vec::with_capacity(n_samples);
-        let mut prev_ns: u64 = 0;
-
-        // Each iteration: mmap a page, touch it, munmap it, measure timing.
-        // We need n_samples + 1 iterations to get n_samples deltas.
-        let iterations = n_samples + 1;
-
-        for i in 0..iterations {
-            let t0 = Instant::now();
-
-            // SAFETY: mmap with MAP_ANONYMOUS|MAP_PRIVATE creates a private anonymous
-            // mapping. We check for MAP_FAILED before using the returned address.
-            let addr = unsafe {
-                libc::mmap(
-                    ptr::null_mut(),
-                    PAGE_SIZE,
-                    libc::PROT_READ | libc::PROT_WRITE,
-                    libc::MAP_ANONYMOUS | libc::MAP_PRIVATE,
-                    -1, // no file descriptor
-                    0,  // offset
-                )
-            };
-
-            if addr == libc::MAP_FAILED {
-                continue;
-            }
+        // One page touch per sample; n_samples + 1 touches give n_samples deltas.
+        let touches = n_samples + 1;
+        // Step by the real page size (16 KiB on Apple Silicon) so every touch
+        // lands on a page that has not been faulted in yet.
+        // SAFETY: sysconf(_SC_PAGESIZE) is always safe and returns the page size.
+        let page_size = unsafe { libc::sysconf(libc::_SC_PAGESIZE) as usize };
+        let len = WINDOW_PAGES * page_size;
+
+        // Map the window once. Each page is faulted in separately by its first
+        // touch below, so every sample times one page fault without an
+        // mmap/munmap pair inside the timed window.
+        // SAFETY: mmap with MAP_ANONYMOUS|MAP_PRIVATE creates a private anonymous
+        // mapping. We check for MAP_FAILED before using the returned address.
+        let addr = unsafe {
+            libc::mmap(
+                ptr::null_mut(),
+                len,
+                libc::PROT_READ | libc::PROT_WRITE,
+                libc::MAP_ANONYMOUS | libc::MAP_PRIVATE,
+                -1, // no file descriptor
+                0,  // offset
+            )
+        };
+        if addr == libc::MAP_FAILED {
+            return Vec::new();
+        }
+        // Keep the window on base pages so each touch is its own fault rather
+        // than one huge-page fault covering hundreds of samples.
+        // SAFETY: addr/len describe the mapping created above.
+        #[cfg(target_os = "linux")]
+        unsafe {
+            libc::madvise(addr, len, libc::MADV_NOHUGEPAGE);
+        }
+        let base = addr as *mut u8;
 
-            // SAFETY: addr is a valid mmap'd region of PAGE_SIZE bytes (checked
-            // != MAP_FAILED above). page.add(PAGE_SIZE - 1) is within the mapping.
-            // munmap at the end deallocates the region.
-            unsafe {
-                let page = addr as *mut u8;
-                // Write to first and last byte of the page to touch both ends.
-                ptr::write_volatile(page, 0xAA);
-                ptr::write_volatile(page.add(PAGE_SIZE - 1), 0x55);
-
-                // Read back to force a full round-trip.
-                let _v1 = ptr::read_volatile(page);
-                let _v2 = ptr::read_volatile(page.add(PAGE_SIZE - 1));
-
-                // Unmap immediately to keep memory usage bounded.
-                libc::munmap(addr, PAGE_SIZE);
+        let mut timings: Vec<u64> = Vec::with_capacity(touches);
+        while timings.len() < touches {
+            if !timings.is_empty() && !release_window(addr, len) {
+                break;
             }
-
-            let elapsed_ns = t0.elapsed().as_nanos() as u64;
-
-            if i > 0 {
-                // Delta between consecutive allocation timings.
-                let delta = elapsed_ns.wrapping_sub(prev_ns);
-                // XOR the low two bytes together for extra mixing, then take LSB.
-                let mixed = (delta as u8) ^ ((delta >> 8) as u8);
-                output.push(mixed);
-
-                if output.len() >= n_samples {
-                    break;
+            let pass = (touches - timings.len()).min(WINDOW_PAGES);
+            timings.extend((0..pass).map(|i| {
+                let t0 = mach_time();
+                // SAFETY: page i < WINDOW_PAGES lies within the `len`-byte
+                // mapping checked above, so both its first and last byte are
+                // in bounds.
+                unsafe {
+                    let page = base.add(i * page_size);
+                    // Write to first and last byte of the page to touch both ends.
+                    ptr::write_volatile(page, 0xAA);
+                    ptr::write_volatile(page.add(page_size - 1), 0x55);
+
+                    // Read back to force a full round-trip.
+                    let _v1 = ptr::read_volatile(page);
+                    let _v2 = ptr::read_volatile(page.add(page_size - 1));
                 }
-            }
+                mach_time().wrapping_sub(t0)
+            }));
+        }
 
-            prev_ns = elapsed_ns;
+        // SAFETY: addr/len describe the mapping created above; nothing
+        // references it past this point.
+        unsafe {
+            libc::munmap(addr, len);
         }
 
-        output.truncate(n_samples);
-        output
+        // Delta between consecutive fault timings; XOR the low two bytes
+        // together for extra mixing.
+        timings
+            .windows(2)
+            .map(|w| {
+                let delta = w[1].wrapping_sub(w[0]);
+                (delta as u8) ^ ((delta >> 8) as u8)
+            })
+            .collect()
     }
 }
 
+/// Return the window's pages to the kernel so the next pass faults each one
+/// in again. Returns `false` if the window could not be released.
+#[cfg(target_os = "linux")]
+fn release_window(addr: *mut libc::c_void, len: usize) -> bool {
+    // SAFETY: addr/len describe a live private anonymous mapping; after
+    // MADV_DONTNEED the next access to each page is a fresh zero-fill fault.
+    unsafe { libc::madvise(addr, len, libc::MADV_DONTNEED) == 0 }
+}
+
+/// Return the window's pages to the kernel so the next pass faults each one
+/// in again. Returns `false` if the window could not be released.
+///
+/// `MADV_DONTNEED`/`MADV_FREE` do not guarantee a re-fault outside Linux, so
+/// the window is replaced in place with a fresh anonymous mapping instead.
+#[cfg(not(target_os = "linux"))]
+fn release_window(addr: *mut libc::c_void, len: usize) -> bool {
+    // SAFETY: MAP_FIXED over our own live mapping atomically replaces it with
+    // fresh zero-fill pages at the same address; nothing holds references
+    // into the old pages.
+    let remapped = unsafe {
+        libc::mmap(
+            addr,
+            len,
+            libc::PROT_READ | libc::PROT_WRITE,
+            libc::MAP_ANONYMOUS | libc::MAP_PRIVATE | libc::MAP_FIXED,
+            -1,
+            0,
+        )
+    };
+    remapped == addr
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -120,6 +167,32 @@ mod tests {
         assert!(data.len() <= 128);
     }
 
+    #[test]
+    #[cfg(unix)]
+    fn release_window_discards_pages() {
+        // SAFETY: sysconf(_SC_PAGESIZE) is always safe and returns the page size.
+        let len = 2 * unsafe { libc::sysconf(libc::_SC_PAGESIZE) as usize };
+        // SAFETY: private anonymous mapping, checked against MAP_FAILED; all
+        // accesses stay within `len` and the mapping is unmapped at the end.
+        unsafe {
+            let addr = libc::mmap(
+                ptr::null_mut(),
+                len,
+                libc::PROT_READ | libc::PROT_WRITE,
+                libc::MAP_ANONYMOUS | libc::MAP_PRIVATE,
+                -1,
+                0,
+            );
+            assert_ne!(addr, libc::MAP_FAILED);
+            let page = addr as *mut u8;
+            ptr::write_volatile(page, 0xAA);
+            assert!(release_window(addr, len));
+            // A released page comes back zero-filled on its next fault.
+            assert_eq!(ptr::read_volatile(page), 0);
+            libc::munmap(addr, len);
+        }
+    }
+
     #[test]
     fn memory_timing_info() {
         let src = MemoryTimingSource;
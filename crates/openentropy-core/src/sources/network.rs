@@ -4,17 +4,43 @@
 //! times, which arise from queuing delays, congestion, server load, NIC
 //! interrupt coalescing, and electromagnetic propagation variations.
 
-use std::net::{SocketAddr, TcpStream, UdpSocket};
+use std::net::{Ipv4Addr, SocketAddr, TcpStream, UdpSocket};
+use std::sync::OnceLock;
 use std::sync::atomic::{AtomicUsize, Ordering};
 use std::time::{Duration, Instant};
 
 use crate::source::{EntropySource, Platform, SourceCategory, SourceInfo};
 
+use super::helpers::mach_time;
+
+// ---------------------------------------------------------------------------
+// RTT byte extraction (shared by DNS and TCP sources)
+// ---------------------------------------------------------------------------
+
+/// Append the entropy bytes derived from one RTT sample to `out` in a single
+/// contiguous write: the two least-significant (most jittery) bytes of the
+/// RTT, their XOR, and — when a previous sample exists — the two low bytes of
+/// the inter-sample delta.
+fn push_rtt_entropy(out: &mut Vec<u8>, nanos: u64, prev: Option<u64>) {
+    let [b0, b1, ..] = nanos.to_le_bytes();
+    match prev {
+        Some(prev) => {
+            let [d0, d1, ..] = nanos.abs_diff(prev).to_le_bytes();
+            out.extend_from_slice(&[b0, b1, b0 ^ b1, d0, d1]);
+        }
+        None => out.extend_from_slice(&[b0, b1, b0 ^ b1]),
+    }
+}
+
 // ---------------------------------------------------------------------------
 // DNS timing source
 // ---------------------------------------------------------------------------
 
-const DNS_SERVERS: &[&str] = &["8.8.8.8", "1.1.1.1", "9.9.9.9"];
+const DNS_SERVERS: &[Ipv4Addr] = &[
+    Ipv4Addr::new(8, 8, 8, 8),
+    Ipv4Addr::new(1, 1, 1, 1),
+    Ipv4Addr::new(9, 9, 9, 9),
+];
 const DNS_HOSTNAMES: &[&str] = &["example.com", "google.com", "github.com"];
 const DNS_PORT: u16 = 53;
 const DNS_TIMEOUT: Duration = Duration::from_secs(2);
@@ -88,24 +114,85 @@ fn build_dns_query(tx_id: u16, hostname: &str) -> Vec<u8> {
     pkt
 }
 
-/// Send a single DNS query and return the RTT in nanoseconds, or `None` on
-/// failure.
-fn dns_query_rtt(server: &str, hostname: &str, timeout: Duration) -> Option<u128> {
-    let addr: SocketAddr = format!("{}:{}", server, DNS_PORT).parse().ok()?;
-    let socket = UdpSocket::bind("0.0.0.0:0").ok()?;
-    socket.set_read_timeout(Some(timeout)).ok()?;
-    socket.set_write_timeout(Some(timeout)).ok()?;
+/// Query packets for each entry of [`DNS_HOSTNAMES`], built once with a zero
+/// transaction ID. Only the 2-byte ID differs between queries.
+fn dns_query_templates() -> &'static [Vec<u8>] {
+    static TEMPLATES: OnceLock<Vec<Vec<u8>>> = OnceLock::new();
+    TEMPLATES.get_or_init(|| {
+        DNS_HOSTNAMES
+            .iter()
+            .map(|h| build_dns_query(0, h))
+            .collect()
+    })
+}
 
-    // Use low 16 bits of current nanosecond timestamp as transaction ID.
-    let tx_id = (Instant::now().elapsed().as_nanos() & 0xFFFF) as u16;
-    let query = build_dns_query(tx_id, hostname);
+/// Queries per batch: every (server, hostname) pair once.
+const DNS_BATCH: usize = DNS_SERVERS.len() * DNS_HOSTNAMES.len();
 
-    let start = Instant::now();
-    socket.send_to(&query, addr).ok()?;
+/// Fire `count` DNS queries from a single UDP socket, starting at rotation
+/// index `start`, and return the RTT in nanoseconds of every query answered
+/// before `timeout` elapses, in send order.
+///
+/// All queries are in flight at once and responses are matched back to their
+/// query by transaction ID and source address, so a batch costs the slowest
+/// RTT rather than the sum of them.
+fn dns_batch_rtts(start: usize, count: usize, timeout: Duration) -> Vec<u64> {
+    let Ok(socket) = UdpSocket::bind("0.0.0.0:0") else {
+        return Vec::new();
+    };
+    if socket.set_write_timeout(Some(timeout)).is_err() {
+        return Vec::new();
+    }
 
+    // Low 16 bits of the high-resolution clock seed the transaction IDs;
+    // consecutive offsets keep them unique within the batch.
+    let base_id = mach_time() as u16;
+    let templates = dns_query_templates();
+    let mut pending: Vec<(SocketAddr, Instant, Option<u64>)> = Vec::with_capacity(count);
+    let mut query = [0u8; 512];
+
+    for i in 0..count {
+        let idx = start.wrapping_add(i);
+        let addr = SocketAddr::from((DNS_SERVERS[idx % DNS_SERVERS.len()], DNS_PORT));
+        let template = &templates[(idx / DNS_SERVERS.len()) % DNS_HOSTNAMES.len()];
+        let query = &mut query[..template.len()];
+        query.copy_from_slice(template);
+        query[..2].copy_from_slice(&base_id.wrapping_add(pending.len() as u16).to_be_bytes());
+
+        // The transaction ID doubles as the index into `pending`; a failed
+        // send leaves it free for the next query.
+        let sent = Instant::now();
+        if socket.send_to(query, addr).is_ok() {
+            pending.push((addr, sent, None));
+        }
+    }
+
+    let mut outstanding = pending.len();
+    let deadline = Instant::now() + timeout;
     let mut buf = [0u8; 512];
-    let _n = socket.recv_from(&mut buf).ok()?;
-    Some(start.elapsed().as_nanos())
+
+    while outstanding > 0 {
+        let remaining = deadline.saturating_duration_since(Instant::now());
+        if remaining.is_zero() || socket.set_read_timeout(Some(remaining)).is_err() {
+            break;
+        }
+        let Ok((n, from)) = socket.recv_from(&mut buf) else {
+            break;
+        };
+        let received = Instant::now();
+        if n < 2 {
+            continue;
+        }
+        let slot = u16::from_be_bytes([buf[0], buf[1]]).wrapping_sub(base_id) as usize;
+        if let Some((addr, sent, rtt @ None)) = pending.get_mut(slot)
+            && *addr == from
+        {
+            *rtt = Some(received.duration_since(*sent).as_nanos() as u64);
+            outstanding -= 1;
+        }
+    }
+
+    pending.into_iter().filter_map(|(_, _, rtt)| rtt).collect()
 }
 
 impl EntropySource for DNSTimingSource {
@@ -116,55 +203,21 @@ impl EntropySource for DNSTimingSource {
     fn is_available(&self) -> bool {
         // Try one query; if we get a response within the timeout the source is
         // usable.
-        dns_query_rtt(DNS_SERVERS[0], DNS_HOSTNAMES[0], DNS_TIMEOUT).is_some()
+        !dns_batch_rtts(0, 1, DNS_TIMEOUT).is_empty()
     }
 
     fn collect(&self, n_samples: usize) -> Vec<u8> {
         let mut entropy = Vec::with_capacity(n_samples);
-        let server_count = DNS_SERVERS.len();
-        let hostname_count = DNS_HOSTNAMES.len();
-
-        let mut prev_nanos: Option<u128> = None;
+        let mut prev_nanos: Option<u64> = None;
 
         while entropy.len() < n_samples {
-            let idx = self.index.fetch_add(1, Ordering::Relaxed);
-            let server = DNS_SERVERS[idx % server_count];
-            let hostname = DNS_HOSTNAMES[idx % hostname_count];
-
-            if let Some(nanos) = dns_query_rtt(server, hostname, DNS_TIMEOUT) {
-                // Extract least-significant bytes of the RTT (most jittery bits).
-                let nanos_bytes = nanos.to_le_bytes(); // 16 bytes (u128)
-
-                // LSB of the raw RTT
-                entropy.push(nanos_bytes[0]);
-                if entropy.len() >= n_samples {
-                    break;
-                }
-
-                // Second byte has some entropy too
-                entropy.push(nanos_bytes[1]);
-                if entropy.len() >= n_samples {
-                    break;
-                }
-
-                // XOR of byte 0 and byte 1 for mixing
-                entropy.push(nanos_bytes[0] ^ nanos_bytes[1]);
-                if entropy.len() >= n_samples {
-                    break;
-                }
-
-                // Timing delta from previous query (inter-query jitter)
-                if let Some(prev) = prev_nanos {
-                    let delta = nanos.abs_diff(prev);
-                    let delta_bytes = delta.to_le_bytes();
-                    entropy.push(delta_bytes[0]);
-                    if entropy.len() < n_samples {
-                        entropy.push(delta_bytes[1]);
-                    }
-                }
+            let idx = self.index.fetch_add(DNS_BATCH, Ordering::Relaxed);
+
+            // Unanswered queries are simply dropped from the batch.
+            for nanos in dns_batch_rtts(idx, DNS_BATCH, DNS_TIMEOUT) {
+                push_rtt_entropy(&mut entropy, nanos, prev_nanos);
                 prev_nanos = Some(nanos);
             }
-            // On failure, just move on to the next server/hostname pair.
         }
 
         entropy.truncate(n_samples);
@@ -219,11 +272,11 @@ impl Default for TCPConnectSource {
 }
 
 /// Attempt a TCP connect and return the handshake duration in nanoseconds.
-fn tcp_connect_rtt(target: &str, timeout: Duration) -> Option<u128> {
+fn tcp_connect_rtt(target: &str, timeout: Duration) -> Option<u64> {
     let addr: SocketAddr = target.parse().ok()?;
     let start = Instant::now();
     let _stream = TcpStream::connect_timeout(&addr, timeout).ok()?;
-    Some(start.elapsed().as_nanos())
+    Some(start.elapsed().as_nanos() as u64)
 }
 
 impl EntropySource for TCPConnectSource {
@@ -239,41 +292,14 @@ impl EntropySource for TCPConnectSource {
         let mut entropy = Vec::with_capacity(n_samples);
         let target_count = TCP_TARGETS.len();
 
-        let mut prev_nanos: Option<u128> = None;
+        let mut prev_nanos: Option<u64> = None;
 
         while entropy.len() < n_samples {
             let idx = self.index.fetch_add(1, Ordering::Relaxed);
             let target = TCP_TARGETS[idx % target_count];
 
             if let Some(nanos) = tcp_connect_rtt(target, TCP_TIMEOUT) {
-                let nanos_bytes = nanos.to_le_bytes();
-
-                // Least-significant bytes of the handshake RTT
-                entropy.push(nanos_bytes[0]);
-                if entropy.len() >= n_samples {
-                    break;
-                }
-
-                entropy.push(nanos_bytes[1]);
-                if entropy.len() >= n_samples {
-                    break;
-                }
-
-                // XOR mix
-                entropy.push(nanos_bytes[0] ^ nanos_bytes[1]);
-                if entropy.len() >= n_samples {
-                    break;
-                }
-
-                // Timing delta from previous handshake
-                if let Some(prev) = prev_nanos {
-                    let delta = nanos.abs_diff(prev);
-                    let delta_bytes = delta.to_le_bytes();
-                    entropy.push(delta_bytes[0]);
-                    if entropy.len() < n_samples {
-                        entropy.push(delta_bytes[1]);
-                    }
-                }
+                push_rtt_entropy(&mut entropy, nanos, prev_nanos);
                 prev_nanos = Some(nanos);
             }
         }
@@ -314,6 +340,26 @@ mod tests {
         assert_eq!(&pkt[len - 4..], &[0x00, 0x01, 0x00, 0x01]);
     }
 
+    #[test]
+    fn dns_query_templates_match_builder() {
+        let templates = dns_query_templates();
+        assert_eq!(templates.len(), DNS_HOSTNAMES.len());
+        for (template, host) in templates.iter().zip(DNS_HOSTNAMES) {
+            assert_eq!(template, &build_dns_query(0, host));
+        }
+    }
+
+    #[test]
+    fn rtt_entropy_layout() {
+        let mut out = Vec::new();
+        push_rtt_entropy(&mut out, 0x1234, None);
+        assert_eq!(out, vec![0x34, 0x12, 0x34 ^ 0x12]);
+
+        push_rtt_entropy(&mut out, 0x1300, Some(0x1234));
+        // delta = 0xCC
+        assert_eq!(&out[3..], &[0x00, 0x13, 0x13, 0xCC, 0x00]);
+    }
+
     #[test]
     fn dns_source_info() {
         let src = DNSTimingSource::new();
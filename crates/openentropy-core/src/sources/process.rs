@@ -4,11 +4,9 @@
 //! **Raw output characteristics:** Mix of timing LSBs and process table byte
 //! deltas.
 
-use std::time::Instant;
-
 use crate::source::{EntropySource, Platform, SourceCategory, SourceInfo};
 
-use super::helpers::run_command_raw;
+use super::helpers::{mach_time, run_command_raw};
 
 /// Number of getpid() calls to measure for timing jitter.
 const JITTER_ROUNDS: usize = 256;
@@ -47,31 +45,30 @@ impl Default for ProcessSource {
 }
 
 /// Collect timing jitter from repeated getpid() syscalls.
-/// Returns raw LSBs of nanosecond timing deltas.
+/// Returns raw LSBs of timing deltas in raw counter ticks.
+///
+/// Each call is bracketed with `mach_time()` (the raw hardware counter on
+/// macOS) rather than `Instant`, so the measured interval carries no clock
+/// conversion overhead of its own.
 fn collect_getpid_jitter(n_bytes: usize) -> Vec<u8> {
     let rounds = JITTER_ROUNDS.max(n_bytes * 2);
     let mut timings: Vec<u64> = Vec::with_capacity(rounds);
 
     for _ in 0..rounds {
-        let start = Instant::now();
+        let start = mach_time();
         // SAFETY: getpid() is always safe — it's a simple read-only syscall.
         unsafe {
             libc::getpid();
         }
-        let elapsed = start.elapsed().as_nanos() as u64;
-        timings.push(elapsed);
+        timings.push(mach_time().wrapping_sub(start));
     }
 
     // Extract LSBs of timing deltas
-    let mut raw = Vec::with_capacity(n_bytes);
-    for pair in timings.windows(2) {
-        let delta = pair[1].wrapping_sub(pair[0]);
-        raw.push(delta as u8);
-        if raw.len() >= n_bytes {
-            break;
-        }
-    }
-    raw
+    timings
+        .windows(2)
+        .take(n_bytes)
+        .map(|pair| pair[1].wrapping_sub(pair[0]) as u8)
+        .collect()
 }
 
 /// Run `ps -eo pid,pcpu,rss` and return its raw stdout bytes.
@@ -17,17 +17,96 @@ use super::helpers::{extract_timing_entropy, mach_time};
 /// each access depends on physical address mapping, row buffer state from all
 /// system activity, memory controller scheduling, and DRAM refresh
 /// interference.
+///
+/// Every other measurement uses a targeted row-conflict pattern instead: two
+/// addresses [`ROW_CONFLICT_STRIDE`] apart are flushed from the cache (with a
+/// barrier so the flushes complete first) and read back to back, so both
+/// reads go to DRAM. The virtual stride says nothing reliable about the
+/// physical bank mapping, but it makes a same-bank, different-row pair — which
+/// pays precharge + activate (tRP + tRCD) — more likely than random
+/// placement. Together with refresh and controller scheduling jitter this
+/// gives a wider timing distribution than a mix of cache hits and misses.
 pub struct DRAMRowBufferSource;
 
+/// Distance between the two virtual addresses of a row-conflict pair. Typical
+/// bank strides fall between 128 KiB and 2 MiB depending on the DIMM/LPDDR
+/// configuration. This is a heuristic only: virtual-to-physical translation
+/// decides the actual bank.
+const ROW_CONFLICT_STRIDE: usize = 256 * 1024;
+
+/// Number of random indices generated per refill of the DRAM index pool.
+const INDEX_BATCH: usize = 256;
+
+/// Cache line size used to align row-conflict addresses.
+const CACHE_LINE: usize = 64;
+
+/// Evict the cache line containing `ptr` so the next access goes to DRAM.
+///
+/// Uses `clflush` on x86_64 and `dc civac` on aarch64. On other targets this
+/// is a no-op and the row-conflict pattern degrades to plain cache misses.
+#[inline(always)]
+fn flush_cache_line(ptr: *const u8) {
+    #[cfg(target_arch = "x86_64")]
+    // SAFETY: clflush is available on every x86_64 CPU and only requires that
+    // `ptr` is a valid address, which callers guarantee.
+    unsafe {
+        std::arch::x86_64::_mm_clflush(ptr);
+    }
+
+    #[cfg(target_arch = "aarch64")]
+    // SAFETY: `dc civac` cleans and invalidates the line by virtual address
+    // and is permitted from EL0 on Linux and macOS. `ptr` is a valid address.
+    unsafe {
+        std::arch::asm!("dc civac, {}", in(reg) ptr, options(nostack, preserves_flags));
+    }
+
+    #[cfg(not(any(target_arch = "x86_64", target_arch = "aarch64")))]
+    let _ = ptr;
+}
+
+/// Wait until preceding cache flushes have completed and order them before
+/// any later load.
+///
+/// `clflush` is only ordered against later loads by `mfence`, and `dc civac`
+/// is only guaranteed complete after a `dsb`. Elsewhere this falls back to a
+/// sequentially consistent fence.
+#[inline(always)]
+fn flush_barrier() {
+    #[cfg(target_arch = "x86_64")]
+    // SAFETY: mfence is available on every x86_64 CPU and has no operands.
+    unsafe {
+        std::arch::x86_64::_mm_mfence();
+    }
+
+    #[cfg(target_arch = "aarch64")]
+    // SAFETY: `dsb ish` is a barrier with no operands, permitted at EL0.
+    unsafe {
+        std::arch::asm!("dsb ish", options(nostack, preserves_flags));
+    }
+
+    #[cfg(not(any(target_arch = "x86_64", target_arch = "aarch64")))]
+    std::sync::atomic::fence(std::sync::atomic::Ordering::SeqCst);
+}
+
+/// Pick a cache-line-aligned row-conflict pair `(i0, i1)` for a buffer of
+/// `buf_size` bytes, where `i1 = i0 + ROW_CONFLICT_STRIDE`.
+fn row_conflict_pair(seed: usize, buf_size: usize) -> (usize, usize) {
+    let span = buf_size - ROW_CONFLICT_STRIDE;
+    let i0 = (seed % span) & !(CACHE_LINE - 1);
+    (i0, i0 + ROW_CONFLICT_STRIDE)
+}
+
 static DRAM_ROW_BUFFER_INFO: SourceInfo = SourceInfo {
     name: "dram_row_buffer",
     description: "DRAM row buffer hit/miss timing from random memory accesses",
     physics: "Measures DRAM row buffer hit/miss timing by accessing different memory rows. \
               DRAM is organized into rows of capacitor cells. Accessing an open row (hit) \
               is fast; accessing a different row requires precharge + activate (miss), \
-              which is slower. The exact timing depends on: physical address mapping, \
-              row buffer state from ALL system activity, memory controller scheduling, \
-              and DRAM refresh interference.",
+              which is slower. Alternate measurements force row-buffer conflicts by \
+              reading two cache-flushed addresses one bank stride apart. The exact \
+              timing depends on: physical address mapping, row buffer state from ALL \
+              system activity, memory controller scheduling, and DRAM refresh \
+              interference.",
     category: SourceCategory::Timing,
     platform: Platform::Any,
     requirements: &[],
@@ -57,17 +136,56 @@ impl EntropySource for DRAMRowBufferSource {
             buffer[i] = i as u8;
         }
 
+        // Draw random indices in batches into one reused buffer rather than
+        // making a `random_range` call per access.
         let mut rng = rand::rng();
+        let mut index_pool = [0u64; INDEX_BATCH];
+        let mut pool_pos = INDEX_BATCH;
+        let mut next_index = || {
+            if pool_pos == INDEX_BATCH {
+                rng.fill(&mut index_pool[..]);
+                pool_pos = 0;
+            }
+            pool_pos += 1;
+            // BUF_SIZE is a power of two, so the modulo is unbiased.
+            (index_pool[pool_pos - 1] % BUF_SIZE as u64) as usize
+        };
         let mut timings = Vec::with_capacity(num_accesses);
 
-        for _ in 0..num_accesses {
+        for access in 0..num_accesses {
+            if access % 2 == 1 {
+                // Row-conflict pattern: a likely same-bank pair on different
+                // rows, both lines flushed (and the flushes fenced) so neither
+                // read is served from cache.
+                let (idx1, idx2) = row_conflict_pair(next_index(), BUF_SIZE);
+                let p1 = &buffer[idx1] as *const u8;
+                let p2 = &buffer[idx2] as *const u8;
+                flush_cache_line(p1);
+                flush_cache_line(p2);
+                flush_barrier();
+
+                let t0 = mach_time();
+                // SAFETY: p1 and p2 point into `buffer` (bounds-checked above).
+                // read_volatile prevents the compiler from eliding the accesses.
+                let _v1 = unsafe { std::ptr::read_volatile(p1) };
+                flush_cache_line(p1);
+                // Keep the p2 load from issuing alongside p1's.
+                flush_barrier();
+                let _v2 = unsafe { std::ptr::read_volatile(p2) };
+                flush_cache_line(p2);
+                let t1 = mach_time();
+
+                timings.push(t1.wrapping_sub(t0));
+                continue;
+            }
+
             // Access two distant random locations per measurement to amplify
             // row buffer miss timing variation.
-            let idx1 = rng.random_range(0..BUF_SIZE);
-            let idx2 = rng.random_range(0..BUF_SIZE);
+            let idx1 = next_index();
+            let idx2 = next_index();
 
             let t0 = mach_time();
-            // SAFETY: idx1 and idx2 are bounded by BUF_SIZE via random_range.
+            // SAFETY: idx1 and idx2 are bounded by BUF_SIZE via the modulo above.
             // read_volatile prevents the compiler from eliding the accesses.
             let _v1 = unsafe { std::ptr::read_volatile(&buffer[idx1]) };
             let _v2 = unsafe { std::ptr::read_volatile(&buffer[idx2]) };
@@ -424,6 +542,35 @@ mod tests {
         }
     }
 
+    #[test]
+    fn row_conflict_pair_in_bounds_and_aligned() {
+        const BUF_SIZE: usize = 32 * 1024 * 1024;
+        for seed in [0, 1, 63, 64, 12345, usize::MAX / 3, usize::MAX] {
+            let (i0, i1) = row_conflict_pair(seed, BUF_SIZE);
+            assert_eq!(i0 % CACHE_LINE, 0);
+            assert_eq!(i1 - i0, ROW_CONFLICT_STRIDE);
+            assert!(i1 < BUF_SIZE);
+        }
+    }
+
+    #[test]
+    fn flush_cache_line_is_safe_on_heap_memory() {
+        let buf = vec![0xA5u8; 4 * CACHE_LINE];
+        for i in (0..buf.len()).step_by(CACHE_LINE) {
+            flush_cache_line(&buf[i]);
+        }
+        assert!(buf.iter().all(|&b| b == 0xA5));
+    }
+
+    #[test]
+    fn flush_barrier_after_flushes_preserves_data() {
+        let buf = [0x5Au8; 2 * CACHE_LINE];
+        flush_cache_line(&buf[0]);
+        flush_cache_line(&buf[CACHE_LINE]);
+        flush_barrier();
+        assert!(buf.iter().all(|&b| b == 0x5A));
+    }
+
     #[test]
     fn source_info_categories() {
         assert_eq!(DRAMRowBufferSource.info().category, SourceCategory::Timing);
@@ -50,30 +50,32 @@ impl Default for SysctlSource {
     }
 }
 
-/// Run `sysctl -a` and parse every line that has a numeric value into a HashMap.
-///
-/// Handles both `key: value` (macOS) and `key = value` (Linux) formats.
-fn snapshot_sysctl() -> Option<HashMap<String, i64>> {
-    let stdout = run_command(SYSCTL_PATH, &["-a"])?;
-    let mut map = HashMap::new();
-
-    for line in stdout.lines() {
-        // Try "key: value" first (macOS style), then "key = value" (Linux style)
-        let (key, val_str) = if let Some(idx) = line.find(": ") {
-            (&line[..idx], line[idx + 2..].trim())
-        } else if let Some(idx) = line.find(" = ") {
-            (&line[..idx], line[idx + 3..].trim())
-        } else {
-            continue;
-        };
+/// Run `sysctl -a` and return its stdout.
+fn snapshot_sysctl() -> Option<String> {
+    run_command(SYSCTL_PATH, &["-a"])
+}
 
-        // Only keep entries whose value is a plain integer
-        if let Ok(v) = val_str.parse::<i64>() {
-            map.insert(key.to_string(), v);
+/// Parse `sysctl -a` output into `(key, value)` pairs in a single pass.
+///
+/// Handles both `key: value` (macOS) and `key = value` (Linux) formats. Each
+/// line is scanned once for the first `:` or `=` rather than searched twice
+/// for each separator. Only entries whose value is a plain integer are
+/// yielded; keys borrow from `stdout`.
+fn parse_sysctl_output(stdout: &str) -> impl Iterator<Item = (&str, i64)> {
+    stdout.lines().filter_map(|line| {
+        let idx = line.find([':', '='])?;
+        let bytes = line.as_bytes();
+        if bytes.get(idx + 1) != Some(&b' ') {
+            return None;
         }
-    }
-
-    Some(map)
+        let key = match bytes[idx] {
+            b':' => &line[..idx],
+            // "key = value": the key ends before the space preceding '='.
+            _ if idx > 0 && bytes[idx - 1] == b' ' => &line[..idx - 1],
+            _ => return None,
+        };
+        Some((key, line[idx + 2..].trim().parse::<i64>().ok()?))
+    })
 }
 
 impl EntropySource for SysctlSource {
@@ -86,29 +88,27 @@ impl EntropySource for SysctlSource {
     }
 
     fn collect(&self, n_samples: usize) -> Vec<u8> {
-        // Take two snapshots separated by a small delay
-        let snap1 = match snapshot_sysctl() {
-            Some(s) => s,
-            None => return Vec::new(),
+        // Take two snapshots separated by a small delay. Only the first is
+        // indexed; the second is streamed against it, so unchanged keys
+        // (the vast majority) are skipped without allocating anything.
+        let Some(out1) = snapshot_sysctl() else {
+            return Vec::new();
         };
+        let snap1: HashMap<&str, i64> = parse_sysctl_output(&out1).collect();
 
         thread::sleep(SNAPSHOT_DELAY);
 
-        let snap2 = match snapshot_sysctl() {
-            Some(s) => s,
-            None => return Vec::new(),
+        let Some(out2) = snapshot_sysctl() else {
+            return Vec::new();
         };
 
         // Find keys that changed between the two snapshots and compute deltas
-        let mut deltas: Vec<i64> = Vec::new();
-        for (key, v2) in &snap2 {
-            if let Some(v1) = snap1.get(key) {
-                let delta = v2.wrapping_sub(*v1);
-                if delta != 0 {
-                    deltas.push(delta);
-                }
-            }
-        }
+        let deltas: Vec<i64> = parse_sysctl_output(&out2)
+            .filter_map(|(key, v2)| {
+                let delta = v2.wrapping_sub(*snap1.get(key)?);
+                (delta != 0).then_some(delta)
+            })
+            .collect();
 
         extract_delta_bytes_i64(&deltas, n_samples)
     }
@@ -126,6 +126,22 @@ mod tests {
         assert!(!src.info().composite);
     }
 
+    #[test]
+    fn parse_sysctl_output_both_formats() {
+        let out = "kern.ostype: Darwin\n\
+                   kern.maxproc: 8000\n\
+                   vm.swappiness = 60\n\
+                   net.ipv4.tcp_rmem = 4096\t131072\t6291456\n\
+                   kern.clockrate: { hz = 100, tick = 10000 }\n\
+                   kernel.random.entropy_avail = -3\n\
+                   garbage line\n";
+        let map: HashMap<_, _> = parse_sysctl_output(out).collect();
+        assert_eq!(map.len(), 3);
+        assert_eq!(map["kern.maxproc"], 8000);
+        assert_eq!(map["vm.swappiness"], 60);
+        assert_eq!(map["kernel.random.entropy_avail"], -3);
+    }
+
     #[test]
     #[cfg(target_os = "macos")]
     #[ignore] // Requires sysctl binary
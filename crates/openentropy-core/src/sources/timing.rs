@@ -3,10 +3,12 @@
 //! **Raw output characteristics:** LSBs of timing deltas and clock differences.
 
 use std::thread;
-use std::time::{Duration, Instant, SystemTime};
+use std::time::{Duration, SystemTime};
 
 use crate::source::{EntropySource, Platform, SourceCategory, SourceInfo};
 
+use super::helpers::mach_time;
+
 // ---------------------------------------------------------------------------
 // ClockJitterSource
 // ---------------------------------------------------------------------------
@@ -43,23 +45,22 @@ impl EntropySource for ClockJitterSource {
     }
 
     fn collect(&self, n_samples: usize) -> Vec<u8> {
-        let mut output = Vec::with_capacity(n_samples);
-
-        for _ in 0..n_samples {
-            let mono = Instant::now();
-            let wall = SystemTime::now()
-                .duration_since(SystemTime::UNIX_EPOCH)
-                .unwrap_or_default();
-
-            let mono2 = Instant::now();
-            let mono_delta_ns = mono2.duration_since(mono).as_nanos() as u64;
-            let wall_ns = wall.as_nanos() as u64;
-
-            let delta = mono_delta_ns ^ wall_ns;
-            output.push(delta as u8);
-        }
-
-        output
+        // The monotonic side is read as the raw counter behind `Instant`,
+        // skipping two `Duration` constructions and a u128 conversion per
+        // sample. Only the wall clock's low byte is kept, and since 10^9 is a
+        // multiple of 256 that byte comes from the sub-second nanoseconds
+        // alone — no full u128 nanosecond count is needed.
+        (0..n_samples)
+            .map(|_| {
+                let mono = mach_time();
+                let wall = SystemTime::now()
+                    .duration_since(SystemTime::UNIX_EPOCH)
+                    .unwrap_or_default();
+                let mono_delta = mach_time().wrapping_sub(mono);
+
+                (mono_delta ^ u64::from(wall.subsec_nanos())) as u8
+            })
+            .collect()
     }
 }
 
@@ -67,8 +68,6 @@ impl EntropySource for ClockJitterSource {
 // MachTimingSource  (macOS only)
 // ---------------------------------------------------------------------------
 
-use super::helpers::mach_time;
-
 /// Reads the ARM system counter (`mach_absolute_time`) at sub-nanosecond
 /// resolution with variable micro-workloads between samples. Returns raw
 /// LSBs of timing deltas — no conditioning applied.
@@ -100,33 +99,26 @@ impl EntropySource for MachTimingSource {
 
     fn collect(&self, n_samples: usize) -> Vec<u8> {
         // Collect raw LSBs from mach_absolute_time with micro-workloads.
-        let raw_count = n_samples * 2 + 64;
-        let mut raw = Vec::with_capacity(n_samples);
-
-        for i in 0..raw_count {
-            let t0 = mach_time();
-
-            // Variable micro-workload to perturb pipeline state.
-            let iterations = (i % 7) + 1;
-            let mut sink: u64 = t0;
-            for _ in 0..iterations {
-                sink = sink.wrapping_mul(6364136223846793005).wrapping_add(1);
-            }
-            std::hint::black_box(sink);
-
-            let t1 = mach_time();
-            let delta = t1.wrapping_sub(t0);
-
-            // Raw LSB of the delta — unconditioned
-            raw.push(delta as u8);
-
-            if raw.len() >= n_samples {
-                break;
-            }
-        }
-
-        raw.truncate(n_samples);
-        raw
+        // Every iteration yields one byte, so the output is filled straight
+        // from an exact-size iterator.
+        (0..n_samples)
+            .map(|i| {
+                let t0 = mach_time();
+
+                // Variable micro-workload to perturb pipeline state.
+                let iterations = (i % 7) + 1;
+                let mut sink: u64 = t0;
+                for _ in 0..iterations {
+                    sink = sink.wrapping_mul(6364136223846793005).wrapping_add(1);
+                }
+                std::hint::black_box(sink);
+
+                let t1 = mach_time();
+
+                // Raw LSB of the delta — unconditioned
+                t1.wrapping_sub(t0) as u8
+            })
+            .collect()
     }
 }
 
@@ -166,29 +158,21 @@ impl EntropySource for SleepJitterSource {
         let oversample = n_samples * 2 + 64;
         let mut raw_timings = Vec::with_capacity(oversample);
 
+        // Read the raw counter around each sleep; `Instant::elapsed` adds a
+        // second clock read plus a u128 nanosecond conversion per sample,
+        // which is overhead of the same order as the jitter being measured.
         for _ in 0..oversample {
-            let before = Instant::now();
+            let before = mach_time();
             thread::sleep(Duration::ZERO);
-            let elapsed_ns = before.elapsed().as_nanos() as u64;
-            raw_timings.push(elapsed_ns);
-        }
-
-        // Compute deltas and XOR adjacent pairs
-        let deltas: Vec<u64> = raw_timings
-            .windows(2)
-            .map(|w| w[1].wrapping_sub(w[0]))
-            .collect();
-
-        let mut raw = Vec::with_capacity(n_samples);
-        for pair in deltas.windows(2) {
-            let xored = pair[0] ^ pair[1];
-            raw.push(xored as u8);
-            if raw.len() >= n_samples {
-                break;
-            }
+            raw_timings.push(mach_time().wrapping_sub(before));
         }
 
-        raw
+        // XOR adjacent deltas in one pass over the timings.
+        raw_timings
+            .windows(3)
+            .take(n_samples)
+            .map(|w| (w[1].wrapping_sub(w[0]) ^ w[2].wrapping_sub(w[1])) as u8)
+            .collect()
     }
 }
 
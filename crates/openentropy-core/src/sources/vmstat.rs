@@ -1,5 +1,9 @@
-//! VmstatSource — Runs macOS `vm_stat`, parses counter output, takes multiple
-//! snapshots, and extracts entropy from the deltas of changing counters.
+//! VmstatSource — Samples macOS `vm_stat` counters, takes multiple snapshots,
+//! and extracts entropy from the deltas of changing counters.
+//!
+//! On macOS the counters are read in-process with `host_statistics64` (the
+//! call `vm_stat` itself makes), so a collection does not spawn one process
+//! per round. Parsing `vm_stat` output remains as the fallback.
 
 use std::collections::HashMap;
 use std::thread;
@@ -7,7 +11,7 @@ use std::time::Duration;
 
 use crate::source::{EntropySource, Platform, SourceCategory, SourceInfo};
 
-use super::helpers::{extract_delta_bytes_i64, run_command};
+use super::helpers::{extract_delta_bytes_i64, find_in_path, run_command};
 
 /// Delay between consecutive vm_stat snapshots.
 const SNAPSHOT_DELAY: Duration = Duration::from_millis(50);
@@ -55,17 +59,11 @@ fn vm_stat_path() -> Option<String> {
         return Some(standard.to_string());
     }
 
-    // Fall back to searching PATH via `which`
-    let path = run_command("which", &["vm_stat"])?;
-    let path = path.trim().to_string();
-    if !path.is_empty() {
-        return Some(path);
-    }
-
-    None
+    // Fall back to searching PATH
+    find_in_path("vm_stat").map(|p| p.to_string_lossy().into_owned())
 }
 
-/// Run `vm_stat` and parse output into a map of counter names to values.
+/// Parse `vm_stat` output into `(counter, value)` pairs.
 ///
 /// vm_stat output looks like:
 /// ```text
@@ -75,28 +73,99 @@ fn vm_stat_path() -> Option<String> {
 /// ```
 ///
 /// We strip the trailing period and parse the integer.
-fn snapshot_vmstat(path: &str) -> Option<HashMap<String, i64>> {
-    let stdout = run_command(path, &[])?;
-    let mut map = HashMap::new();
-
-    for line in stdout.lines() {
+fn parse_vmstat(stdout: &str) -> impl Iterator<Item = (&str, i64)> {
+    stdout
+        .lines()
         // Skip the header line
-        if line.starts_with("Mach") || line.is_empty() {
-            continue;
-        }
-
-        // Lines look like: "Pages active:                             67890."
-        if let Some(colon_idx) = line.rfind(':') {
-            let key = line[..colon_idx].trim().to_string();
+        .filter(|line| !line.starts_with("Mach") && !line.is_empty())
+        .filter_map(|line| {
+            // Lines look like: "Pages active:                             67890."
+            let colon_idx = line.rfind(':')?;
+            let key = line[..colon_idx].trim();
             let val_str = line[colon_idx + 1..].trim().trim_end_matches('.');
+            Some((key, val_str.parse::<i64>().ok()?))
+        })
+}
+
+#[cfg(target_os = "macos")]
+unsafe extern "C" {
+    fn mach_host_self() -> u32;
+}
 
-            if let Ok(v) = val_str.parse::<i64>() {
-                map.insert(key, v);
+/// Read the kernel VM counters in-process, labelled with `vm_stat`'s names.
+#[cfg(target_os = "macos")]
+fn host_vm_counters() -> Option<[(&'static str, i64); 22]> {
+    // SAFETY: vm_statistics64 is a plain-old-data struct; all-zeros is valid.
+    let mut stats: libc::vm_statistics64 = unsafe { std::mem::zeroed() };
+    let mut count = libc::HOST_VM_INFO64_COUNT;
+    // SAFETY: `stats` is writable for HOST_VM_INFO64_COUNT integers and
+    // `count` tells the kernel its size. mach_host_self() is always valid.
+    let kr = unsafe {
+        libc::host_statistics64(
+            mach_host_self(),
+            libc::HOST_VM_INFO64,
+            (&mut stats as *mut libc::vm_statistics64).cast(),
+            &mut count,
+        )
+    };
+    if kr != 0 {
+        return None;
+    }
+    let s = stats;
+    Some([
+        // vm_stat reports free pages net of the speculative ones, which it
+        // lists separately on the next line.
+        (
+            "Pages free",
+            s.free_count as i64 - s.speculative_count as i64,
+        ),
+        ("Pages active", s.active_count as i64),
+        ("Pages inactive", s.inactive_count as i64),
+        ("Pages speculative", s.speculative_count as i64),
+        ("Pages throttled", s.throttled_count as i64),
+        ("Pages wired down", s.wire_count as i64),
+        ("Pages purgeable", s.purgeable_count as i64),
+        ("\"Translation faults\"", s.faults as i64),
+        ("Pages copy-on-write", s.cow_faults as i64),
+        ("Pages zero filled", s.zero_fill_count as i64),
+        ("Pages reactivated", s.reactivations as i64),
+        ("Pages purged", s.purges as i64),
+        ("File-backed pages", s.external_page_count as i64),
+        ("Anonymous pages", s.internal_page_count as i64),
+        (
+            "Pages stored in compressor",
+            s.total_uncompressed_pages_in_compressor as i64,
+        ),
+        (
+            "Pages occupied by compressor",
+            s.compressor_page_count as i64,
+        ),
+        ("Decompressions", s.decompressions as i64),
+        ("Compressions", s.compressions as i64),
+        ("Pageins", s.pageins as i64),
+        ("Pageouts", s.pageouts as i64),
+        ("Swapins", s.swapins as i64),
+        ("Swapouts", s.swapouts as i64),
+    ])
+}
+
+/// Non-zero deltas between consecutive rounds of each counter.
+///
+/// `samples` is counter-major: `NUM_ROUNDS` consecutive slots per counter,
+/// `None` where the counter was absent from that round.
+fn counter_deltas(samples: &[Option<i64>]) -> Vec<i64> {
+    let mut deltas = Vec::new();
+    for counter in samples.chunks_exact(NUM_ROUNDS) {
+        for pair in counter.windows(2) {
+            if let [Some(prev), Some(curr)] = pair {
+                let delta = curr.wrapping_sub(*prev);
+                if delta != 0 {
+                    deltas.push(delta);
+                }
             }
         }
     }
-
-    Some(map)
+    deltas
 }
 
 impl EntropySource for VmstatSource {
@@ -114,36 +183,47 @@ impl EntropySource for VmstatSource {
             None => return Vec::new(),
         };
 
-        // Take NUM_ROUNDS snapshots with delays between them
-        let mut snapshots: Vec<HashMap<String, i64>> = Vec::with_capacity(NUM_ROUNDS);
+        // Take NUM_ROUNDS snapshots with delays between them. Counter names
+        // are interned once; each round only writes values into a flat
+        // counter-major table instead of building a fresh map of owned keys.
+        let mut index: HashMap<String, usize> = HashMap::new();
+        let mut samples: Vec<Option<i64>> = Vec::new();
 
-        for i in 0..NUM_ROUNDS {
-            if i > 0 {
+        for round in 0..NUM_ROUNDS {
+            if round > 0 {
                 thread::sleep(SNAPSHOT_DELAY);
             }
-            match snapshot_vmstat(&path) {
-                Some(snap) => snapshots.push(snap),
-                None => return Vec::new(),
-            }
-        }
-
-        // Compute deltas between consecutive rounds
-        let mut all_deltas: Vec<i64> = Vec::new();
-
-        for pair in snapshots.windows(2) {
-            let prev = &pair[0];
-            let curr = &pair[1];
-
-            for (key, curr_val) in curr {
-                if let Some(prev_val) = prev.get(key) {
-                    let delta = curr_val.wrapping_sub(*prev_val);
-                    if delta != 0 {
-                        all_deltas.push(delta);
+            let mut record = |key: &str, value: i64| {
+                let k = match index.get(key) {
+                    Some(&k) => k,
+                    None => {
+                        let k = index.len();
+                        index.insert(key.to_string(), k);
+                        samples.resize(samples.len() + NUM_ROUNDS, None);
+                        k
                     }
+                };
+                samples[k * NUM_ROUNDS + round] = Some(value);
+            };
+
+            #[cfg(target_os = "macos")]
+            if let Some(counters) = host_vm_counters() {
+                for (key, value) in counters {
+                    record(key, value);
                 }
+                continue;
+            }
+
+            let Some(stdout) = run_command(&path, &[]) else {
+                return Vec::new();
+            };
+            for (key, value) in parse_vmstat(&stdout) {
+                record(key, value);
             }
         }
 
+        let all_deltas = counter_deltas(&samples);
+
         extract_delta_bytes_i64(&all_deltas, n_samples)
     }
 }
@@ -160,6 +240,26 @@ mod tests {
         assert!(!src.info().composite);
     }
 
+    #[test]
+    fn parse_vmstat_skips_header() {
+        let out = "Mach Virtual Memory Statistics: (page size of 16384 bytes)\n\
+                   Pages free:                               12345.\n\
+                   \"Translation faults\":                  67890.\n\
+                   Pages bogus:                              n/a\n";
+        let parsed: Vec<_> = parse_vmstat(out).collect();
+        assert_eq!(
+            parsed,
+            vec![("Pages free", 12345), ("\"Translation faults\"", 67890)]
+        );
+    }
+
+    #[test]
+    fn counter_deltas_skip_missing_rounds() {
+        let mut samples = vec![Some(10), Some(12), Some(12), Some(15)];
+        samples.extend([None, Some(5), Some(9), None]);
+        assert_eq!(counter_deltas(&samples), vec![2, 3, 4]);
+    }
+
     #[test]
     #[cfg(target_os = "macos")]
     #[ignore] // Requires vm_stat binary
@@ -11,6 +11,7 @@ use std::time::{Duration, Instant};
 
 use crate::source::{EntropySource, Platform, Requirement, SourceCategory, SourceInfo};
 
+/// Minimum spacing between the starts of consecutive measurements.
 const MEASUREMENT_DELAY: Duration = Duration::from_millis(10);
 const SAMPLES_PER_COLLECT: usize = 8;
 
@@ -205,27 +206,39 @@ fn parse_field_value(text: &str, field: &str) -> Option<i32> {
     None
 }
 
-/// Take a single RSSI/noise measurement using the best available method.
+/// How RSSI/noise is read.
+///
+/// Resolved once per collection so each sample spawns a single command
+/// instead of re-running the ipconfig → airport fallback chain every time.
+enum RssiMethod {
+    /// `ipconfig getsummary <device>` for the discovered Wi-Fi device.
+    Ipconfig(String),
+    /// The private-framework `airport -I` command.
+    Airport,
+}
+
+/// Pick the best working method: ipconfig if it reports RSSI for `device`,
+/// otherwise airport.
+fn resolve_method(device: Option<String>) -> RssiMethod {
+    match device {
+        Some(dev) if read_via_ipconfig(&dev).0.is_some() => RssiMethod::Ipconfig(dev),
+        _ => RssiMethod::Airport,
+    }
+}
+
+/// Take a single RSSI/noise measurement with the resolved method.
 /// Always returns timing even if RSSI reading fails (for timing entropy).
-fn measure_once(device: &Option<String>) -> WifiMeasurement {
+fn measure_once(method: &RssiMethod) -> WifiMeasurement {
     let start = Instant::now();
 
-    let result = if let Some(dev) = device {
-        let (ipconfig_result, elapsed1) = read_via_ipconfig(dev);
-        if let Some(vals) = ipconfig_result {
-            Some((vals, elapsed1))
-        } else {
-            let (airport_result, elapsed2) = read_via_airport();
-            airport_result.map(|vals| (vals, elapsed1 + elapsed2))
-        }
-    } else {
-        let (airport_result, elapsed) = read_via_airport();
-        airport_result.map(|vals| (vals, elapsed))
+    let (result, _) = match method {
+        RssiMethod::Ipconfig(dev) => read_via_ipconfig(dev),
+        RssiMethod::Airport => read_via_airport(),
     };
 
     let timing_nanos = start.elapsed().as_nanos();
     match result {
-        Some(((rssi, noise), _)) => WifiMeasurement {
+        Some((rssi, noise)) => WifiMeasurement {
             rssi,
             noise,
             timing_nanos,
@@ -247,15 +260,16 @@ impl EntropySource for WiFiRSSISource {
         if !cfg!(target_os = "macos") {
             return false;
         }
-        let device = discover_wifi_device();
-        let m = measure_once(&device);
-        // Available if we got a real RSSI (not the zero fallback)
-        m.rssi != 0 || m.noise != 0
+        // Resolving to ipconfig already proved it returns a real RSSI.
+        match resolve_method(discover_wifi_device()) {
+            RssiMethod::Ipconfig(_) => true,
+            RssiMethod::Airport => read_via_airport().0.is_some(),
+        }
     }
 
     fn collect(&self, n_samples: usize) -> Vec<u8> {
         let mut raw = Vec::with_capacity(n_samples * 4);
-        let device = discover_wifi_device();
+        let method = resolve_method(discover_wifi_device());
 
         let mut measurements = Vec::with_capacity(SAMPLES_PER_COLLECT);
 
@@ -266,36 +280,35 @@ impl EntropySource for WiFiRSSISource {
         for _ in 0..max_bursts {
             measurements.clear();
 
+            // Measurements are spaced start-to-start: the command itself
+            // counts toward the delay, so only the remainder is slept.
             for _ in 0..SAMPLES_PER_COLLECT {
-                let m = measure_once(&device);
-                measurements.push(m);
-                thread::sleep(MEASUREMENT_DELAY);
+                let next = Instant::now() + MEASUREMENT_DELAY;
+                measurements.push(measure_once(&method));
+                thread::sleep(next.saturating_duration_since(Instant::now()));
             }
 
-            for i in 0..measurements.len() {
-                let m = &measurements[i];
-
+            // Every value contributes its raw low bits by truncating cast;
+            // nothing is rescaled, so distinct readings stay distinct.
+            let mut prev: Option<&WifiMeasurement> = None;
+            for m in &measurements {
                 // Always extract timing entropy (works even on timeout)
-                let t_bytes = m.timing_nanos.to_le_bytes();
-                raw.push(t_bytes[0]);
-                raw.push(t_bytes[1]);
-                raw.push(t_bytes[2]);
-                raw.push(t_bytes[3]);
+                raw.extend_from_slice(&(m.timing_nanos as u32).to_le_bytes());
 
                 // Extract RSSI/noise if we got real values
                 if m.rssi != 0 || m.noise != 0 {
-                    raw.push(m.rssi as u8);
-                    raw.push(m.noise as u8);
+                    raw.extend_from_slice(&[m.rssi as u8, m.noise as u8]);
                 }
 
                 // Deltas from previous measurement
-                if i > 0 {
-                    let prev = &measurements[i - 1];
-                    raw.push((m.rssi.wrapping_sub(prev.rssi)) as u8);
-                    let timing_delta = m.timing_nanos.abs_diff(prev.timing_nanos);
-                    raw.push(timing_delta.to_le_bytes()[0]);
-                    raw.push((m.rssi ^ m.noise) as u8);
+                if let Some(prev) = prev {
+                    raw.extend_from_slice(&[
+                        m.rssi.wrapping_sub(prev.rssi) as u8,
+                        m.timing_nanos.abs_diff(prev.timing_nanos) as u8,
+                        (m.rssi ^ m.noise) as u8,
+                    ]);
                 }
+                prev = Some(m);
             }
 
             if raw.len() >= n_samples * 2 {
@@ -14,6 +14,8 @@ use std::path::Path;
 #[cfg(target_os = "macos")]
 use std::process::Stdio;
 #[cfg(target_os = "macos")]
+use std::sync::OnceLock;
+#[cfg(target_os = "macos")]
 use std::time::{Duration, Instant};
 use std::time::{SystemTime, UNIX_EPOCH};
 
@@ -291,30 +293,60 @@ fn read_sysctl(key: &str) -> Option<String> {
     run_command("sysctl", &["-n", key])
 }
 
+/// Sysctl values that are fixed for the life of the process, read once.
+///
+/// Returns `hw.tbfrequency`, `hw.cpufrequency`, `hw.memsize` and
+/// `kern.boottime`, so repeated snapshots do not respawn `sysctl` for them.
+/// Only successful reads are cached; a key that came back empty (a failed
+/// spawn, or an OID this machine does not have) is read again next time.
+#[cfg(target_os = "macos")]
+fn static_sysctls() -> [Option<&'static str>; 4] {
+    const KEYS: [&str; 4] = [
+        "hw.tbfrequency",
+        "hw.cpufrequency",
+        "hw.memsize",
+        "kern.boottime",
+    ];
+    static STATIC_SYSCTLS: [OnceLock<String>; 4] = [const { OnceLock::new() }; 4];
+
+    // Missing keys are read concurrently, one `sysctl -n` process per key, so
+    // wall time is bounded by the slowest read and one unknown OID cannot
+    // fail the rest.
+    std::thread::scope(|s| {
+        for (key, cell) in KEYS.into_iter().zip(&STATIC_SYSCTLS) {
+            if cell.get().is_none() {
+                s.spawn(move || {
+                    if let Some(value) = read_sysctl(key) {
+                        let _ = cell.set(value);
+                    }
+                });
+            }
+        }
+    });
+    STATIC_SYSCTLS
+        .each_ref()
+        .map(|cell| cell.get().map(String::as_str))
+}
+
 #[cfg(target_os = "macos")]
 fn parse_first_f64(s: &str) -> Option<f64> {
     s.split_whitespace().next()?.parse::<f64>().ok()
 }
 
+/// Size suffixes in order of increasing power of 1024 (`K` = 1024^1).
+#[cfg(target_os = "macos")]
+const SIZE_SUFFIXES: &[u8] = b"KMGTP";
+
 #[cfg(target_os = "macos")]
 fn parse_size_with_suffix(token: &str) -> Option<f64> {
-    let suffix = token.chars().last()?;
-    let (number, multiplier) = match suffix {
-        'K' | 'k' => (token.get(..token.len().saturating_sub(1))?, 1024.0),
-        'M' | 'm' => (token.get(..token.len().saturating_sub(1))?, 1024.0 * 1024.0),
-        'G' | 'g' => (
-            token.get(..token.len().saturating_sub(1))?,
-            1024.0 * 1024.0 * 1024.0,
-        ),
-        'T' | 't' => (
-            token.get(..token.len().saturating_sub(1))?,
-            1024.0 * 1024.0 * 1024.0 * 1024.0,
-        ),
-        'P' | 'p' => (
-            token.get(..token.len().saturating_sub(1))?,
-            1024.0 * 1024.0 * 1024.0 * 1024.0 * 1024.0,
-        ),
-        _ => (token, 1.0),
+    let power = token
+        .as_bytes()
+        .last()
+        .and_then(|s| SIZE_SUFFIXES.iter().position(|c| c.eq_ignore_ascii_case(s)));
+    let (number, multiplier) = match power {
+        // The suffix is ASCII, so slicing it off stays on a char boundary.
+        Some(p) => (&token[..token.len() - 1], 1024f64.powi(p as i32 + 1)),
+        None => (token, 1.0),
     };
     number.parse::<f64>().ok().map(|v| v * multiplier)
 }
@@ -415,18 +447,57 @@ fn collect_macos_uptime_metrics(out: &mut Vec<TelemetryMetric>) {
     }
 }
 
+/// Read an integer sysctl in-process via `sysctlbyname`.
+///
+/// Handles the 4- and 8-byte integer OIDs that `sysctl -n` would print as a
+/// bare number, without spawning a process per read.
+#[cfg(target_os = "macos")]
+fn sysctl_number(key: &str) -> Option<f64> {
+    let name = std::ffi::CString::new(key).ok()?;
+    let mut buf = [0u8; 8];
+    let mut len = buf.len();
+    // SAFETY: `name` is NUL-terminated, `buf` is writable for `len` bytes and
+    // `len` is updated by the kernel to the number of bytes written.
+    let rc = unsafe {
+        libc::sysctlbyname(
+            name.as_ptr(),
+            buf.as_mut_ptr().cast(),
+            &mut len,
+            std::ptr::null_mut(),
+            0,
+        )
+    };
+    if rc != 0 {
+        return None;
+    }
+    match len {
+        4 => Some(i32::from_ne_bytes(buf[..4].try_into().ok()?) as f64),
+        8 => Some(u64::from_ne_bytes(buf) as f64),
+        _ => None,
+    }
+}
+
 #[cfg(target_os = "macos")]
 fn collect_macos_sysctl_metrics(out: &mut Vec<TelemetryMetric>) {
-    if let Some(tb_hz) = read_sysctl("hw.tbfrequency").and_then(|s| parse_first_f64(&s)) {
+    let [tbfrequency, cpufrequency, memsize, boottime] = static_sysctls();
+    // Integer counters are read in-process; only the struct-valued
+    // `vm.swapusage` still goes through `sysctl -n` for its text form.
+    let activecpu = sysctl_number("hw.activecpu");
+    let num_tasks = sysctl_number("kern.num_tasks");
+    let num_threads = sysctl_number("kern.num_threads");
+    let pressure_level = sysctl_number("kern.memorystatus_vm_pressure_level");
+    let swapusage = read_sysctl("vm.swapusage");
+
+    if let Some(tb_hz) = tbfrequency.and_then(parse_first_f64) {
         push_metric(out, "frequency", "timebase_hz", tb_hz, "Hz", "sysctl");
     }
-    if let Some(cpu_hz) = read_sysctl("hw.cpufrequency").and_then(|s| parse_first_f64(&s)) {
+    if let Some(cpu_hz) = cpufrequency.and_then(parse_first_f64) {
         push_metric(out, "frequency", "cpu_hz", cpu_hz, "Hz", "sysctl");
     }
-    if let Some(total_bytes) = read_sysctl("hw.memsize").and_then(|s| parse_first_f64(&s)) {
+    if let Some(total_bytes) = memsize.and_then(parse_first_f64) {
         push_metric(out, "memory", "total_bytes", total_bytes, "bytes", "sysctl");
     }
-    if let Some(active_cpu) = read_sysctl("hw.activecpu").and_then(|s| parse_first_f64(&s)) {
+    if let Some(active_cpu) = activecpu {
         push_metric(
             out,
             "scheduling",
@@ -436,7 +507,7 @@ fn collect_macos_sysctl_metrics(out: &mut Vec<TelemetryMetric>) {
             "sysctl",
         );
     }
-    if let Some(num_tasks) = read_sysctl("kern.num_tasks").and_then(|s| parse_first_f64(&s)) {
+    if let Some(num_tasks) = num_tasks {
         push_metric(
             out,
             "scheduling",
@@ -446,7 +517,7 @@ fn collect_macos_sysctl_metrics(out: &mut Vec<TelemetryMetric>) {
             "sysctl",
         );
     }
-    if let Some(num_threads) = read_sysctl("kern.num_threads").and_then(|s| parse_first_f64(&s)) {
+    if let Some(num_threads) = num_threads {
         push_metric(
             out,
             "scheduling",
@@ -456,9 +527,7 @@ fn collect_macos_sysctl_metrics(out: &mut Vec<TelemetryMetric>) {
             "sysctl",
         );
     }
-    if let Some(pressure_level) =
-        read_sysctl("kern.memorystatus_vm_pressure_level").and_then(|s| parse_first_f64(&s))
-    {
+    if let Some(pressure_level) = pressure_level {
         push_metric(
             out,
             "pressure",
@@ -468,7 +537,7 @@ fn collect_macos_sysctl_metrics(out: &mut Vec<TelemetryMetric>) {
             "sysctl",
         );
     }
-    if let Some(boot_raw) = read_sysctl("kern.boottime")
+    if let Some(boot_raw) = boottime
         && let Some(sec_part) = boot_raw
             .split("sec =")
             .nth(1)
@@ -478,14 +547,14 @@ fn collect_macos_sysctl_metrics(out: &mut Vec<TelemetryMetric>) {
         let uptime = unix_secs_now().saturating_sub(sec_part) as f64;
         push_metric(out, "system", "uptime_seconds", uptime, "s", "sysctl");
     }
-    if let Some(swapusage) = read_sysctl("vm.swapusage") {
-        for (label, metric_name) in [
-            ("total", "swap_total_bytes"),
-            ("used", "swap_used_bytes"),
-            ("free", "swap_free_bytes"),
+    if let Some(swapusage) = swapusage {
+        for (pattern, metric_name) in [
+            ("total =", "swap_total_bytes"),
+            ("used =", "swap_used_bytes"),
+            ("free =", "swap_free_bytes"),
         ] {
             if let Some(value) = swapusage
-                .split(&format!("{label} ="))
+                .split(pattern)
                 .nth(1)
                 .and_then(|s| s.split_whitespace().next())
                 .and_then(parse_size_with_suffix)
@@ -1574,11 +1643,30 @@ fn collect_linux_hwmon_metrics(out: &mut Vec<TelemetryMetric>) {
 
 #[cfg(target_os = "macos")]
 fn collect_macos_metrics(out: &mut Vec<TelemetryMetric>) {
-    collect_macos_uptime_metrics(out);
-    collect_macos_sysctl_metrics(out);
-    collect_macos_cp_time_metrics(out);
-    collect_macos_vm_stat_metrics(out);
-    collect_macos_network_metrics(out);
+    // Each collector shells out to its own tool; run them concurrently so a
+    // snapshot costs the slowest command rather than the sum of all of them.
+    // Metrics are sorted afterwards, so completion order does not matter.
+    let collectors: [fn(&mut Vec<TelemetryMetric>); 5] = [
+        collect_macos_uptime_metrics,
+        collect_macos_sysctl_metrics,
+        collect_macos_cp_time_metrics,
+        collect_macos_vm_stat_metrics,
+        collect_macos_network_metrics,
+    ];
+    std::thread::scope(|s| {
+        let handles = collectors.map(|collect| {
+            s.spawn(move || {
+                let mut metrics = Vec::new();
+                collect(&mut metrics);
+                metrics
+            })
+        });
+        for handle in handles {
+            if let Ok(metrics) = handle.join() {
+                out.extend(metrics);
+            }
+        }
+    });
 }
 
 /// Capture a best-effort telemetry snapshot.
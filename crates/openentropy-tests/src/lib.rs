@@ -70,6 +70,41 @@ fn to_bits(data: &[u8]) -> Vec<u8> {
     bits
 }
 
+/// Partial sums of the ±1 random walk over `data`'s bits (MSB first per
+/// byte), produced on the fly without unpacking into a bit vector.
+fn random_walk(data: &[u8]) -> impl Iterator<Item = i64> + '_ {
+    let mut s: i64 = 0;
+    data.iter()
+        .flat_map(|&byte| (0..8).rev().map(move |shift| (byte >> shift) & 1))
+        .map(move |bit| {
+            s += if bit == 1 { 1 } else { -1 };
+            s
+        })
+}
+
+/// `Write` sink that only counts the bytes written to it.
+#[derive(Default)]
+struct ByteCounter(usize);
+
+impl Write for ByteCounter {
+    fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
+        self.0 += buf.len();
+        Ok(buf.len())
+    }
+
+    fn flush(&mut self) -> std::io::Result<()> {
+        Ok(())
+    }
+}
+
+/// Size of `data` after zlib compression at `level`. The encoder streams
+/// into a counter, so the compressed bytes are never buffered.
+fn compressed_len(data: &[u8], level: Compression) -> usize {
+    let mut encoder = ZlibEncoder::new(ByteCounter::default(), level);
+    encoder.write_all(data).unwrap();
+    encoder.finish().unwrap().0
+}
+
 /// Return a failing `TestResult` when data is too short.
 fn insufficient(name: &str, needed: usize, got: usize) -> TestResult {
     TestResult {
@@ -89,15 +124,13 @@ fn insufficient(name: &str, needed: usize, got: usize) -> TestResult {
 /// Test 1: Monobit frequency -- proportion of 1s vs 0s should be ~50%.
 pub fn monobit_frequency(data: &[u8]) -> TestResult {
     let name = "Monobit Frequency";
-    let bits = to_bits(data);
-    let n = bits.len();
+    let n = data.len() * 8;
     if n < 100 {
         return insufficient(name, 100, n);
     }
-    let s: i64 = bits
-        .iter()
-        .map(|&b| if b == 1 { 1i64 } else { -1i64 })
-        .sum();
+    // S = (#ones) - (#zeros), counted on the packed bytes.
+    let ones: u64 = data.iter().map(|b| b.count_ones() as u64).sum();
+    let s = 2 * ones as i64 - n as i64;
     let s_obs = (s as f64).abs() / (n as f64).sqrt();
     let p = erfc(s_obs / 2.0_f64.sqrt());
     TestResult {
@@ -114,19 +147,15 @@ pub fn monobit_frequency(data: &[u8]) -> TestResult {
 pub fn block_frequency(data: &[u8]) -> TestResult {
     let name = "Block Frequency";
     let block_size: usize = 128;
-    let bits = to_bits(data);
-    let n = bits.len();
+    let n = data.len() * 8;
     let num_blocks = n / block_size;
     if num_blocks < 10 {
         return insufficient(name, block_size * 10, n);
     }
     let mut chi2 = 0.0;
-    for i in 0..num_blocks {
-        let start = i * block_size;
-        let ones: usize = bits[start..start + block_size]
-            .iter()
-            .map(|&b| b as usize)
-            .sum();
+    // Blocks are whole bytes, so ones are counted directly on the input.
+    for block in data.chunks_exact(block_size / 8).take(num_blocks) {
+        let ones: usize = block.iter().map(|b| b.count_ones() as usize).sum();
         let proportion = ones as f64 / block_size as f64;
         chi2 += (proportion - 0.5) * (proportion - 0.5);
     }
@@ -646,10 +675,8 @@ pub fn compression_ratio(data: &[u8]) -> TestResult {
     if n < 32 {
         return insufficient(name, 32, n);
     }
-    let mut encoder = ZlibEncoder::new(Vec::new(), Compression::best());
-    encoder.write_all(data).unwrap();
-    let compressed = encoder.finish().unwrap();
-    let ratio = compressed.len() as f64 / n as f64;
+    let compressed = compressed_len(data, Compression::best());
+    let ratio = compressed as f64 / n as f64;
     let grade = if ratio > 0.95 {
         'A'
     } else if ratio > 0.85 {
@@ -666,7 +693,7 @@ pub fn compression_ratio(data: &[u8]) -> TestResult {
         passed: ratio > 0.85,
         p_value: None,
         statistic: ratio,
-        details: format!("{}/{n} = {ratio:.4}", compressed.len()),
+        details: format!("{compressed}/{n} = {ratio:.4}"),
         grade,
     }
 }
@@ -679,14 +706,12 @@ pub fn kolmogorov_complexity(data: &[u8]) -> TestResult {
         return insufficient(name, 32, n);
     }
 
-    let compress_at = |level: u32| -> usize {
-        let mut encoder = ZlibEncoder::new(Vec::new(), Compression::new(level));
-        encoder.write_all(data).unwrap();
-        encoder.finish().unwrap().len()
-    };
-
-    let c1 = compress_at(1);
-    let c9 = compress_at(9);
+    // The two compression levels are independent; run them side by side.
+    let (c1, c9) = std::thread::scope(|s| {
+        let fast = s.spawn(|| compressed_len(data, Compression::new(1)));
+        let c9 = compressed_len(data, Compression::new(9));
+        (fast.join().unwrap(), c9)
+    });
     let complexity = c9 as f64 / n as f64;
     let spread = (c1 as f64 - c9 as f64) / n as f64;
     let grade = if complexity > 0.95 {
@@ -1359,19 +1384,13 @@ pub fn linear_complexity(data: &[u8]) -> TestResult {
 /// Test 26: Cumulative sums (CUSUM) -- detect drift/bias.
 pub fn cusum_test(data: &[u8]) -> TestResult {
     let name = "Cumulative Sums";
-    let bits = to_bits(data);
-    let n = bits.len();
+    let n = data.len() * 8;
     if n < 100 {
         return insufficient(name, 100, n);
     }
 
-    let mut cumsum = Vec::with_capacity(n);
-    let mut s: i64 = 0;
-    for &bit in &bits {
-        s += if bit == 1 { 1 } else { -1 };
-        cumsum.push(s);
-    }
-    let z = cumsum.iter().map(|&x| x.unsigned_abs()).max().unwrap() as f64;
+    // Running maximum of |S| over the walk; the partial sums are never stored.
+    let z = random_walk(data).map(i64::unsigned_abs).max().unwrap() as f64;
     if z < 1e-10 {
         return TestResult {
             name: name.to_string(),
@@ -1407,33 +1426,14 @@ pub fn cusum_test(data: &[u8]) -> TestResult {
 /// Test 27: Random excursions -- cycles in cumulative sum random walk.
 pub fn random_excursions(data: &[u8]) -> TestResult {
     let name = "Random Excursions";
-    let bits = to_bits(data);
-    let n = bits.len();
+    let n = data.len() * 8;
     if n < 1000 {
         return insufficient(name, 1000, n);
     }
 
-    // Build cumulative sum with leading and trailing zeros
-    let mut cumsum = Vec::with_capacity(n + 2);
-    cumsum.push(0i64);
-    let mut s: i64 = 0;
-    for &bit in &bits {
-        s += if bit == 1 { 1 } else { -1 };
-        cumsum.push(s);
-    }
-    cumsum.push(0);
-
-    let zeros: Vec<usize> = cumsum
-        .iter()
-        .enumerate()
-        .filter_map(|(i, &v)| if v == 0 { Some(i) } else { None })
-        .collect();
-
-    let j = if !zeros.is_empty() {
-        zeros.len() - 1
-    } else {
-        0
-    };
+    // With the walk padded by a leading and trailing zero, the number of
+    // cycles is the count of interior returns to zero plus the final one.
+    let j = random_walk(data).filter(|&s| s == 0).count() + 1;
 
     if j < 500 {
         return TestResult {
@@ -1681,22 +1681,49 @@ pub fn run_all_tests(data: &[u8]) -> Vec<TestResult> {
         mean_variance,
     ];
 
-    tests
-        .iter()
-        .map(|test_fn| {
-            match std::panic::catch_unwind(std::panic::AssertUnwindSafe(|| test_fn(data))) {
-                Ok(result) => result,
-                Err(_) => TestResult {
-                    name: "Unknown".to_string(),
-                    passed: false,
-                    p_value: None,
-                    statistic: 0.0,
-                    details: "Test panicked".to_string(),
-                    grade: 'F',
-                },
-            }
-        })
-        .collect()
+    let run = |test_fn: fn(&[u8]) -> TestResult| match std::panic::catch_unwind(
+        std::panic::AssertUnwindSafe(|| test_fn(data)),
+    ) {
+        Ok(result) => result,
+        Err(_) => TestResult {
+            name: "Unknown".to_string(),
+            passed: false,
+            p_value: None,
+            statistic: 0.0,
+            details: "Test panicked".to_string(),
+            grade: 'F',
+        },
+    };
+
+    // The tests are independent, so scoped workers pull them from a shared
+    // index; wall time tracks the slowest tests rather than the sum. Results
+    // are put back in battery order.
+    let workers = std::thread::available_parallelism()
+        .map_or(1, |n| n.get())
+        .min(tests.len());
+    let next = std::sync::atomic::AtomicUsize::new(0);
+    let mut indexed: Vec<(usize, TestResult)> = std::thread::scope(|s| {
+        let handles: Vec<_> = (0..workers)
+            .map(|_| {
+                s.spawn(|| {
+                    let mut done = Vec::new();
+                    loop {
+                        let i = next.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                        let Some(&test_fn) = tests.get(i) else {
+                            break done;
+                        };
+                        done.push((i, run(test_fn)));
+                    }
+                })
+            })
+            .collect();
+        handles
+            .into_iter()
+            .flat_map(|h| h.join().unwrap_or_default())
+            .collect()
+    });
+    indexed.sort_unstable_by_key(|&(i, _)| i);
+    indexed.into_iter().map(|(_, result)| result).collect()
 }
 
 /// Calculate overall quality score (0-100) from test results.
@@ -1744,6 +1771,13 @@ mod tests {
         assert_eq!(bits, vec![1, 0, 1, 1, 0, 0, 0, 1]);
     }
 
+    #[test]
+    fn test_random_walk_partial_sums() {
+        let data = [0b10110001u8, 0xFF];
+        let walk: Vec<i64> = random_walk(&data).collect();
+        assert_eq!(walk, vec![1, 0, 1, 2, 1, 0, -1, 0, 1, 2, 3, 4, 5, 6, 7, 8]);
+    }
+
     #[test]
     fn test_grade_from_p() {
         assert_eq!(TestResult::grade_from_p(Some(0.5)), 'A');
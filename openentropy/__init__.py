@@ -5,31 +5,55 @@ Harvests entropy from unconventional hardware sources — clock jitter,
 kernel counters, memory timing, GPU scheduling, network latency, and more.
 
 This package requires the compiled Rust extension (built via maturin).
+The extension is loaded on first use of one of its symbols, so a bare
+``import openentropy`` stays cheap.
 """
 
 __author__ = "Amenti Labs"
 
-from openentropy.openentropy import (
-    EntropyPool,
-    detect_available_sources,
-    platform_info,
-    detect_machine_info,
-    run_all_tests,
-    calculate_quality_score,
-    condition,
-    min_entropy_estimate,
-    quick_min_entropy,
-    quick_shannon,
-    grade_min_entropy,
-    quick_quality,
-    version as _rust_version,
+__rust_backend__ = True
+
+# Symbols re-exported from the Rust extension, resolved on first access.
+_LAZY = frozenset(
+    {
+        "EntropyPool",
+        "detect_available_sources",
+        "platform_info",
+        "detect_machine_info",
+        "run_all_tests",
+        "calculate_quality_score",
+        "condition",
+        "min_entropy_estimate",
+        "quick_min_entropy",
+        "quick_shannon",
+        "grade_min_entropy",
+        "quick_quality",
+    }
 )
 
-__rust_backend__ = True
-__version__ = _rust_version()
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        from openentropy import openentropy as _rust
+
+        value = getattr(_rust, name)
+    elif name == "__version__":
+        # Always the extension's (Cargo workspace) version, not the dist
+        # metadata, which can lag behind it.
+        value = version()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
 
 def version() -> str:
+    from openentropy.openentropy import version as _rust_version
+
     return _rust_version()
 
 __all__ = [